@@ -1,7 +1,121 @@
-from typing import Generator, Iterable
+from typing import Generator, Iterable, Iterator, List, Optional
 
+import numpy as np
 from textgrid.textgrid import Interval, IntervalTier
 
+from textgrid_tools.compact_tier import (CompactIntervalTier, get_compact_tier_from_interval_tier,
+                                         get_interval)
+from textgrid_tools.helper import check_minTime_and_maxTime_are_valid, set_tier_validity
+
+# A copy of (a part of) a tier shares the storage of the intervals with the
+# copied tier as long as it is not changed: the intervals are stored read-only
+# in a `CompactIntervalTier` (which is created once for all copies of a tier)
+# and the copy creates its own intervals on the first access of `intervals`
+# (copy-on-write), which includes iterating and indexing the tier. Read-only
+# helpers (e.g. writing, validating or looking up boundaries) use `len` and
+# `iter_intervals` instead, which don't create the intervals of a shared copy.
+
+
+class CopyOnWriteIntervalTier(IntervalTier):
+  # IntervalTier.__init__ is not called because `intervals` is created on first access
+  # pylint: disable=super-init-not-called
+  def __init__(self, name: Optional[str], minTime: float, maxTime: float, shared: CompactIntervalTier, start: int, stop: int, offset: float = 0, ignore_marks: bool = False) -> None:
+    """
+    Contains the intervals shared[start:stop] moved by -offset.
+    """
+    assert 0 <= start <= stop <= len(shared)
+    self.name = name
+    self.minTime = minTime
+    self.maxTime = maxTime
+    self.strict = True
+    self.__shared: Optional[CompactIntervalTier] = shared
+    self.__start = start
+    self.__stop = stop
+    self.__offset = offset
+    self.__ignore_marks = ignore_marks
+    self.__intervals: Optional[List[Interval]] = None
+    set_tier_validity(self, self.__check_shared_is_valid())
+
+  @property
+  def is_shared(self) -> bool:
+    return self.__intervals is None
+
+  @property
+  def intervals(self) -> List[Interval]:
+    if self.__intervals is None:
+      self.__intervals = list(self.__get_shared_intervals(self.__start, self.__stop))
+      self.__shared = None
+    return self.__intervals
+
+  @intervals.setter
+  def intervals(self, intervals: List[Interval]) -> None:
+    self.__intervals = intervals
+    self.__shared = None
+
+  def __len__(self) -> int:
+    if self.__intervals is None:
+      return self.__stop - self.__start
+    return len(self.__intervals)
+
+  def iter_shared(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Interval]:
+    """
+    Iterates over the intervals [start:stop] without creating the intervals of
+    the tier if they are shared, i.e., changes to the returned intervals are
+    not reflected in the tier; see `iter_intervals`.
+    """
+    if self.__intervals is not None:
+      return iter(self.__intervals[start:stop])
+    positions = range(self.__start, self.__stop)[start:stop]
+    return self.__get_shared_intervals(positions.start, positions.stop)
+
+  def __repr__(self) -> str:
+    return f"CopyOnWriteIntervalTier({self.name}, {len(self)} intervals)"
+
+  def __get_shared_intervals(self, start: int, stop: int) -> Generator[Interval, None, None]:
+    shared = self.__shared
+    assert shared is not None
+    part = slice(start, stop)
+    starts = shared.starts[part]
+    ends = shared.ends[part]
+    if self.__offset != 0:
+      starts = starts - self.__offset
+      ends = ends - self.__offset
+    if self.__ignore_marks:
+      for start, end in zip(starts.tolist(), ends.tolist()):
+        yield get_interval(start, end, "")
+    else:
+      mark_table = shared.mark_table
+      for start, end, mark_index in zip(starts.tolist(), ends.tolist(), shared.mark_indices[part].tolist()):
+        yield get_interval(start, end, mark_table[mark_index])
+
+  def __check_shared_is_valid(self) -> bool:
+    """
+    Same as `is_tier_valid` but computed on the shared arrays.
+    """
+    if not check_minTime_and_maxTime_are_valid(self.minTime, self.maxTime):
+      return False
+    if self.__start == self.__stop:
+      return True
+    shared = self.__shared
+    part = slice(self.__start, self.__stop)
+    starts = shared.starts[part]
+    ends = shared.ends[part]
+    return bool(
+      starts[0] - self.__offset == self.minTime
+      and ends[-1] - self.__offset == self.maxTime
+      and np.all(starts < ends)
+      and np.all(starts[1:] == ends[:-1])
+    )
+
+
+def get_shared_tier(tier: IntervalTier) -> CompactIntervalTier:
+  """
+  Returns the storage which copies of the tier can share.
+  """
+  if isinstance(tier, CompactIntervalTier):
+    return tier
+  return get_compact_tier_from_interval_tier(tier)
+
 
 def copy_tiers(tiers: Iterable[IntervalTier], ignore_marks: bool) -> Generator[IntervalTier, None, None]:
   for tier in tiers:
@@ -9,15 +123,30 @@ def copy_tiers(tiers: Iterable[IntervalTier], ignore_marks: bool) -> Generator[I
 
 
 def copy_tier(tier: IntervalTier, ignore_marks: bool) -> IntervalTier:
-  result = IntervalTier(
-    name=tier.name,
-    maxTime=tier.maxTime,
-    minTime=tier.minTime,
-  )
+  """
+  Returns a copy-on-write copy of the tier; copying a `CompactIntervalTier`,
+  e.g., the result of `get_shared_tier`, doesn't copy its intervals at all.
+  """
+  shared = get_shared_tier(tier)
+  result = CopyOnWriteIntervalTier(
+    tier.name, tier.minTime, tier.maxTime, shared, 0, len(shared), ignore_marks=ignore_marks)
+  return result
 
-  intervals = copy_intervals(tier.intervals, ignore_marks)
-  result.intervals.extend(intervals)
 
+def copy_tier_part(shared: CompactIntervalTier, min_time: float, max_time: float) -> CopyOnWriteIntervalTier:
+  """
+  Returns a copy-on-write copy of the intervals of shared between min_time and
+  max_time; the intervals are moved to start at 0. min_time and max_time need
+  to be boundaries of shared.
+  """
+  start = int(np.searchsorted(shared.starts, min_time, "left"))
+  stop = int(np.searchsorted(shared.ends, max_time, "right"))
+  assert start < stop
+  assert shared.starts[start] == min_time
+  assert shared.ends[stop - 1] == max_time
+  offset = float(shared.starts[start])
+  result = CopyOnWriteIntervalTier(
+    shared.name, 0, float(shared.ends[stop - 1]) - offset, shared, start, stop, offset)
   return result
 
 
@@ -0,0 +1,199 @@
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+from textgrid import Interval, IntervalTier
+
+from textgrid_tools.helper import check_minTime_and_maxTime_are_valid, set_tier_validity
+
+# An interval tier that stores its intervals in contiguous arrays (start and
+# end times as float64 and an index into a table of the distinct marks)
+# instead of one Interval object per interval. It is intended for grids that
+# are only read, e.g., when all grids of a corpus are kept in memory. The
+# intervals are accessible through `intervals` which creates the Interval
+# objects on access, i.e., changes to them are not reflected in the tier. To
+# modify the tier, convert it with `to_interval_tier`.
+
+
+class CompactIntervals(Sequence[Interval]):
+  def __init__(self, tier: "CompactIntervalTier") -> None:
+    self.__tier = tier
+
+  def __len__(self) -> int:
+    return len(self.__tier.starts)
+
+  @overload
+  def __getitem__(self, index: int) -> Interval:
+    ...
+
+  @overload
+  def __getitem__(self, index: slice) -> List[Interval]:
+    ...
+
+  def __getitem__(self, index: Union[int, slice]) -> Union[Interval, List[Interval]]:
+    tier = self.__tier
+    if isinstance(index, slice):
+      return list(get_intervals(
+        tier.starts[index].tolist(),
+        tier.ends[index].tolist(),
+        tier.mark_indices[index].tolist(),
+        tier.mark_table,
+      ))
+    return get_interval(
+      float(tier.starts[index]),
+      float(tier.ends[index]),
+      tier.mark_table[tier.mark_indices[index]],
+    )
+
+  def __iter__(self) -> Iterator[Interval]:
+    tier = self.__tier
+    return get_intervals(
+      tier.starts.tolist(), tier.ends.tolist(), tier.mark_indices.tolist(), tier.mark_table)
+
+
+class CompactIntervalTier(IntervalTier):
+  # IntervalTier.__init__ is not called because `intervals` is read-only
+  # pylint: disable=super-init-not-called
+  def __init__(self, name: Optional[str], minTime: float, maxTime: float, starts: np.ndarray, ends: np.ndarray, mark_indices: np.ndarray, mark_table: "MarkTable") -> None:
+    assert len(starts) == len(ends) == len(mark_indices)
+    self.name = name
+    self.minTime = minTime
+    self.maxTime = maxTime
+    self.starts = starts
+    self.ends = ends
+    self.mark_indices = mark_indices
+    self.mark_table = mark_table
+    self.strict = True
+    set_tier_validity(self, check_compact_tier_is_valid(self))
+
+  @property
+  def intervals(self) -> CompactIntervals:
+    return CompactIntervals(self)
+
+  def __len__(self) -> int:
+    return len(self.starts)
+
+  def __iter__(self) -> Iterator[Interval]:
+    return iter(self.intervals)
+
+  def __getitem__(self, index: Union[int, slice]) -> Union[Interval, List[Interval]]:
+    return self.intervals[index]
+
+  def __repr__(self) -> str:
+    return f"CompactIntervalTier({self.name}, {len(self)} intervals)"
+
+  def to_interval_tier(self) -> IntervalTier:
+    result = IntervalTier(self.name, self.minTime, self.maxTime)
+    result.strict = self.strict
+    result.intervals.extend(self.intervals)
+    return result
+
+
+def get_interval(min_time: float, max_time: float, mark: str) -> Interval:
+  # bypasses the check of Interval.__init__, the times were already checked
+  result = Interval.__new__(Interval)
+  result.minTime = min_time
+  result.maxTime = max_time
+  result.mark = mark
+  result.strict = True
+  return result
+
+
+def get_intervals(starts: List[float], ends: List[float], mark_indices: List[int], mark_table: "MarkTable") -> Iterator[Interval]:
+  for start, end, mark_index in zip(starts, ends, mark_indices):
+    yield get_interval(start, end, mark_table[mark_index])
+
+
+def check_compact_tier_is_valid(tier: CompactIntervalTier) -> bool:
+  """
+  Same as `is_tier_valid` but computed on the arrays.
+  """
+  if not check_minTime_and_maxTime_are_valid(tier.minTime, tier.maxTime):
+    return False
+  if len(tier.starts) == 0:
+    return True
+  return bool(
+    tier.starts[0] == tier.minTime
+    and tier.ends[-1] == tier.maxTime
+    and np.all(tier.starts < tier.ends)
+    and np.all(tier.starts[1:] == tier.ends[:-1])
+  )
+
+
+class MarkTable():
+  """
+  Interned marks; one table can be shared by all tiers, e.g., of a corpus.
+  """
+
+  def __init__(self) -> None:
+    self.marks: List[str] = []
+    self.indices: Dict[str, int] = {}
+
+  def get_index(self, mark: str) -> int:
+    index = self.indices.get(mark)
+    if index is None:
+      index = len(self.marks)
+      self.indices[mark] = index
+      self.marks.append(mark)
+    return index
+
+  def intern(self, mark: str) -> str:
+    """
+    Returns the mark of the table that is equal to mark, i.e., all equal marks
+    are the same object.
+    """
+    return self.marks[self.get_index(mark)]
+
+  def __getitem__(self, index: int) -> str:
+    return self.marks[index]
+
+  def __len__(self) -> int:
+    return len(self.marks)
+
+
+def get_compact_tier(name: Optional[str], min_time: float, max_time: float, entries: Iterable[Tuple[float, float, str]], mark_table: Optional[MarkTable] = None) -> CompactIntervalTier:
+  """
+  Creates the tier out of (start, end, mark) entries which need to be sorted
+  and non-overlapping.
+  """
+  if mark_table is None:
+    mark_table = MarkTable()
+  starts: List[float] = []
+  ends: List[float] = []
+  mark_indices: List[int] = []
+  get_index = mark_table.get_index
+  for start, end, mark in entries:
+    starts.append(start)
+    ends.append(end)
+    mark_indices.append(get_index(mark))
+  return CompactIntervalTier(
+    name, min_time, max_time,
+    np.array(starts, dtype=np.float64),
+    np.array(ends, dtype=np.float64),
+    np.array(mark_indices, dtype=np.int32),
+    mark_table,
+  )
+
+
+def get_compact_tier_from_interval_tier(tier: IntervalTier, mark_table: Optional[MarkTable] = None) -> CompactIntervalTier:
+  entries = ((interval.minTime, interval.maxTime, interval.mark) for interval in tier.intervals)
+  result = get_compact_tier(tier.name, tier.minTime, tier.maxTime, entries, mark_table)
+  result.strict = tier.strict
+  return result
+
+
+def count_marks(tiers: Iterable[IntervalTier]) -> Counter:
+  """
+  Counts the marks of all intervals of the tiers; marks of compact tiers are
+  counted by their index in the mark table, i.e., without creating the
+  intervals.
+  """
+  result: Counter = Counter()
+  for tier in tiers:
+    if isinstance(tier, CompactIntervalTier):
+      counts = np.bincount(tier.mark_indices, minlength=len(tier.mark_table))
+      for mark_index in np.flatnonzero(counts).tolist():
+        result[tier.mark_table[mark_index]] += int(counts[mark_index])
+    else:
+      result.update(interval.mark for interval in tier.intervals)
+  return result
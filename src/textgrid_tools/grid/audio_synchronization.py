@@ -5,7 +5,8 @@ import numpy as np
 from textgrid import IntervalTier, TextGrid
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools.helper import check_is_valid_grid, samples_to_s
+from textgrid_tools.helper import (check_is_valid_grid, invalidate_tier, record_tier_change,
+                                   samples_to_s)
 from textgrid_tools.validation import InvalidGridError, ValidationError
 
 
@@ -93,6 +94,7 @@ def set_maxTime(grid: TextGrid, max_time: float) -> None:
 
 def set_maxTime_tier(tier: IntervalTier, max_time: float) -> bool:
   assert tier.minTime < max_time
+  invalidate_tier(tier)
   changed_anything = False
   if len(tier.intervals) > 0:
     last_interval = tier.intervals[-1]
@@ -103,6 +105,8 @@ def set_maxTime_tier(tier: IntervalTier, max_time: float) -> bool:
   if tier.maxTime != max_time:
     tier.maxTime = max_time
     changed_anything = True
+  if changed_anything:
+    record_tier_change(tier)
   return changed_anything
 
 
@@ -113,6 +117,7 @@ def set_minTime(grid: TextGrid, min_time: float) -> None:
   if grid.minTime == min_time:
     return
   for tier in grid.tiers:
+    invalidate_tier(tier)
     if len(tier.intervals) > 0:
       assert tier.intervals[0].maxTime < min_time
       tier.intervals[0].minTime = min_time
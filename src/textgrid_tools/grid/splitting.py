@@ -2,19 +2,24 @@ from logging import Logger, getLogger
 from typing import Iterable, List, Optional, Tuple, cast
 
 import numpy as np
-from textgrid.textgrid import Interval, IntervalTier, TextGrid
+from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.cloning import copy_intervals
+from textgrid_tools.cloning import copy_tier_part, get_shared_tier
+from textgrid_tools.compact_tier import CompactIntervalTier
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.grid.audio_synchronization import LastIntervalToShortError, set_end_to_audio_len
-from textgrid_tools.helper import (get_boundary_timepoints_from_tier, get_intervals_on_tier,
-                                   get_single_tier, interval_is_None_or_whitespace, s_to_samples)
+from textgrid_tools.helper import (get_boundary_timepoints_from_tier, get_single_tier,
+                                   interval_is_None_or_whitespace, s_to_samples)
 from textgrid_tools.validation import (AudioAndGridLengthMismatchError, BoundaryError,
                                        InternalError, InvalidGridError,
-                                       MultipleTiersWithThatNameError, NotExistingTierError)
+                                       MultipleTiersWithThatNameError, NotExistingTierError,
+                                       snap_boundaries_to_timepoints)
 
 
-def split_grid_on_intervals(grid: TextGrid, audio: Optional[np.ndarray], sample_rate: Optional[int], tier_name: str, include_empty_intervals: bool, logger: Optional[Logger]) -> Tuple[ExecutionResult, List[Tuple[TextGrid, Optional[np.ndarray]]]]:
+def split_grid_on_intervals(grid: TextGrid, audio: Optional[np.ndarray], sample_rate: Optional[int], tier_name: str, include_empty_intervals: bool, logger: Optional[Logger], boundary_epsilon: float = 0) -> Tuple[ExecutionResult, List[Tuple[TextGrid, Optional[np.ndarray]]]]:
+  """
+  boundary_epsilon: boundaries of the other tiers whose distance to a boundary of the tier is at most epsilon are moved onto it before splitting
+  """
   if logger is None:
     logger = getLogger(__name__)
 
@@ -34,21 +39,26 @@ def split_grid_on_intervals(grid: TextGrid, audio: Optional[np.ndarray], sample_
 
   tier = get_single_tier(grid, tier_name)
   timepoints = get_boundary_timepoints_from_tier(tier)
-  other_tiers = (
+  other_tiers = [
     grid_tier
     for grid_tier in grid.tiers
     if grid_tier != tier
-  )
+  ]
 
-  if error := BoundaryError.validate(timepoints, other_tiers):
+  if error := BoundaryError.validate(timepoints, other_tiers, boundary_epsilon):
     return (error, False), None
 
+  snap_boundaries_to_timepoints(timepoints, other_tiers, boundary_epsilon)
+
+  # the extracted grids share the storage of the intervals
+  shared_tiers = [get_shared_tier(grid_tier) for grid_tier in grid.tiers]
+
   result: List[Tuple[TextGrid, Optional[np.ndarray]]] = []
   for interval in cast(Iterable[Interval], tier.intervals):
     if not include_empty_intervals and interval_is_None_or_whitespace(interval):
       continue
 
-    extracted_grid = extract_grid(grid, interval)
+    extracted_grid = extract_grid(grid, interval, shared_tiers)
     extracted_audio = None
     if audio is not None:
       extracted_audio = extract_audio(audio, sample_rate, interval)
@@ -71,7 +81,10 @@ def split_grid_on_intervals(grid: TextGrid, audio: Optional[np.ndarray], sample_
   return (None, True), result
 
 
-def extract_grid(grid: TextGrid, interval: Interval) -> TextGrid:
+def extract_grid(grid: TextGrid, interval: Interval, shared_tiers: Optional[List[CompactIntervalTier]] = None) -> TextGrid:
+  """
+  shared_tiers: the result of `get_shared_tier` for each tier of the grid
+  """
   assert len(grid.tiers) > 0
   extracted_grid = TextGrid(
     name=grid.name,
@@ -79,25 +92,12 @@ def extract_grid(grid: TextGrid, interval: Interval) -> TextGrid:
     maxTime=0,
   )
 
-  for grids_tier in cast(Iterable[IntervalTier], grid.tiers):
-    grids_tier_intervals = get_intervals_on_tier(interval, grids_tier)
-    grids_tier_intervals = list(copy_intervals(grids_tier_intervals, False))
-
-    min_time_first_interval = grids_tier_intervals[0].minTime
-    for grids_tier_interval in grids_tier_intervals:
-      grids_tier_interval.minTime = grids_tier_interval.minTime - min_time_first_interval
-      # grids_tier_interval.minTime = round(grids_tier_interval.minTime - min_time_first_interval, n_digits)
-      grids_tier_interval.maxTime = grids_tier_interval.maxTime - min_time_first_interval
-      # grids_tier_interval.maxTime = round(grids_tier_interval.maxTime - min_time_first_interval, n_digits)
-    # assert no time between intervals
-    max_time = grids_tier_intervals[-1].maxTime
-    #max_time = round(grids_tier_intervals[-1].maxTime, n_digits)
-    grids_tier_excerpt = IntervalTier(
-      grids_tier.name,
-      minTime=0,
-      maxTime=max_time,
-    )
-    grids_tier_excerpt.intervals.extend(grids_tier_intervals)
+  if shared_tiers is None:
+    shared_tiers = [get_shared_tier(grids_tier) for grids_tier in grid.tiers]
+  assert len(shared_tiers) == len(grid.tiers)
+
+  for shared_tier in shared_tiers:
+    grids_tier_excerpt = copy_tier_part(shared_tier, interval.minTime, interval.maxTime)
     extracted_grid.tiers.append(grids_tier_excerpt)
 
   extracted_grid.maxTime = extracted_grid.tiers[0].maxTime
@@ -5,10 +5,11 @@ from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
 from pronunciation_dictionary import PronunciationDict
 from textgrid import Interval, TextGrid
 
-from textgrid_tools.helper import (get_boundary_timepoints_from_intervals, get_interval_readable,
-                                   get_intervals_on_tier, get_single_tier, ignore_intervals_by_mark)
+from textgrid_tools.helper import (align_intervals, get_boundary_timepoints_from_intervals,
+                                   get_interval_readable, get_single_tier, ignore_intervals_by_mark)
 from textgrid_tools.validation import (BoundaryError, InvalidGridError, NonDistinctTiersError,
-                                       NotExistingTierError, ValidationError)
+                                       NotExistingTierError, ValidationError,
+                                       snap_boundaries_to_timepoints)
 
 
 class IntervalContainsSpaceError(ValidationError):
@@ -27,7 +28,10 @@ class IntervalContainsSpaceError(ValidationError):
     return f"Interval contains space!\n{get_interval_readable(self.interval)}"
 
 
-def create_dictionaries(grids: Dict[str, List[TextGrid]], words_tier_name: str, pronunciations_tier_name: str, scope: Optional[Literal["folder", "all"]], ignore_marks: Set[str], logger: Optional[Logger]) -> Tuple[Optional[ValidationError], Union[PronunciationDict, Dict[str, PronunciationDict]]]:
+def create_dictionaries(grids: Dict[str, List[TextGrid]], words_tier_name: str, pronunciations_tier_name: str, scope: Optional[Literal["folder", "all"]], ignore_marks: Set[str], logger: Optional[Logger], boundary_epsilon: float = 0) -> Tuple[Optional[ValidationError], Union[PronunciationDict, Dict[str, PronunciationDict]]]:
+  """
+  boundary_epsilon: boundaries of the pronunciations tier whose distance to a boundary of the words tier is at most epsilon are moved onto it
+  """
   if logger is None:
     logger = getLogger(__name__)
   speakers_pronunciations: Dict[str, List[Tuple[str, Tuple[str, ...]]]] = {}
@@ -51,15 +55,19 @@ def create_dictionaries(grids: Dict[str, List[TextGrid]], words_tier_name: str,
       pronunciation_tier = get_single_tier(grid, pronunciations_tier_name)
 
       words_tier_timepoints = get_boundary_timepoints_from_intervals(words_tier_intervals)
-      if error := BoundaryError.validate(words_tier_timepoints, [pronunciation_tier]):
+      if error := BoundaryError.validate(words_tier_timepoints, [pronunciation_tier], boundary_epsilon):
         return error, False
 
-      for word_interval in words_tier_intervals:
+      snap_boundaries_to_timepoints(words_tier_timepoints, [pronunciation_tier], boundary_epsilon)
+
+      aligned_intervals = align_intervals(words_tier_intervals, [pronunciation_tier])
+      for word_interval, (pronunciation_intervals,) in aligned_intervals:
         if error := IntervalContainsSpaceError.validate(word_interval):
           return error, False
 
         word = word_interval.mark
-        pronunciation_intervals = get_intervals_on_tier(word_interval, pronunciation_tier)
+        # the boundaries were validated, i.e., they are the same as of word_interval
+        assert len(pronunciation_intervals) > 0
         for interval in pronunciation_intervals:
           if error := IntervalContainsSpaceError.validate(interval):
             return error, False
@@ -3,16 +3,19 @@ from logging import Logger, getLogger
 from typing import Dict, Generator, Iterable, List, Literal, Optional, Set, Tuple
 
 import numpy as np
-from textgrid import Interval, TextGrid
+from textgrid import Interval, IntervalTier, TextGrid
 
 from textgrid_tools.globals import ChangedAnything
-from textgrid_tools.helper import (get_boundary_timepoints_from_tier, get_interval_on_tier,
+from textgrid_tools.helper import (align_intervals_on_tier, get_boundary_timepoints_from_tier,
                                    get_single_tier)
 from textgrid_tools.validation import (BoundaryError, InvalidGridError, NotExistingTierError,
-                                       ValidationError)
+                                       ValidationError, snap_boundaries_to_timepoints)
 
 
-def label_durations(grids: Dict[str, List[TextGrid]], tier_name: str, assign_tier_name: str, assign_mark: str, scope: Optional[Literal["file", "folder", "all"]], only_consider_marks: Set[str], range_mode: Literal["percent", "percentile", "absolute"], marks_mode: Literal["separate", "all"], range_min: float, range_max: float, min_count: int, logger: Optional[Logger]) -> Tuple[Optional[ValidationError], Dict[str, List[ChangedAnything]]]:
+def label_durations(grids: Dict[str, List[TextGrid]], tier_name: str, assign_tier_name: str, assign_mark: str, scope: Optional[Literal["file", "folder", "all"]], only_consider_marks: Set[str], range_mode: Literal["percent", "percentile", "absolute"], marks_mode: Literal["separate", "all"], range_min: float, range_max: float, min_count: int, logger: Optional[Logger], boundary_epsilon: float = 0) -> Tuple[Optional[ValidationError], Dict[str, List[ChangedAnything]]]:
+  """
+  boundary_epsilon: boundaries of both tiers whose distance to a boundary of the other tier is at most epsilon are moved onto it
+  """
   if logger is None:
     logger = getLogger(__name__)
 
@@ -33,12 +36,26 @@ def label_durations(grids: Dict[str, List[TextGrid]], tier_name: str, assign_tie
         tier = get_single_tier(grid, tier_name)
         tier_timepoints = get_boundary_timepoints_from_tier(tier)
 
-        if error := BoundaryError.validate(boundary_tier_timepoints, [tier]):
+        if error := BoundaryError.validate(boundary_tier_timepoints, [tier], boundary_epsilon):
           return error, False
 
-        if error := BoundaryError.validate(tier_timepoints, [boundary_tier]):
+        if error := BoundaryError.validate(tier_timepoints, [boundary_tier], boundary_epsilon):
           return error, False
 
+  grids_snapped: Dict[str, List[ChangedAnything]] = {}
+  for speaker_name, speaker_grids in grids.items():
+    grids_snapped[speaker_name] = []
+    for grid in speaker_grids:
+      snapped = False
+      if tier_name != assign_tier_name:
+        boundary_tier = get_single_tier(grid, assign_tier_name)
+        tier = get_single_tier(grid, tier_name)
+        snapped = snap_boundaries_to_timepoints(
+          get_boundary_timepoints_from_tier(boundary_tier), [tier], boundary_epsilon)
+        snapped |= snap_boundaries_to_timepoints(
+          get_boundary_timepoints_from_tier(tier), [boundary_tier], boundary_epsilon)
+      grids_snapped[speaker_name].append(snapped)
+
   grids_c = {}
   total_intervals_sum = 0
   considered_intervals_sum = 0
@@ -108,11 +125,16 @@ def label_durations(grids: Dict[str, List[TextGrid]], tier_name: str, assign_tie
           count_matching_intervals_sum += count_matching_intervals
           duration_matching_intervals_sum += duration_matching_intervals
           changed_intervals_sum += changed_intervals
-          grids_c[speaker_name] = changes
     else:
       assert False
       raise NotImplementedError()
 
+  for speaker_name, snapped in grids_snapped.items():
+    grids_c[speaker_name] = [
+      changed or grid_snapped
+      for changed, grid_snapped in zip(grids_c.get(speaker_name, []), snapped)
+    ]
+
   logger.info(
     f"{considered_intervals_sum} of {total_intervals_sum} intervals are considered (due to mark restrictions).")
   if range_mode != "absolute":
@@ -143,10 +165,7 @@ def label_durations_core_absolute(grids: List[TextGrid], tier_name: str, assign_
     considered_intervals += len(intervals)
     intervals = list(filter_intervals_by_duration(intervals, range_min, range_max))
     matching_intervals += len(intervals)
-    for interval in intervals:
-      assign_interval = interval
-      if assign_tier != tier:
-        assign_interval = get_interval_on_tier(interval, assign_tier)
+    for assign_interval in get_assign_intervals(intervals, assign_tier, assign_tier == tier):
       if assign_interval.mark != assign_mark:
         assign_interval.mark = assign_mark
         changed_anything = True
@@ -155,6 +174,15 @@ def label_durations_core_absolute(grids: List[TextGrid], tier_name: str, assign_
   return grids_changed, total_intervals, considered_intervals, matching_intervals, changed_intervals
 
 
+def get_assign_intervals(intervals: List[Interval], assign_tier: IntervalTier, is_same_tier: bool) -> Iterable[Interval]:
+  if is_same_tier:
+    return intervals
+  return (
+    assign_interval
+    for _, assign_interval in align_intervals_on_tier(intervals, assign_tier)
+  )
+
+
 def filter_intervals_by_mark(intervals: Iterable[Interval], marks: Set[str]) -> Generator[Interval, None, None]:
   if len(marks) == 0:
     yield from intervals
@@ -253,10 +281,7 @@ def label_durations_core_all(grids: List[TextGrid], tier_name: str, assign_tier_
     duration_matching_intervals += len(intervals)
     assign_tier = get_single_tier(grid, assign_tier_name)
     changed_anything = False
-    for interval in intervals:
-      assign_interval = interval
-      if assign_tier_name != tier_name:
-        assign_interval = get_interval_on_tier(interval, assign_tier)
+    for assign_interval in get_assign_intervals(intervals, assign_tier, assign_tier_name == tier_name):
       if assign_interval.mark != assign_mark:
         assign_interval.mark = assign_mark
         changed_intervals += 1
@@ -273,11 +298,13 @@ def label_durations_core_separate(grids: List[TextGrid], tier_name: str, assign_
 
   total_intervals = 0
   considered_intervals = 0
+  filtered_intervals_per_grid: List[List[Interval]] = []
   for grid_index, grid in enumerate(grids):
     intervals = get_single_tier(grid, tier_name).intervals
     total_intervals += len(intervals)
     filtered_intervals = list(filter_intervals_by_mark(intervals, only_consider_marks))
     considered_intervals += len(filtered_intervals)
+    filtered_intervals_per_grid.append(filtered_intervals)
     for interval in filtered_intervals:
       mark = interval.mark
       if mark not in intervals_to_marks:
@@ -291,6 +318,8 @@ def label_durations_core_separate(grids: List[TextGrid], tier_name: str, assign_
   duration_matching_intervals = 0
 
   grids_changed = [False for _ in grids]
+  # the interval of the assign tier of each filtered interval of a grid (by id)
+  assign_intervals_per_grid: Dict[int, Dict[int, Interval]] = {}
 
   for mark, mark_intervals in intervals_to_marks.items():
     if len(mark_intervals) < min_count:
@@ -310,9 +339,14 @@ def label_durations_core_separate(grids: List[TextGrid], tier_name: str, assign_
         duration_matching_intervals += 1
         assign_interval = interval
         if assign_tier_name != tier_name:
-          grid = grids[grid_index]
-          assign_tier = get_single_tier(grid, assign_tier_name)
-          assign_interval = get_interval_on_tier(interval, assign_tier)
+          if grid_index not in assign_intervals_per_grid:
+            assign_tier = get_single_tier(grids[grid_index], assign_tier_name)
+            assign_intervals_per_grid[grid_index] = {
+              id(filtered_interval): filtered_assign_interval
+              for filtered_interval, filtered_assign_interval in align_intervals_on_tier(
+                filtered_intervals_per_grid[grid_index], assign_tier)
+            }
+          assign_interval = assign_intervals_per_grid[grid_index][id(interval)]
         if assign_interval.mark != assign_mark:
           assign_interval.mark = assign_mark
           changed_intervals += 1
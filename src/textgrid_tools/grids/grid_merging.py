@@ -6,7 +6,7 @@ from typing import Iterable, List, Optional, Tuple, cast
 from textgrid import Interval, IntervalTier, TextGrid
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools.helper import check_intervals_are_consecutive
+from textgrid_tools.helper import check_intervals_are_consecutive, set_tier_changed
 from textgrid_tools.intervals.boundary_fixing import fix_interval_boundaries
 from textgrid_tools.validation import InvalidGridError, ValidationError
 
@@ -52,6 +52,10 @@ def merge_grids(grids: List[TextGrid], insert_duration: Optional[float], insert_
     for tier in cast(List[IntervalTier], ref_grid.tiers)
   ))
 
+  # the intervals of the tiers of the first grid are changed
+  for tier in ref_grid.tiers:
+    set_tier_changed(tier)
+
   for grid in grids[1:]:
     for tier in cast(List[IntervalTier], ref_grid.tiers):
       if insert_duration is not None:
@@ -1,5 +1,8 @@
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
 from math import ceil
-from typing import Generator, Iterable, List, Optional, Set, Tuple, cast
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
 from ordered_set import OrderedSet
 from textgrid.textgrid import Interval, IntervalTier, TextGrid
@@ -29,6 +32,7 @@ def set_precision_grid(grid: TextGrid, n_digits: int) -> None:
 
 
 def set_precision_tier(tier: IntervalTier, n_digits: int) -> None:
+  invalidate_tier(tier)
   tier.minTime = round(tier.minTime, n_digits)
   tier.maxTime = round(tier.maxTime, n_digits)
   for interval in tier.intervals:
@@ -51,11 +55,175 @@ def check_is_valid_grid(grid: TextGrid) -> bool:
     if not do_tier_boundaries_match_those_from_grid(tier, grid):
       return False
 
-    if not is_tier_valid(tier):
+    if not is_tier_valid_cached(tier):
       return False
   return True
 
 
+# The result of `is_tier_valid` is stored on the tier, i.e., a grid is only
+# validated once per tier (the parser of the CLI already sets it while reading
+# the intervals). All helpers that change the times or the intervals of a tier
+# need to invalidate it.
+TIER_VALIDITY_ATTRIBUTE = "is_valid"
+
+
+def is_tier_valid_cached(tier: IntervalTier) -> bool:
+  result = getattr(tier, TIER_VALIDITY_ATTRIBUTE, None)
+  if result is None:
+    result = is_tier_valid(tier)
+    set_tier_validity(tier, result)
+  return result
+
+
+def set_tier_validity(tier: IntervalTier, is_valid: Optional[bool]) -> None:
+  setattr(tier, TIER_VALIDITY_ATTRIBUTE, is_valid)
+
+
+def invalidate_tier_validity(tier: IntervalTier) -> None:
+  set_tier_validity(tier, None)
+
+
+def invalidate_tier(tier: IntervalTier) -> None:
+  """
+  Needs to be called after the times or the intervals of the tier were changed.
+  """
+  invalidate_tier_validity(tier)
+  invalidate_boundary_index(tier)
+
+
+def invalidate_grid(grid: TextGrid) -> None:
+  for tier in grid.tiers:
+    invalidate_tier(tier)
+
+
+# Helpers that change a tier record it on the tier (see `set_tier_changed`),
+# i.e., whether and which tiers of a grid were changed is known without
+# comparing the tiers to their former state.
+TIER_CHANGED_ATTRIBUTE = "changed"
+
+
+def set_tier_changed(tier: IntervalTier) -> None:
+  """
+  Same as `invalidate_tier` but also records that the tier was changed.
+  """
+  invalidate_tier(tier)
+  record_tier_change(tier)
+
+
+def record_tier_change(tier: IntervalTier) -> None:
+  setattr(tier, TIER_CHANGED_ATTRIBUTE, True)
+
+
+def is_tier_changed(tier: IntervalTier) -> bool:
+  return getattr(tier, TIER_CHANGED_ATTRIBUTE, False)
+
+
+def get_changed_tiers(grid: TextGrid) -> List[IntervalTier]:
+  return [tier for tier in grid.tiers if is_tier_changed(tier)]
+
+
+def clear_tier_changes(grid: TextGrid) -> None:
+  for tier in grid.tiers:
+    setattr(tier, TIER_CHANGED_ATTRIBUTE, False)
+
+
+# The start and end times of the intervals of a tier, which allow to look up
+# intervals by time with bisect. It is built on first use and stored on the
+# tier (see `invalidate_tier`). Tiers with unsorted or overlapping intervals
+# are searched linearly.
+BOUNDARY_INDEX_ATTRIBUTE = "boundary_index"
+
+
+class BoundaryIndex():
+  def __init__(self, intervals: Iterable[Interval]) -> None:
+    self.starts: List[float] = []
+    self.ends: List[float] = []
+    for interval in intervals:
+      self.starts.append(interval.minTime)
+      self.ends.append(interval.maxTime)
+    self.is_sorted = all(
+      prev_end <= start
+      for prev_end, start in zip(self.ends, islice(self.starts, 1, None))
+    )
+
+  def __len__(self) -> int:
+    return len(self.starts)
+
+  def update(self, position: int, interval: Interval) -> None:
+    """
+    Updates the times of the interval at position; the order of the intervals
+    needs to be unchanged.
+    """
+    self.starts[position] = interval.minTime
+    self.ends[position] = interval.maxTime
+
+
+def iter_intervals(tier: IntervalTier, start: int = 0, stop: Optional[int] = None) -> Iterator[Interval]:
+  """
+  Iterates over the intervals [start:stop] of the tier to read them; the
+  intervals of a copy-on-write tier are not created, i.e., changes to the
+  returned intervals are not reflected in such a tier.
+  """
+  iter_shared = getattr(tier, "iter_shared", None)
+  if iter_shared is not None:
+    return iter_shared(start, stop)
+  if start == 0 and stop is None:
+    return iter(tier.intervals)
+  return iter(tier.intervals[start:stop])
+
+
+def get_boundary_index(tier: IntervalTier) -> Optional[BoundaryIndex]:
+  result = getattr(tier, BOUNDARY_INDEX_ATTRIBUTE, None)
+  # `len` and `iter_intervals` don't create the intervals of copy-on-write tiers
+  if result is None or len(result) != len(tier):
+    result = BoundaryIndex(iter_intervals(tier))
+    setattr(tier, BOUNDARY_INDEX_ATTRIBUTE, result)
+  if not result.is_sorted:
+    return None
+  return result
+
+
+def invalidate_boundary_index(tier: IntervalTier) -> None:
+  setattr(tier, BOUNDARY_INDEX_ATTRIBUTE, None)
+
+
+# The positions of the tiers of a grid by their name, which allow to look up
+# tiers without iterating over all tiers of the grid. It is built on first use
+# and stored on the grid. Appending tiers to or replacing `grid.tiers` is
+# detected; helpers that rename, move or remove tiers need to call
+# `invalidate_tier_index`.
+TIER_INDEX_ATTRIBUTE = "tier_index"
+
+
+class TierIndex():
+  def __init__(self, tiers: List[IntervalTier]) -> None:
+    self.tiers = tiers
+    self.count = len(tiers)
+    self.positions: Dict[str, List[Tuple[int, IntervalTier]]] = {}
+    for position, tier in enumerate(tiers):
+      if tier.name not in self.positions:
+        self.positions[tier.name] = []
+      self.positions[tier.name].append((position, tier))
+
+  def is_up_to_date(self, tiers: List[IntervalTier]) -> bool:
+    return self.tiers is tiers and self.count == len(tiers)
+
+  def get(self, tier_name: str) -> List[Tuple[int, IntervalTier]]:
+    return self.positions.get(tier_name, [])
+
+
+def get_tier_index(grid: TextGrid) -> TierIndex:
+  result = getattr(grid, TIER_INDEX_ATTRIBUTE, None)
+  if result is None or not result.is_up_to_date(grid.tiers):
+    result = TierIndex(grid.tiers)
+    setattr(grid, TIER_INDEX_ATTRIBUTE, result)
+  return result
+
+
+def invalidate_tier_index(grid: TextGrid) -> None:
+  setattr(grid, TIER_INDEX_ATTRIBUTE, None)
+
+
 def do_tier_boundaries_match_those_from_grid(tier: IntervalTier, grid: TextGrid) -> bool:
   if tier.minTime != grid.minTime:
     return False
@@ -65,9 +233,9 @@ def do_tier_boundaries_match_those_from_grid(tier: IntervalTier, grid: TextGrid)
 
 
 def do_interval_boundaries_match_those_from_tier(tier: IntervalTier) -> bool:
-  if len(tier.intervals) > 0:
-    first_interval = tier.intervals[0]
-    last_interval = tier.intervals[-1]
+  if len(tier) > 0:
+    first_interval = next(iter_intervals(tier, 0, 1))
+    last_interval = next(iter_intervals(tier, len(tier) - 1))
     if tier.minTime != first_interval.minTime:
       return False
     if tier.maxTime != last_interval.maxTime:
@@ -90,7 +258,7 @@ def is_tier_valid(tier: IntervalTier) -> bool:
   if not check_tier_intervals_are_consecutive(tier):
     return False
 
-  for interval in tier.intervals:
+  for interval in iter_intervals(tier):
     if not check_interval_is_valid(interval):
       return False
 
@@ -104,21 +272,26 @@ def check_interval_is_valid(interval: Interval) -> bool:
 
 
 def check_tier_intervals_are_consecutive(tier: IntervalTier) -> bool:
-  return check_intervals_are_consecutive(tier.intervals)
+  return check_intervals_are_consecutive(iter_intervals(tier))
 
 
-def check_intervals_are_consecutive(intervals: List[Interval]) -> bool:
-  if len(intervals) == 0:
-    return True
-  prev_interval = intervals[0]
-  for interval in intervals[1:]:
-    if prev_interval.maxTime != interval.minTime:
+def check_intervals_are_consecutive(intervals: Iterable[Interval]) -> bool:
+  prev_interval: Optional[Interval] = None
+  for interval in intervals:
+    if prev_interval is not None and prev_interval.maxTime != interval.minTime:
       return False
     prev_interval = interval
   return True
 
 
 def timepoint_is_boundary(timepoint: float, tier: IntervalTier) -> bool:
+  index = get_boundary_index(tier)
+  if index is not None:
+    position = bisect_left(index.starts, timepoint)
+    if position < len(index) and index.starts[position] == timepoint:
+      return True
+    position = bisect_left(index.ends, timepoint)
+    return position < len(index) and index.ends[position] == timepoint
   min_time_interval = get_interval_from_minTime(tier, timepoint)
   if min_time_interval is not None:
     return True
@@ -129,6 +302,40 @@ def timepoint_is_boundary(timepoint: float, tier: IntervalTier) -> bool:
   return False
 
 
+def get_sorted_boundaries(tier: IntervalTier) -> List[float]:
+  """
+  Returns the distinct start and end times of the intervals of the tier in
+  ascending order.
+  """
+  index = get_boundary_index(tier)
+  if index is None:
+    return sorted(set(interval.minTime for interval in iter_intervals(tier)).union(
+      interval.maxTime for interval in iter_intervals(tier)))
+  # the starts and the ends of sorted intervals are each sorted
+  result: List[float] = []
+  for boundary in merge(index.starts, index.ends):
+    if len(result) == 0 or result[-1] != boundary:
+      result.append(boundary)
+  return result
+
+
+def get_closest_boundaries(timepoints: List[float], boundaries: List[float]) -> Generator[Optional[float], None, None]:
+  """
+  Returns the closest boundary of each timepoint in one pass over both lists,
+  which need to be sorted; None if there are no boundaries.
+  """
+  position = 0
+  for timepoint in timepoints:
+    while position + 1 < len(boundaries) and boundaries[position + 1] <= timepoint:
+      position += 1
+    if len(boundaries) == 0:
+      yield None
+    elif position + 1 < len(boundaries) and boundaries[position + 1] - timepoint < abs(timepoint - boundaries[position]):
+      yield boundaries[position + 1]
+    else:
+      yield boundaries[position]
+
+
 def get_mark(interval: Interval) -> str:
   if interval.mark is None:
     return ""
@@ -174,11 +381,17 @@ def get_interval_readable(interval: Interval) -> str:
 
 
 def get_tier_readable(tier: IntervalTier) -> str:
-  result = f"Tier [{tier.minTime}, {tier.maxTime}]: \"{tier.name}\" (# intervals: {len(tier.intervals)})"
+  result = f"Tier [{tier.minTime}, {tier.maxTime}]: \"{tier.name}\" (# intervals: {len(tier)})"
   return result
 
 
 def get_interval_from_minTime(tier: IntervalTier, minTime: float) -> Optional[Interval]:
+  index = get_boundary_index(tier)
+  if index is not None:
+    position = bisect_left(index.starts, minTime)
+    if position < len(index) and index.starts[position] == minTime:
+      return tier.intervals[position]
+    return None
   for interval in cast(Iterable[Interval], tier.intervals):
     if interval.minTime == minTime:
       return interval
@@ -186,6 +399,12 @@ def get_interval_from_minTime(tier: IntervalTier, minTime: float) -> Optional[In
 
 
 def get_interval_from_maxTime(tier: IntervalTier, maxTime: float) -> Optional[Interval]:
+  index = get_boundary_index(tier)
+  if index is not None:
+    position = bisect_left(index.ends, maxTime)
+    if position < len(index) and index.ends[position] == maxTime:
+      return tier.intervals[position]
+    return None
   for interval in cast(Iterable[Interval], tier.intervals):
     if interval.maxTime == maxTime:
       return interval
@@ -199,18 +418,61 @@ def get_interval_on_tier(interval: Interval, tier: IntervalTier) -> Interval:
   return result
 
 
+def align_intervals(intervals: Iterable[Interval], tiers: List[IntervalTier]) -> Generator[Tuple[Interval, List[List[Interval]]], None, None]:
+  """
+  Yields each interval together with the intervals of each tier which lie
+  within it (same as `get_intervals_from_timespan`) in one pass over all
+  tiers. The intervals and the intervals of the tiers need to be sorted and
+  non-overlapping.
+  """
+  tiers_intervals = [tier.intervals for tier in tiers]
+  positions = [0 for _ in tiers]
+  for interval in intervals:
+    min_time = interval.minTime
+    max_time = interval.maxTime
+    aligned: List[List[Interval]] = []
+    for tier_nr, tier_intervals in enumerate(tiers_intervals):
+      position = positions[tier_nr]
+      while position < len(tier_intervals) and tier_intervals[position].minTime < min_time:
+        position += 1
+      start = position
+      while position < len(tier_intervals) and tier_intervals[position].maxTime <= max_time:
+        position += 1
+      aligned.append(tier_intervals[start:position])
+      positions[tier_nr] = position
+    yield interval, aligned
+
+
+def align_intervals_on_tier(intervals: Iterable[Interval], tier: IntervalTier) -> Generator[Tuple[Interval, Interval], None, None]:
+  """
+  Yields each interval together with the interval of the tier which has the
+  same boundaries (same as `get_interval_on_tier`), see `align_intervals`.
+  """
+  for interval, (tier_intervals,) in align_intervals(intervals, [tier]):
+    assert len(tier_intervals) == 1
+    result = tier_intervals[0]
+    assert result.minTime == interval.minTime
+    assert result.maxTime == interval.maxTime
+    yield interval, result
+
+
 def get_intervals_from_timespan(tier: IntervalTier, minTime: float, maxTime: float) -> Generator[Interval, None, None]:
+  index = get_boundary_index(tier)
+  if index is not None:
+    # starts and ends are both ascending
+    start = bisect_left(index.starts, minTime)
+    end = bisect_right(index.ends, maxTime)
+    if start < end:
+      yield from tier.intervals[start:end]
+    return
   for interval in cast(Iterable[Interval], tier.intervals):
     if minTime <= interval.minTime and interval.maxTime <= maxTime:
       yield interval
 
 
 def get_intervals_from_timespan_match(tier: IntervalTier, minTime: float, maxTime: float) -> List[Interval]:
-  result = []
   # TODO check that no duplicate intervals in tier exist and that they are consecutive
-  for interval in cast(Iterable[Interval], tier.intervals):
-    if minTime <= interval.minTime and interval.maxTime <= maxTime:
-      result.append(interval)
+  result = list(get_intervals_from_timespan(tier, minTime, maxTime))
   result.sort(key=lambda x: x.minTime)
   assert result[0].minTime == minTime
   assert result[-1].maxTime == maxTime
@@ -264,8 +526,7 @@ def check_timepoints_exist_on_all_tiers_as_boundaries(timepoints: List[float], t
 
 
 def get_count_of_tiers(grid: TextGrid, tier_name: str) -> int:
-  tiers = list(get_all_tiers(grid, {tier_name}))
-  return len(tiers)
+  return len(get_tier_index(grid).get(tier_name))
 
 
 def get_single_tier(grid: TextGrid, tier_name: str) -> IntervalTier:
@@ -293,9 +554,11 @@ def get_all_intervals(grid: TextGrid, tier_names: Set[str]) -> Generator[Interva
 
 
 def get_all_tiers(grid: TextGrid, tier_names: Set[str]) -> Generator[IntervalTier, None, None]:
-  for tier in cast(Iterable[IntervalTier], grid.tiers):
-    if tier.name in tier_names:
-      yield tier
+  index = get_tier_index(grid)
+  # the tiers are returned in the order of the grid
+  positions = merge(*(index.get(tier_name) for tier_name in tier_names), key=lambda x: x[0])
+  for _, tier in positions:
+    yield tier
 
 
 # def get_first_tier(grid: TextGrid, tier_name: str) -> IntervalTier:
@@ -304,10 +567,7 @@ def get_all_tiers(grid: TextGrid, tier_names: Set[str]) -> Generator[IntervalTie
 
 
 def tier_exists(grid: TextGrid, tier: str) -> bool:
-  tiers = get_all_tiers(grid, {tier})
-  for _ in tiers:
-    return True
-  return False
+  return len(get_tier_index(grid).get(tier)) > 0
 
 
 # def add_or_update_tier(grid: TextGrid, tier: Optional[IntervalTier], output_tier: IntervalTier, overwrite_tier: bool) -> bool:
@@ -327,6 +587,7 @@ def tier_exists(grid: TextGrid, tier: str) -> bool:
 
 
 def replace_tier(tier: IntervalTier, new_tier: IntervalTier) -> None:
+  set_tier_changed(tier)
   tier.intervals.clear()
   tier.intervals.extend(new_tier.intervals)
   tier.minTime = new_tier.minTime
@@ -343,10 +604,10 @@ def check_timepoint_exist_on_all_tiers_as_boundary(timepoint: float, tiers: List
 
 
 def get_boundary_timepoints_from_tier(tier: IntervalTier) -> OrderedSet[float]:
-  return get_boundary_timepoints_from_intervals(tier.intervals)
+  return get_boundary_timepoints_from_intervals(iter_intervals(tier))
 
 
-def get_boundary_timepoints_from_intervals(intervals: List[Interval]) -> OrderedSet[float]:
+def get_boundary_timepoints_from_intervals(intervals: Iterable[Interval]) -> OrderedSet[float]:
   result: OrderedSet[float] = OrderedSet()
   for interval in intervals:
     result.add(interval.minTime)
@@ -357,6 +618,7 @@ def get_boundary_timepoints_from_intervals(intervals: List[Interval]) -> Ordered
 def ignore_intervals_by_mark(intervals: Iterable[Interval], marks: Set[str]) -> Generator[Interval, None, None]:
   if len(marks) == 0:
     yield from intervals
+    return
   res = (
     interval
     for interval in intervals
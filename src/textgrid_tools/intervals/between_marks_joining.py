@@ -3,11 +3,10 @@ from typing import Generator, Iterable, List, Optional, Set, cast
 
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_all_tiers, get_intervals_duration
-from textgrid_tools.intervals.common import (group_adjacent_intervals, merge_intervals,
-                                             replace_intervals)
+from textgrid_tools.intervals.common import (Replacement, group_adjacent_intervals, merge_intervals,
+                                             rewrite_tier)
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 
 
@@ -49,11 +48,14 @@ def join_intervals_between_marks(grid: TextGrid, tier_names: Set[str], marks: Se
   changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for chunk in chunk_intervals(intervals_copy, ignore_adj_below, marks):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      if not check_intervals_are_equal(chunk, [merged_interval]):
-        replace_intervals(tier, chunk, [merged_interval])
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        merged_interval = merge_intervals(chunk, join_with, ignore_empty)
+        replacements.append((chunk, [merged_interval]))
         changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
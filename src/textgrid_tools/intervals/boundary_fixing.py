@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from logging import Logger, getLogger
 from math import inf
 from typing import Iterable, Optional, Set, Tuple, cast
@@ -5,9 +6,10 @@ from typing import Iterable, Optional, Set, Tuple, cast
 from textgrid.textgrid import Interval, IntervalTier, TextGrid
 
 from textgrid_tools.globals import ChangedAnything, ExecutionResult
-from textgrid_tools.helper import (check_is_valid_grid, get_all_tiers,
+from textgrid_tools.helper import (check_is_valid_grid, get_all_tiers, get_boundary_index,
                                    get_boundary_timepoints_from_tier, get_interval_from_maxTime,
                                    get_interval_from_minTime, get_single_tier,
+                                   invalidate_tier_validity, record_tier_change,
                                    timepoint_is_boundary)
 from textgrid_tools.validation import (InvalidGridError, MultipleTiersWithThatNameError,
                                        NonDistinctTiersError, NotExistingTierError)
@@ -81,13 +83,21 @@ def fix_timepoint(timepoint: float, tier: IntervalTier, threshold: float, logger
   if is_already_fixed:
     return True, False
 
-  interval = get_interval_from_time(tier, timepoint)
+  position = get_interval_position_from_time(tier, timepoint)
+  interval = tier.intervals[position]
   prev_interval = get_interval_from_maxTime(tier, interval.minTime)
   next_interval = get_interval_from_minTime(tier, interval.maxTime)
   fixed, changed_anything = fix_timepoint_interval(
     timepoint, prev_interval, interval, next_interval, threshold, logger)
 
   if changed_anything:
+    invalidate_tier_validity(tier)
+    record_tier_change(tier)
+    index = get_boundary_index(tier)
+    if index is not None:
+      # only the times of the interval and its neighbours were changed, not their order
+      for neighbour_position in range(max(0, position - 1), min(len(index), position + 2)):
+        index.update(neighbour_position, tier.intervals[neighbour_position])
     is_first_interval = prev_interval is None
     if is_first_interval and tier.minTime != interval.minTime:
       tier.minTime = interval.minTime
@@ -99,16 +109,26 @@ def fix_timepoint(timepoint: float, tier: IntervalTier, threshold: float, logger
 
 
 def get_interval_from_time(tier: IntervalTier, time: float) -> Interval:
+  return tier.intervals[get_interval_position_from_time(tier, time)]
+
+
+def get_interval_position_from_time(tier: IntervalTier, time: float) -> int:
   assert time >= 0
   assert time < inf
   assert len(tier.intervals) > 0
-  for interval in cast(Iterable[Interval], tier.intervals):
-    if interval.minTime <= time < interval.maxTime:
-      return interval
+  index = get_boundary_index(tier)
+  if index is not None:
+    position = bisect_right(index.starts, time) - 1
+    if position >= 0 and time < index.ends[position]:
+      return position
+  else:
+    for position, interval in enumerate(cast(Iterable[Interval], tier.intervals)):
+      if interval.minTime <= time < interval.maxTime:
+        return position
   if time < tier.intervals[0].minTime:
-    return tier.intervals[0]
+    return 0
   if time >= tier.intervals[-1].maxTime:
-    return tier.intervals[-1]
+    return len(tier.intervals) - 1
   assert False
 
 
@@ -4,17 +4,19 @@ from typing import Generator, Iterable, List, Optional, Set, cast
 from ordered_set import OrderedSet
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import (get_all_tiers, get_boundary_timepoints_from_tier,
                                    get_intervals_part_of_timespan_from_intervals, get_single_tier)
-from textgrid_tools.intervals.common import merge_intervals, replace_intervals
+from textgrid_tools.intervals.common import Replacement, merge_intervals, rewrite_tier
 from textgrid_tools.validation import (BoundaryError, InvalidGridError,
                                        MultipleTiersWithThatNameError, NonDistinctTiersError,
-                                       NotExistingTierError)
+                                       NotExistingTierError, snap_boundaries_to_timepoints)
 
 
-def join_intervals_on_boundaries(grid: TextGrid, boundary_tier_name: str, tier_names: Set[str], join_with: str, ignore_empty: bool, logger: Optional[Logger]) -> ExecutionResult:
+def join_intervals_on_boundaries(grid: TextGrid, boundary_tier_name: str, tier_names: Set[str], join_with: str, ignore_empty: bool, logger: Optional[Logger], boundary_epsilon: float = 0) -> ExecutionResult:
+  """
+  boundary_epsilon: boundaries of the tiers whose distance to a boundary of the boundary tier is at most epsilon are moved onto it
+  """
   assert len(tier_names) > 0
 
   if logger is None:
@@ -40,17 +42,20 @@ def join_intervals_on_boundaries(grid: TextGrid, boundary_tier_name: str, tier_n
   boundary_tier_timepoints = get_boundary_timepoints_from_tier(boundary_tier)
   tiers = list(get_all_tiers(grid, tier_names))
 
-  if error := BoundaryError.validate(boundary_tier_timepoints, tiers):
+  if error := BoundaryError.validate(boundary_tier_timepoints, tiers, boundary_epsilon):
     return error, False
 
-  changed_anything = False
+  changed_anything = snap_boundaries_to_timepoints(boundary_tier_timepoints, tiers, boundary_epsilon)
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for chunk in chunk_intervals(intervals_copy, boundary_tier_timepoints):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      if not check_intervals_are_equal(chunk, [merged_interval]):
-        replace_intervals(tier, chunk, [merged_interval])
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        merged_interval = merge_intervals(chunk, join_with, ignore_empty)
+        replacements.append((chunk, [merged_interval]))
         changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
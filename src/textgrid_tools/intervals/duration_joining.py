@@ -7,7 +7,7 @@ from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import (get_all_tiers, get_interval_readable, get_intervals_duration,
                                    interval_is_None_or_whitespace)
-from textgrid_tools.intervals.common import merge_intervals, replace_intervals
+from textgrid_tools.intervals.common import Replacement, merge_intervals, rewrite_tier
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 
 
@@ -48,16 +48,19 @@ def join_intervals_on_durations(grid: TextGrid, tier_names: Set[str], join_with:
   changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for interval in intervals_copy:
       if interval.duration() > max_duration_s:
         logger.warning(
           f"The duration of interval {get_interval_readable(interval)} ({interval.duration()}s) is bigger than {max_duration_s}!")
     # TODO fix bug
     for chunk in chunk_intervals(intervals_copy, max_duration_s, include_empty_intervals):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      if not check_intervals_are_equal(chunk, [merged_interval]):
-        replace_intervals(tier, chunk, [merged_interval])
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        merged_interval = merge_intervals(chunk, join_with, ignore_empty)
+        replacements.append((chunk, [merged_interval]))
         changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
@@ -1,12 +1,11 @@
 from logging import Logger, getLogger
-from typing import Iterable, Optional, Set, cast
+from typing import Iterable, List, Optional, Set, cast
 
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_all_tiers
-from textgrid_tools.intervals.common import merge_intervals, replace_intervals
+from textgrid_tools.intervals.common import Replacement, merge_intervals, rewrite_tier
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError
 
 
@@ -28,9 +27,12 @@ def join_intervals(grid: TextGrid, tier_names: Set[str], join_with: str, ignore_
   changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
-    merged_interval = merge_intervals(intervals_copy, join_with, ignore_empty)
-    if not check_intervals_are_equal(intervals_copy, [merged_interval]):
-      replace_intervals(tier, intervals_copy, [merged_interval])
+    replacements: List[Replacement] = []
+    # merging a single interval results in the same interval
+    if len(intervals_copy) > 1:
+      merged_interval = merge_intervals(intervals_copy, join_with, ignore_empty)
+      replacements.append((intervals_copy, [merged_interval]))
       changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
@@ -3,11 +3,10 @@ from typing import Generator, Iterable, List, Optional, Set, cast
 
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_all_tiers
-from textgrid_tools.intervals.common import (group_adjacent_pauses, merge_intervals,
-                                             replace_intervals)
+from textgrid_tools.intervals.common import (Replacement, group_adjacent_pauses, merge_intervals,
+                                             rewrite_tier)
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError
 
 
@@ -34,16 +33,18 @@ def join_marks(grid: TextGrid, tier_names: Set[str], join_with: str, empty: bool
   changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for chunk in chunk_intervals(intervals_copy, empty, marks):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      replace_with = [merged_interval]
-      if not check_intervals_are_equal(chunk, replace_with):
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        replace_with = [merge_intervals(chunk, join_with, ignore_empty)]
         joined_count += len(chunk)
         joined_to_count += len(replace_with)
-        replace_intervals(tier, chunk, replace_with)
+        replacements.append((chunk, replace_with))
         changed_anything = True
       else:
         ignored_count += len(chunk)
+    rewrite_tier(tier, replacements)
 
   logger.info(
     f"Joined {joined_count} intervals to {joined_to_count} intervals. Didn't joined {ignored_count} intervals.")
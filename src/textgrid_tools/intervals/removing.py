@@ -11,7 +11,7 @@ from textgrid_tools.grid.audio_synchronization import LastIntervalToShortError,
 from textgrid_tools.helper import (check_is_valid_grid,
                                    check_timepoints_exist_on_all_tiers_as_boundaries,
                                    get_intervals_from_timespans_match, get_single_tier,
-                                   s_to_samples)
+                                   invalidate_tier, record_tier_change, s_to_samples)
 from textgrid_tools.intervals.boundary_fixing import fix_timepoint
 from textgrid_tools.validation import (AudioAndGridLengthMismatchError, InternalError,
                                        InvalidGridError, MultipleTiersWithThatNameError,
@@ -172,6 +172,9 @@ def remove_intervals_from_tiers(intervals_to_remove: List[Interval], tiers: List
     move_first_interval = False
     if tier.intervals[0] in matching_intervals:
       move_first_interval = True
+    invalidate_tier(tier)
+    if len(matching_intervals) > 0:
+      record_tier_change(tier)
     for interval in matching_intervals:
       tier.intervals.remove(interval)
 
@@ -196,6 +199,7 @@ def remove_intervals_from_tiers(intervals_to_remove: List[Interval], tiers: List
 
 
 def set_times_consecutively_tier(tier: IntervalTier):
+  invalidate_tier(tier)
   set_times_consecutively_intervals(tier.intervals)
 
   if len(tier.intervals) > 0:
@@ -1,12 +1,12 @@
 from logging import Logger, getLogger
-from typing import Generator, Iterable, Optional, Set, cast
+from typing import Generator, Iterable, List, Optional, Set, cast
 
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import (get_all_tiers, get_mark, interval_is_None_or_empty,
                                    set_intervals_consecutive)
+from textgrid_tools.intervals.common import Replacement, rewrite_tier
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError
 
 
@@ -39,14 +39,14 @@ def split_intervals(grid: TextGrid, tier_names: Set[str], symbol: str, keep: boo
 
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
-    new_intervals = list(
-      splitted_interval
-      for interval in intervals_copy
-      for splitted_interval in get_split_intervals(interval, symbol, keep)
-    )
-    if not check_intervals_are_equal(tier.intervals, new_intervals):
-      tier.intervals = new_intervals
-      changed_anything = True
+    replacements: List[Replacement] = []
+    for interval in intervals_copy:
+      splitted_intervals = list(get_split_intervals(interval, symbol, keep))
+      # intervals that are not split are returned unchanged
+      if not (len(splitted_intervals) == 1 and splitted_intervals[0] is interval):
+        replacements.append(([interval], splitted_intervals))
+        changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
@@ -4,10 +4,9 @@ from typing import Generator, List, Optional, Set, Tuple, cast
 from ordered_set import OrderedSet
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_all_tiers, get_mark
-from textgrid_tools.intervals.common import merge_intervals, replace_intervals
+from textgrid_tools.intervals.common import Replacement, merge_intervals, rewrite_tier
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 
 
@@ -47,11 +46,14 @@ def join_interval_symbols(grid: TextGrid, tier_names: Set[str], join_with: str,
   changed_anything = False
   for tier in tiers:
     intervals_copy = cast(List[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for chunk in chunk_intervals(intervals_copy, join_symbols, ignore_join_symbols, mode):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      if not check_intervals_are_equal(chunk, [merged_interval]):
-        replace_intervals(tier, chunk, [merged_interval])
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        merged_interval = merge_intervals(chunk, join_with, ignore_empty)
+        replacements.append((chunk, [merged_interval]))
         changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
@@ -4,14 +4,17 @@ from typing import Generator, Iterable, List, Optional, Set, cast
 from ordered_set import OrderedSet
 from textgrid.textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_all_tiers, get_boundary_timepoints_from_tier, get_single_tier
-from textgrid_tools.intervals.common import merge_intervals, replace_intervals
-from textgrid_tools.validation import BoundaryError, InvalidGridError, NotExistingTierError
+from textgrid_tools.intervals.common import Replacement, merge_intervals, rewrite_tier
+from textgrid_tools.validation import (BoundaryError, InvalidGridError, NotExistingTierError,
+                                       snap_boundaries_to_timepoints)
 
 
-def join_by_template(grid: TextGrid, tier_names: Set[str], boundary_tier_name: Optional[str], join_with: str, ignore_empty: bool, template: List[str], logger: Optional[Logger]) -> ExecutionResult:
+def join_by_template(grid: TextGrid, tier_names: Set[str], boundary_tier_name: Optional[str], join_with: str, ignore_empty: bool, template: List[str], logger: Optional[Logger], boundary_epsilon: float = 0) -> ExecutionResult:
+  """
+  boundary_epsilon: boundaries of the tiers whose distance to a boundary of the boundary tier is at most epsilon are moved onto it
+  """
   assert len(tier_names) > 0
 
   if logger is None:
@@ -31,30 +34,35 @@ def join_by_template(grid: TextGrid, tier_names: Set[str], boundary_tier_name: O
   tiers = list(get_all_tiers(grid, tier_names))
 
   boundary_tier_timepoints = OrderedSet()
+  changed_anything = False
   if boundary_tier_name is not None:
     boundary_tier = get_single_tier(grid, boundary_tier_name)
     boundary_tier_timepoints = get_boundary_timepoints_from_tier(boundary_tier)
 
-    if error := BoundaryError.validate(boundary_tier_timepoints, tiers):
+    if error := BoundaryError.validate(boundary_tier_timepoints, tiers, boundary_epsilon):
       return error, False
 
+    changed_anything = snap_boundaries_to_timepoints(
+      boundary_tier_timepoints, tiers, boundary_epsilon)
+
   joined_count = 0
   joined_to_count = 0
   ignored_count = 0
 
-  changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for chunk in chunk_intervals_boundary(intervals_copy, template, boundary_tier_timepoints):
-      merged_interval = merge_intervals(chunk, join_with, ignore_empty)
-      replace_with = [merged_interval]
-      if not check_intervals_are_equal(chunk, replace_with):
+      # merging a single interval results in the same interval
+      if len(chunk) > 1:
+        replace_with = [merge_intervals(chunk, join_with, ignore_empty)]
         joined_count += len(chunk)
         joined_to_count += len(replace_with)
-        replace_intervals(tier, chunk, replace_with)
+        replacements.append((chunk, replace_with))
         changed_anything = True
       else:
         ignored_count += len(chunk)
+    rewrite_tier(tier, replacements)
 
   logger.info(
     f"Joined {joined_count} intervals to {joined_to_count} intervals. Didn't joined {ignored_count} intervals.")
@@ -0,0 +1,124 @@
+from typing import Tuple
+
+import numpy as np
+from textgrid.textgrid import IntervalTier, PointTier, TextGrid
+
+from textgrid_tools.compact_tier import CompactIntervalTier
+from textgrid_tools.helper import (check_minTime_and_maxTime_are_valid, invalidate_tier,
+                                   iter_intervals, set_tier_validity)
+
+# Times can optionally be represented as integer ticks of a fixed resolution
+# (ticks per second, e.g., the sampling rate of the audio). A time in ticks is
+# stored as `ticks / resolution`, i.e., the same ticks always result in the
+# same float and comparing two snapped times with `==` is exact. Times that
+# were computed from snapped times (e.g. after moving intervals) are snapped
+# again when the grid is written.
+
+
+def get_ticks(time: float, resolution: int) -> int:
+  return round(time * resolution)
+
+
+def get_time(ticks: int, resolution: int) -> float:
+  return ticks / resolution
+
+
+def snap_time(time: float, resolution: int) -> float:
+  return get_time(get_ticks(time, resolution), resolution)
+
+
+def get_ticks_array(times: np.ndarray, resolution: int) -> np.ndarray:
+  return np.rint(times * resolution).astype(np.int64)
+
+
+def get_times_array(ticks: np.ndarray, resolution: int) -> np.ndarray:
+  return ticks / resolution
+
+
+def get_boundary_times(tier: IntervalTier) -> Tuple[np.ndarray, np.ndarray]:
+  if isinstance(tier, CompactIntervalTier):
+    return tier.starts, tier.ends
+  # doesn't create the intervals of copy-on-write tiers
+  times = np.array([(interval.minTime, interval.maxTime)
+                   for interval in iter_intervals(tier)], dtype=np.float64).reshape(-1, 2)
+  return times[:, 0], times[:, 1]
+
+
+def get_boundary_ticks(tier: IntervalTier, resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+  """
+  Returns the start and end ticks of the intervals of the tier as int64 arrays.
+  """
+  starts, ends = get_boundary_times(tier)
+  return get_ticks_array(starts, resolution), get_ticks_array(ends, resolution)
+
+
+def check_ticks_are_valid(min_ticks: int, max_ticks: int, starts: np.ndarray, ends: np.ndarray) -> bool:
+  """
+  Same as `is_tier_valid` but computed exactly on the ticks.
+  """
+  if not check_minTime_and_maxTime_are_valid(min_ticks, max_ticks):
+    return False
+  if len(starts) == 0:
+    return True
+  return bool(
+    starts[0] == min_ticks
+    and ends[-1] == max_ticks
+    and np.all(starts < ends)
+    and np.all(starts[1:] == ends[:-1])
+  )
+
+
+def snap_grid(grid: TextGrid, resolution: int) -> None:
+  """
+  Snaps all times of the grid to ticks of the resolution.
+  """
+  assert resolution > 0
+  grid.minTime = snap_time(grid.minTime, resolution)
+  grid.maxTime = snap_time(grid.maxTime, resolution)
+  for tier in grid.tiers:
+    if isinstance(tier, IntervalTier):
+      snap_tier(tier, resolution)
+    elif isinstance(tier, PointTier):
+      snap_point_tier(tier, resolution)
+
+
+def snap_tier(tier: IntervalTier, resolution: int) -> None:
+  min_ticks = get_ticks(tier.minTime, resolution)
+  max_ticks = get_ticks(tier.maxTime, resolution)
+  starts, ends = get_boundary_times(tier)
+  start_ticks = get_ticks_array(starts, resolution)
+  end_ticks = get_ticks_array(ends, resolution)
+  snapped_starts = get_times_array(start_ticks, resolution)
+  snapped_ends = get_times_array(end_ticks, resolution)
+
+  is_snapped = (
+    tier.minTime == get_time(min_ticks, resolution)
+    and tier.maxTime == get_time(max_ticks, resolution)
+    and np.array_equal(starts, snapped_starts)
+    and np.array_equal(ends, snapped_ends)
+  )
+
+  if not is_snapped:
+    invalidate_tier(tier)
+    tier.minTime = get_time(min_ticks, resolution)
+    tier.maxTime = get_time(max_ticks, resolution)
+    if isinstance(tier, CompactIntervalTier):
+      tier.starts = snapped_starts
+      tier.ends = snapped_ends
+    else:
+      for interval, start, end in zip(tier.intervals, snapped_starts.tolist(), snapped_ends.tolist()):
+        interval.minTime = start
+        interval.maxTime = end
+
+  set_tier_validity(tier, check_ticks_are_valid(min_ticks, max_ticks, start_ticks, end_ticks))
+
+
+def snap_point_tier(tier: PointTier, resolution: int) -> None:
+  # the times of parsed point tiers are not set, i.e., they are None
+  if tier.minTime is not None:
+    tier.minTime = snap_time(tier.minTime, resolution)
+  if tier.maxTime is not None:
+    tier.maxTime = snap_time(tier.maxTime, resolution)
+  for point in tier.points:
+    point.time = snap_time(point.time, resolution)
+
@@ -4,7 +4,7 @@ from typing import Optional
 from ordered_set import OrderedSet
 from textgrid import TextGrid
 
-from textgrid_tools.cloning import copy_tier
+from textgrid_tools.cloning import copy_tier, get_shared_tier
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import get_single_tier
 from textgrid_tools.validation import (ExistingTierError, InvalidGridError,
@@ -36,9 +36,11 @@ def clone_tier(grid: TextGrid, tier_name: str, output_tier_names: OrderedSet[str
       return error, False
 
   tier = get_single_tier(grid, tier_name)
+  # all copies share the same storage
+  shared_tier = get_shared_tier(tier)
 
   for output_tier_name in output_tier_names:
-    new_tier = copy_tier(tier, ignore_marks)
+    new_tier = copy_tier(shared_tier, ignore_marks)
     new_tier.name = output_tier_name
     grid.append(new_tier)
 
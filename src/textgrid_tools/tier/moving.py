@@ -4,7 +4,7 @@ from typing import Optional
 from textgrid import TextGrid
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools.helper import get_single_tier
+from textgrid_tools.helper import get_single_tier, invalidate_tier_index
 from textgrid_tools.validation import (InvalidGridError, MultipleTiersWithThatNameError,
                                        NotExistingTierError, ValidationError)
 
@@ -50,6 +50,7 @@ def move_tier(grid: TextGrid, tier_name: str, position_one_based: int, logger: O
   if grid.tiers[position_zero_based] != tier:
     grid.tiers.remove(tier)
     grid.tiers.insert(position_zero_based, tier)
+    invalidate_tier_index(grid)
     changed_anything = True
 
   return None, changed_anything
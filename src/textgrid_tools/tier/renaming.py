@@ -4,7 +4,7 @@ from typing import Optional
 from textgrid import TextGrid
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools.helper import get_single_tier
+from textgrid_tools.helper import get_single_tier, invalidate_tier_index
 from textgrid_tools.validation import (ExistingTierError, InvalidGridError,
                                        MultipleTiersWithThatNameError, NonDistinctTiersError,
                                        NotExistingTierError)
@@ -33,5 +33,6 @@ def rename_tier(grid: TextGrid, tier_name: str, output_tier_name: str, logger: O
 
   tier = get_single_tier(grid, tier_name)
   tier.name = output_tier_name
+  invalidate_tier_index(grid)
 
   return None, True
@@ -28,9 +28,14 @@ def map_marks(grid: TextGrid, mapping: Dict[str, str], tier_names: Set[str], rep
   not_replaced_marks = set()
   replaced_marks = set()
   mapped_count = 0
+  # the marks repeat, e.g., in phone tiers, therefore each mark is mapped only once
+  mapped_marks: Dict[str, str] = {}
   for interval in intervals:
     mark = get_mark(interval)
-    mapped_mark = map_mark(mark, mapping, ignore, replace_unmapped, replace_unmapped_with)
+    mapped_mark = mapped_marks.get(mark)
+    if mapped_mark is None:
+      mapped_mark = map_mark(mark, mapping, ignore, replace_unmapped, replace_unmapped_with)
+      mapped_marks[mark] = mapped_mark
 
     if mark != mapped_mark:
       mapped_count += 1
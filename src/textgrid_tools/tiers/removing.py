@@ -4,7 +4,7 @@ from typing import List, Optional, Set
 from textgrid.textgrid import IntervalTier, TextGrid
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools.helper import get_all_tiers
+from textgrid_tools.helper import get_all_tiers, invalidate_tier_index
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 
 
@@ -45,5 +45,6 @@ def remove_tiers(grid: TextGrid, tier_names: Set[str], logger: Optional[Logger])
 
   for tier in tiers_to_remove:
     grid.tiers.remove(tier)
+  invalidate_tier_index(grid)
 
   return None, True
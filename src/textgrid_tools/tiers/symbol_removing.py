@@ -1,5 +1,5 @@
 from logging import Logger, getLogger
-from typing import Optional, Set
+from typing import Dict, Optional, Set
 
 from textgrid import TextGrid
 
@@ -40,10 +40,15 @@ def remove_symbols(grid: TextGrid, tier_names: Set[str], text: Set[str], marks_t
   logger.debug(f"Removing marks containing only text: {' '.join(sorted(marks_text))}...")
 
   changed_anything = False
+  # the marks repeat, e.g., in phone tiers, therefore each mark is updated only once
+  updated_marks: Dict[str, str] = {}
 
   for interval in intervals:
     old_mark = get_mark(interval)
-    new_mark = get_updated_mark(old_mark, text, marks_text, marks)
+    new_mark = updated_marks.get(old_mark)
+    if new_mark is None:
+      new_mark = get_updated_mark(old_mark, text, marks_text, marks)
+      updated_marks[old_mark] = new_mark
     if new_mark != old_mark:
       logger.debug(f"Changed \"{old_mark}\" to \"{new_mark}\".")
       interval.mark = new_mark
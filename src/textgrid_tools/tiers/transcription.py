@@ -1,14 +1,13 @@
 from logging import Logger, getLogger
-from typing import Generator, Iterable, Optional, Set, cast
+from typing import Generator, Iterable, List, Optional, Set, cast
 
 from pronunciation_dictionary import PronunciationDict, get_weighted_pronunciation
 from textgrid import Interval, TextGrid
 
-from textgrid_tools.comparison import check_intervals_are_equal
 from textgrid_tools.globals import ExecutionResult
 from textgrid_tools.helper import (get_all_tiers, get_interval_readable, get_mark,
                                    interval_is_None_or_empty, set_intervals_consecutive)
-from textgrid_tools.intervals.common import replace_intervals
+from textgrid_tools.intervals.common import Replacement, rewrite_tier
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 
 
@@ -67,8 +66,10 @@ def transcribe_text(grid: TextGrid, tier_names: Set[str], pronunciation_dictiona
 
   tiers = list(get_all_tiers(grid, tier_names))
 
+  changed_anything = False
   for tier in tiers:
     intervals_copy = cast(Iterable[Interval], list(tier.intervals))
+    replacements: List[Replacement] = []
     for interval in intervals_copy:
       try:
         splitted_intervals = list(get_split_intervals(
@@ -76,9 +77,11 @@ def transcribe_text(grid: TextGrid, tier_names: Set[str], pronunciation_dictiona
       except VocabularyMissingError as error:
         return error, False
 
-      if not check_intervals_are_equal([interval], splitted_intervals):
-        replace_intervals(tier, [interval], splitted_intervals)
+      # intervals that are not transcribed are returned unchanged
+      if not (len(splitted_intervals) == 1 and splitted_intervals[0] is interval):
+        replacements.append(([interval], splitted_intervals))
         changed_anything = True
+    rewrite_tier(tier, replacements)
 
   return None, changed_anything
 
@@ -91,7 +94,7 @@ def get_split_intervals(interval: Interval, pronunciation_dictionary: Pronunciat
   mark = get_mark(interval)
   if error := VocabularyMissingError.validate(mark, pronunciation_dictionary):
     if ignore_missing:
-      if replace_missing is None:
+      if replace_missing is None or replace_missing == mark:
         logger.info(f"Kept unchanged: {get_interval_readable(interval)}")
         yield interval
         return
@@ -107,6 +110,10 @@ def get_split_intervals(interval: Interval, pronunciation_dictionary: Pronunciat
   phonemes = get_weighted_pronunciation(pronunciations, seed)
   assert len(phonemes) > 0
 
+  if len(phonemes) == 1 and phonemes[0] == mark:
+    yield interval
+    return
+
   new_intervals = [
     Interval(0, 1, phoneme)
     for phoneme in phonemes
@@ -1,13 +1,15 @@
 from collections import OrderedDict
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Tuple
 from typing import OrderedDict as ODType
 
 import numpy as np
 from ordered_set import OrderedSet
 from textgrid.textgrid import IntervalTier, TextGrid
 
-from textgrid_tools.helper import (check_is_valid_grid, get_count_of_tiers, s_to_samples,
-                                   tier_exists, timepoint_is_boundary)
+from textgrid_tools.compact_tier import CompactIntervalTier
+from textgrid_tools.helper import (check_is_valid_grid, get_closest_boundaries,
+                                   get_count_of_tiers, get_sorted_boundaries, s_to_samples,
+                                   set_tier_changed, tier_exists)
 
 
 class ValidationError(Exception):
@@ -104,34 +106,114 @@ class InvalidGridError(ValidationError):
 
 
 class BoundaryError(ValidationError):
-  def __init__(self, timepoints: OrderedSet[float], tiers: Iterable[IntervalTier], non_existent_boundaries: ODType[float, OrderedSet[str]]) -> None:
+  def __init__(self, timepoints: OrderedSet[float], tiers: List[IntervalTier], non_existent_boundaries: ODType[float, OrderedSet[str]], closest_boundaries: Dict[Tuple[float, int], Optional[float]]) -> None:
     super().__init__()
     self.timepoints = timepoints
     self.tiers = tiers
     self.non_existent_boundaries = non_existent_boundaries
+    # closest boundary of each non-existent timepoint on each tier (by the
+    # position of the tier in tiers, because tiers can have the same name)
+    self.closest_boundaries = closest_boundaries
 
   @classmethod
-  def validate(cls, timepoints: OrderedSet[float], tiers: Iterable[IntervalTier]):
-    non_existent_boundaries: ODType[float, OrderedSet[str]] = OrderedDict()
+  def validate(cls, timepoints: OrderedSet[float], tiers: Iterable[IntervalTier], epsilon: float = 0):
+    """
+    epsilon: timepoints whose distance to a boundary is at most epsilon are
+    considered to exist, e.g., to accept floating point deviations; a boundary
+    can only belong to one timepoint, see `snap_boundaries_to_timepoints`
+    """
+    assert epsilon >= 0
     tiers = list(tiers)
+    sorted_timepoints = sorted(timepoints)
+    missing_per_tier: List[Dict[float, Optional[float]]] = []
+    for tier in tiers:
+      missing: Dict[float, Optional[float]] = {}
+      closest_boundaries = list(get_closest_boundaries(
+        sorted_timepoints, get_sorted_boundaries(tier)))
+      used_boundaries = set(timepoint for timepoint, closest_boundary in zip(
+        sorted_timepoints, closest_boundaries) if closest_boundary == timepoint)
+      for timepoint, closest_boundary in zip(sorted_timepoints, closest_boundaries):
+        if closest_boundary == timepoint:
+          continue
+        if closest_boundary is None or abs(closest_boundary - timepoint) > epsilon or closest_boundary in used_boundaries:
+          missing[timepoint] = closest_boundary
+        else:
+          used_boundaries.add(closest_boundary)
+      missing_per_tier.append(missing)
+
+    non_existent_boundaries: ODType[float, OrderedSet[str]] = OrderedDict()
+    closest_boundaries_of_missing: Dict[Tuple[float, int], Optional[float]] = {}
+    all_missing = set().union(*missing_per_tier)
     for timepoint in timepoints:
-      for tier in tiers:
-        if not timepoint_is_boundary(timepoint, tier):
+      if timepoint not in all_missing:
+        continue
+      for tier_nr, (tier, missing) in enumerate(zip(tiers, missing_per_tier)):
+        if timepoint in missing:
           if timepoint not in non_existent_boundaries:
             non_existent_boundaries[timepoint] = OrderedSet()
           non_existent_boundaries[timepoint].add(tier.name)
+          closest_boundaries_of_missing[(timepoint, tier_nr)] = missing[timepoint]
     if not len(non_existent_boundaries) == 0:
-      return cls(timepoints, tiers, non_existent_boundaries)
+      return cls(timepoints, tiers, non_existent_boundaries, closest_boundaries_of_missing)
     return None
 
   @property
   def default_message(self) -> str:
     msg = "Tier(s) do not share the same interval boundaries!\n"
     msg += "Non-existent timepoints (in s) on tiers:\n"
-    for timepoint, tiers in self.non_existent_boundaries.items():
-      msg += f"- {timepoint} does not exist on {', '.join(tiers)}\n"
+    for timepoint in self.non_existent_boundaries.keys():
+      tiers_str = ", ".join(
+        self.__get_tier_str(timepoint, tier_nr)
+        for tier_nr in range(len(self.tiers))
+        if (timepoint, tier_nr) in self.closest_boundaries
+      )
+      msg += f"- {timepoint} does not exist on {tiers_str}\n"
     return msg
 
+  def __get_tier_str(self, timepoint: float, tier_nr: int) -> str:
+    tier_name = self.tiers[tier_nr].name
+    closest_boundary = self.closest_boundaries[(timepoint, tier_nr)]
+    if closest_boundary is None:
+      return tier_name
+    return f"{tier_name} (closest boundary: {closest_boundary})"
+
+
+
+def snap_boundaries_to_timepoints(timepoints: OrderedSet[float], tiers: Iterable[IntervalTier], epsilon: float) -> bool:
+  """
+  Moves the boundaries whose distance to a timepoint is at most epsilon onto
+  the timepoint, i.e., afterwards the tiers share the timepoints exactly. It
+  needs to be called only after `BoundaryError.validate` with the same epsilon
+  succeeded, which ensures that each boundary belongs to at most one timepoint.
+  Returns whether a boundary was moved.
+  """
+  assert epsilon >= 0
+  if epsilon == 0:
+    return False
+  sorted_timepoints = sorted(timepoints)
+  changed_anything = False
+  for tier in tiers:
+    closest_boundaries = get_closest_boundaries(sorted_timepoints, get_sorted_boundaries(tier))
+    moves: Dict[float, float] = {
+      closest_boundary: timepoint
+      for timepoint, closest_boundary in zip(sorted_timepoints, closest_boundaries)
+      if closest_boundary is not None and closest_boundary != timepoint and abs(closest_boundary - timepoint) <= epsilon
+    }
+    if len(moves) == 0:
+      continue
+    set_tier_changed(tier)
+    tier.minTime = moves.get(tier.minTime, tier.minTime)
+    tier.maxTime = moves.get(tier.maxTime, tier.maxTime)
+    if isinstance(tier, CompactIntervalTier):
+      tier.starts = np.array([moves.get(start, start)
+                             for start in tier.starts.tolist()], dtype=np.float64)
+      tier.ends = np.array([moves.get(end, end) for end in tier.ends.tolist()], dtype=np.float64)
+    else:
+      for interval in tier.intervals:
+        interval.minTime = moves.get(interval.minTime, interval.minTime)
+        interval.maxTime = moves.get(interval.maxTime, interval.maxTime)
+    changed_anything = True
+  return changed_anything
 
 class AudioAndGridLengthMismatchError(ValidationError):
   def __init__(self, grid: TextGrid, audio: np.ndarray, sample_rate: int) -> None:
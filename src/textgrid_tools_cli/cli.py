@@ -11,6 +11,7 @@ from time import perf_counter
 from typing import Callable, Dict, Generator, List, Tuple
 
 from textgrid_tools_cli import *
+from textgrid_tools_cli.grid_caching import set_cache_directory
 from textgrid_tools_cli.grids.audio_paths_exporting import get_audio_paths_exporting_parser
 from textgrid_tools_cli.grids.audio_paths_importing import get_audio_paths_importing_parser
 from textgrid_tools_cli.grids.boundary_comparison import get_boundary_comparison_parser
@@ -20,7 +21,8 @@ from textgrid_tools_cli.grids.grid_paths_exporting import get_grid_paths_exporti
 from textgrid_tools_cli.grids.grid_paths_importing import get_grid_paths_importing_parser
 from textgrid_tools_cli.grids.pronunciations_exporting import get_pronunciations_exporting_parser
 from textgrid_tools_cli.grids.stats_generation import get_grids_plot_stats_parser
-from textgrid_tools_cli.helper import get_optional, parse_path
+from textgrid_tools_cli.helper import (get_optional, parse_path, parse_positive_integer,
+                                       set_time_resolution)
 from textgrid_tools_cli.intervals.template_joining import get_template_joining_parser
 from textgrid_tools_cli.intervals.text_replacement import get_text_replacement_parser
 from textgrid_tools_cli.logging_configuration import (configure_root_logger, get_file_logger,
@@ -142,6 +144,12 @@ def _init_parser():
                                  nargs="?", const=None, help="path to write the log", default=default_log_path)
       logging_group.add_argument("--debug", action="store_true",
                                  help="include debugging information in log")
+      caching_group = method_parser.add_argument_group("caching arguments")
+      caching_group.add_argument("--cache", type=get_optional(parse_path), metavar="DIRECTORY",
+                                 help="directory to cache the parsed grids in; grids that weren't changed since they were cached don't need to be parsed again", default=None)
+      time_group = method_parser.add_argument_group("time arguments")
+      time_group.add_argument("--time-resolution", type=get_optional(parse_positive_integer), metavar="TICKS",
+                              help="snap all times to integer ticks of this resolution (ticks per second, e.g., the sampling rate of the audio files) when grids are loaded and saved; this way, boundaries are compared exactly", default=None)
 
   return main_parser
 
@@ -166,6 +174,8 @@ def parse_args(args: List[str]) -> None:
   if hasattr(ns, INVOKE_HANDLER_VAR):
     invoke_handler: Callable[..., ExecutionResult] = getattr(ns, INVOKE_HANDLER_VAR)
     delattr(ns, INVOKE_HANDLER_VAR)
+    set_cache_directory(ns.cache)
+    set_time_resolution(ns.time_resolution)
     log_to_file = ns.log is not None
     if log_to_file:
       log_to_file = try_init_file_logger(ns.log, local_debugging or ns.debug)
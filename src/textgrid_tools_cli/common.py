@@ -1,21 +1,46 @@
+from concurrent.futures import Future
 from functools import partial
-from logging import LogRecord, getLogger
-from math import ceil
-from multiprocessing import Pool
+from logging import LoggerAdapter, LogRecord
+from multiprocessing import Pool, SimpleQueue
 from pathlib import Path
 from time import perf_counter
-from typing import Callable, Dict, List, Optional, OrderedDict, Tuple
+from typing import Callable, Dict, List, Optional, OrderedDict, Set, Tuple, Union
 
 from textgrid import TextGrid
 from tqdm import tqdm
 
 from textgrid_tools.globals import ExecutionResult
-from textgrid_tools_cli.helper import get_grid_files, try_copy_grid, try_load_grid, try_save_grid
-from textgrid_tools_cli.logging_configuration import (StoreRecordsHandler, get_file_logger,
-                                                      init_and_get_console_logger)
+from textgrid_tools.helper import get_changed_tiers, invalidate_grid
+from textgrid_tools_cli.file_compression import get_compressed_path, read_data
+from textgrid_tools_cli.grid_caching import get_cache_directory, set_cache_directory
+from textgrid_tools_cli.helper import (files_are_equal, get_grid_files, get_time_resolution,
+                                       set_time_resolution, try_copy_grid, try_load_grid,
+                                       try_save_grid, try_save_grid_if_changed)
+from textgrid_tools_cli.io_overlap import Prefetcher, WriteBehind, get_result_or_none
+from textgrid_tools_cli.logging_configuration import (RecordsListener, get_file_logger,
+                                                      get_file_logger_level, get_grid_logger,
+                                                      init_and_get_console_logger,
+                                                      init_worker_logger, release_grid_logger)
+from textgrid_tools_cli.results_manifest import ResultsAggregator
+from textgrid_tools_cli.shards import process_shards_mp
+from textgrid_tools_cli.textgrid_io import TEXT_FORMAT
 
 
-def process_grids_mp(directory: Path, encoding: str, output_directory: Optional[Path], overwrite: bool, method: Callable[[TextGrid], ExecutionResult], chunksize: int, n_jobs: int, maxtasksperchild: Optional[int], dry_run: bool) -> ExecutionResult:
+def process_grids_mp(directory: Path, encoding: str, output_directory: Optional[Path], overwrite: bool, method: Callable[[TextGrid], ExecutionResult], chunksize: Optional[int], n_jobs: int, maxtasksperchild: Optional[int], dry_run: bool, tier_names: Optional[Set[str]] = None, output_format: str = TEXT_FORMAT, skip_unchanged: bool = False, output_compression: Optional[str] = None, manifest: Optional[Path] = None, io_threads: int = 0) -> ExecutionResult:
+  """
+  tier_names: if set, only these tiers are loaded and passed to the method; all other tiers are written back unchanged
+  skip_unchanged: if set, grids are not written/copied if the resulting file would be identical to the existing one
+  output_compression: if set, grids are written with this compression (e.g. gz); grids converted in-place replace their former file
+  directory: can also be a tar shard or a shard list, see `process_shards_mp`
+  chunksize: if None, the files are chunked by their size, see `get_chunks_by_size`
+  manifest: if set, the result of each file is written to this file as soon as it is processed, see `ResultsAggregator`
+  io_threads: if greater than zero, each worker reads its next files on this amount of threads and writes the grids on another thread; not considered for shards
+  """
+  if not directory.is_dir():
+    return process_shards_mp(directory, encoding, output_directory, overwrite, method, n_jobs,
+                             maxtasksperchild, dry_run, tier_names, output_format, skip_unchanged,
+                             output_compression, manifest)
+
   logger = init_and_get_console_logger(__name__)
   flogger = get_file_logger()
 
@@ -25,121 +50,322 @@ def process_grids_mp(directory: Path, encoding: str, output_directory: Optional[
   grid_files = get_grid_files(directory)
   logger.info(f"Found {len(grid_files)} grid file(s).")
 
-  total_success = True
-  total_changed_anything = False
+  # the method is sent once to each worker (see `__init_pool`) because it can
+  # contain large state, e.g., a pronunciation dictionary; the arguments of
+  # `imap_unordered` are sent with each chunk of files
   method_proxy = partial(
     process_grid,
-    method=method,
     encoding=encoding,
     overwrite=overwrite,
     directory=directory,
     output_directory=output_directory,
     dry_run=dry_run,
+    tier_names=tier_names,
+    output_format=output_format,
+    skip_unchanged=skip_unchanged,
+    output_compression=output_compression,
   )
 
   keys = grid_files.keys()
   # keys = list(keys)[:10]
 
+  if chunksize is None:
+    file_sizes = {key: get_file_size(directory / grid_files[key]) for key in keys}
+    target_size = get_target_chunk_size(sum(file_sizes.values()), n_jobs)
+    chunks = get_chunks_by_size(file_sizes, target_size)
+  else:
+    keys_list = list(keys)
+    chunks = [keys_list[i:i + chunksize] for i in range(0, len(keys_list), chunksize)]
+
   flogger.debug(f"Files: {len(keys)}")
-  flogger.debug(f"Chunksize: {chunksize}")
+  flogger.debug(f"Chunksize: {'auto' if chunksize is None else chunksize}")
+  flogger.debug(f"Chunks: {len(chunks)}")
   flogger.debug(f"Maxtask: {maxtasksperchild}")
   flogger.debug(f"Jobs: {n_jobs}")
 
-  amount_of_jobs_required = ceil(len(keys) / chunksize)
-  n_jobs = min(n_jobs, amount_of_jobs_required)
+  n_jobs = min(n_jobs, len(chunks))
   flogger.debug(f"Jobs (final): {n_jobs}")
 
-  with Pool(
+  # the workers send the log records of each file through the queue, see
+  # `process_grid_chunk`
+  log_queue = SimpleQueue()
+  # the results are aggregated as they arrive, i.e., the memory of the parent
+  # process doesn't grow with the number of files
+  with ResultsAggregator(manifest) as results, Pool(
     processes=n_jobs,
     initializer=__init_pool,
-    initargs=(grid_files,),
+    initargs=(grid_files, method, get_cache_directory(), get_time_resolution(),
+              log_queue, get_file_logger_level()),
     maxtasksperchild=maxtasksperchild,
   ) as pool:
-    iterator = pool.imap_unordered(method_proxy, keys, chunksize=chunksize)
-    iterator = tqdm(iterator, total=len(keys), desc="Processing", unit=" file(s)")
-    result: Dict[str, Tuple[bool, bool, List[LogRecord]]] = dict(iterator)
-
-  stored_records = (
-    record
-    for _, _, records in result.values()
-    for record in records
-  )
+    listener = RecordsListener(log_queue)
+    listener.start()
+    try:
+      chunk_proxy = partial(process_grid_chunk, process=method_proxy,
+                            directory=directory, io_threads=io_threads)
+      iterator = pool.imap_unordered(chunk_proxy, chunks, chunksize=1)
+      with tqdm(total=len(keys), desc="Processing", unit=" file(s)") as progress:
+        for chunk_result in iterator:
+          for file_stem, file_result in chunk_result:
+            results.add(file_stem, *file_result)
+          progress.update(len(chunk_result))
+    finally:
+      listener.stop()
+
+  if manifest is not None:
+    logger.info(f"Written results of {results.n_files} grid file(s) to: \"{manifest.absolute()}\"")
+
+  if skip_unchanged:
+    logger.info(
+      f"Avoided writing {results.avoided_writes} grid file(s) whose content didn't change.")
+    flogger.info(f"Avoided writes: {results.avoided_writes}")
+
+  return results.total_success, results.total_changed_anything
+
+
+# Without a chunksize, the files are dispatched largest first and small files
+# are batched into chunks of about the same total size, i.e., large files
+# don't end up at the end of the run and small files don't cause one task
+# each. A chunk contains at most TARGET_CHUNK_SIZE bytes but the chunks are
+# made smaller for small corpora, so that each job gets several chunks.
+TARGET_CHUNK_SIZE = 4 * 1024 * 1024
+MIN_CHUNKS_PER_JOB = 4
+
+
+def get_file_size(path: Path) -> int:
+  return path.stat().st_size
+
 
-  for record in stored_records:
-    flogger.handle(record)
+def get_target_chunk_size(total_size: int, n_jobs: int) -> int:
+  result = min(TARGET_CHUNK_SIZE, total_size // (n_jobs * MIN_CHUNKS_PER_JOB))
+  result = max(1, result)
+  return result
 
-  total_success = all(success for success, _, _ in result.values())
-  total_changed_anything = any(changed_anything for _, changed_anything, _ in result.values())
 
-  return total_success, total_changed_anything
+def get_chunks_by_size(file_sizes: Dict[str, int], target_size: int) -> List[List[str]]:
+  """
+  Returns the files sorted descending by their size and chunked so that each
+  chunk contains either one file that is at least target_size or files that
+  are together at most target_size; files of the same size keep their order.
+  """
+  assert target_size > 0
+  sorted_files = sorted(file_sizes.items(), key=lambda file_size: file_size[1], reverse=True)
+  result: List[List[str]] = []
+  current_chunk: List[str] = []
+  current_size = 0
+  for file, size in sorted_files:
+    if len(current_chunk) > 0 and current_size + size > target_size:
+      result.append(current_chunk)
+      current_chunk = []
+      current_size = 0
+    current_chunk.append(file)
+    current_size += size
+  if len(current_chunk) > 0:
+    result.append(current_chunk)
+  return result
+
+
+# success, changed anything, write avoided, log records
+GridResult = Tuple[bool, bool, bool, List[LogRecord]]
+
+
+def process_grid_chunk(file_stems: List[str], process: Callable[..., Tuple[str, Union[GridResult, "Future[GridResult]"]]], directory: Path, io_threads: int = 0) -> List[Tuple[str, Tuple[bool, bool, bool, float]]]:
+  """
+  Puts the log records of each file into the log queue (if it is set), i.e.,
+  the records of a file stay together and are not kept until all files are
+  processed. Returns per file: success, changed anything, write avoided and
+  the duration in seconds.
+  io_threads: if greater than zero, the next files of the chunk are read
+  ahead and the grids are written behind, see `Prefetcher` and `WriteBehind`;
+  the log records are then put into the queue after all files of the chunk
+  were written and the duration doesn't contain the writing
+  """
+  if io_threads == 0:
+    result: List[Tuple[str, Tuple[bool, bool, bool, float]]] = []
+    for file_stem in file_stems:
+      start = perf_counter()
+      _, grid_result = process(file_stem)
+      result.append(get_chunk_result(file_stem, grid_result, perf_counter() - start))
+    return result
+
+  pending: List[Tuple[str, Future, float]] = []
+  read = partial(read_grid_data, directory=directory)
+  with Prefetcher(read, io_threads) as prefetcher, WriteBehind() as writer:
+    for file_stem, data in prefetcher.iterate(file_stems):
+      start = perf_counter()
+      _, grid_result = process(file_stem, data=get_result_or_none(data), writer=writer)
+      if not isinstance(grid_result, Future):
+        grid_result = get_done_future(grid_result)
+      pending.append((file_stem, grid_result, perf_counter() - start))
+  # all writes are done
+  return [get_chunk_result(file_stem, grid_result.result(), duration)
+          for file_stem, grid_result, duration in pending]
+
+
+def get_chunk_result(file_stem: str, grid_result: GridResult, duration: float) -> Tuple[str, Tuple[bool, bool, bool, float]]:
+  global process_log_queue
+
+  success, changed_anything, write_avoided, records = grid_result
+  if process_log_queue is not None and len(records) > 0:
+    # the records are pickled on put, i.e., they aren't needed anymore
+    process_log_queue.put(records)
+    records.clear()
+  return file_stem, (success, changed_anything, write_avoided, duration)
+
+
+def get_done_future(result: GridResult) -> "Future[GridResult]":
+  future = Future()
+  future.set_result(result)
+  return future
+
+
+def read_grid_data(file_stem: str, directory: Path) -> Optional[bytes]:
+  global process_grid_files
+
+  if get_cache_directory() is not None:
+    # cached grids are not loaded from their file, see `try_load_grid`
+    return None
+  return read_data(directory / process_grid_files[file_stem])
 
 
 process_grid_files: OrderedDict[str, Path] = None
+process_method: Callable[[TextGrid], ExecutionResult] = None
+process_log_queue: Optional[SimpleQueue] = None
 
 
-def __init_pool(grid_files: OrderedDict[str, Path]) -> None:
+def __init_pool(grid_files: OrderedDict[str, Path], method: Callable[[TextGrid], ExecutionResult], cache_directory: Optional[Path], time_resolution: Optional[int], log_queue: SimpleQueue, log_level: int) -> None:
   global process_grid_files
+  global process_method
+  global process_log_queue
   process_grid_files = grid_files
+  process_method = method
+  process_log_queue = log_queue
+  init_worker_logger(log_level)
+  set_cache_directory(cache_directory)
+  set_time_resolution(time_resolution)
+
+
+def process_grid(file_stem: str, encoding: str, overwrite: bool, directory: Path, output_directory: Path, dry_run: bool, tier_names: Optional[Set[str]], output_format: str, skip_unchanged: bool, output_compression: Optional[str], data: Optional[bytes] = None, writer: Optional[WriteBehind] = None) -> Tuple[str, Union[GridResult, "Future[GridResult]"]]:
+  """
+  data: the decompressed content of the grid file if it was read ahead
+  writer: if set, the grid is written (or copied) on its thread and the future of the result is returned
+  """
+  logger, records = get_grid_logger(file_stem)
+  result = None
+  try:
+    result = process_grid_core(
+      file_stem, encoding, overwrite, directory, output_directory, dry_run, tier_names,
+      output_format, skip_unchanged, output_compression, data, writer, logger, records,
+    )
+  finally:
+    if isinstance(result, Future):
+      # the grid is written (and logged) on the thread of the writer
+      result.add_done_callback(lambda _: release_grid_logger(file_stem))
+    else:
+      release_grid_logger(file_stem)
+  return file_stem, result
 
 
-def process_grid(file_stem: str, encoding: str, overwrite: bool, method: Callable[[TextGrid], ExecutionResult], directory: Path, output_directory: Path, dry_run: bool) -> Tuple[str, Tuple[bool, bool, List[LogRecord]]]:
+def process_grid_core(file_stem: str, encoding: str, overwrite: bool, directory: Path, output_directory: Path, dry_run: bool, tier_names: Optional[Set[str]], output_format: str, skip_unchanged: bool, output_compression: Optional[str], data: Optional[bytes], writer: Optional[WriteBehind], logger: LoggerAdapter, records: List[LogRecord]) -> Union[GridResult, "Future[GridResult]"]:
   global process_grid_files
+  global process_method
 
   start = perf_counter()
-  handler = StoreRecordsHandler()
-  logger = getLogger(file_stem)
-  logger.propagate = False
-  logger.addHandler(handler)
-
   logger.info(f"Processing \"{file_stem}\"")
 
   rel_path = process_grid_files[file_stem]
-  grid_file_out_abs = output_directory / rel_path
+  grid_file_out_abs = output_directory / get_compressed_path(rel_path, output_compression)
 
   if grid_file_out_abs.exists() and not overwrite:
     logger.info("Grid already exists. Skipped.")
     logger.debug(f"Duration (s): {perf_counter() - start}")
-    return file_stem, (True, False, handler.records)
+    return True, False, False, records
 
   grid_file_in_abs = directory / rel_path
 
-  error, grid = try_load_grid(grid_file_in_abs, encoding)
+  error, grid = try_load_grid(grid_file_in_abs, encoding, tier_names, data=data)
 
   if error:
     logger.debug(error.exception)
     logger.error(error.default_message)
     logger.debug(f"Duration (s): {perf_counter() - start}")
-    return file_stem, (False, False, handler.records)
+    return False, False, False, records
   assert grid is not None
 
-  error, changed_anything = method(grid, logger=logger)
-  success = error is None
+  error, changed_anything = process_method(grid, logger=logger)
 
-  if not success:
+  if error is not None:
     logger.error(error.default_message)
     logger.info("Skipped.")
     assert not changed_anything
-  else:
-    logger.info("Applied operations successfully.")
-    if dry_run:
-      logger.info(f"DRY RUN, therefore didn't saved grid to \"{grid_file_out_abs.absolute()}\".")
-    else:
-      if changed_anything:
-        error = try_save_grid(grid_file_out_abs, grid, encoding)
-        if error:
-          logger.debug(error.exception)
-          logger.error(error.default_message)
-          logger.debug(f"Duration (s): {perf_counter() - start}")
-          return file_stem, (False, False, handler.records)
-        logger.info(f"Saved the grid to: \"{grid_file_out_abs.absolute()}\"")
-      elif directory != output_directory:
-        logger.info("Didn't changed anything.")
-        error = try_copy_grid(grid_file_in_abs, grid_file_out_abs)
-        if error:
-          logger.error(error.default_message, exc_info=error.exception)
-        else:
-          logger.info(f"Copied the grid to: \"{grid_file_out_abs.absolute()}\"")
+    del grid
+    logger.debug(f"Duration (s): {perf_counter() - start}")
+    return False, False, False, records
+
+  logger.info("Applied operations successfully.")
+  # the helpers that changed the grid recorded it on the changed tiers
+  changed_tiers = get_changed_tiers(grid)
+  if len(changed_tiers) > 0:
+    logger.debug(f"Changed tier(s): {', '.join(str(tier.name) for tier in changed_tiers)}")
+    changed_anything = True
 
+  if dry_run:
+    logger.info(f"DRY RUN, therefore didn't saved grid to \"{grid_file_out_abs.absolute()}\".")
+    del grid
+    logger.debug(f"Duration (s): {perf_counter() - start}")
+    return True, changed_anything, False, records
+
+  write = partial(
+    write_grid, grid, changed_anything, grid_file_in_abs, grid_file_out_abs, directory,
+    output_directory, encoding, output_format, skip_unchanged, logger, records, start,
+  )
   del grid
+  if writer is None:
+    return write()
+  return writer.submit(write)
+
+
+def write_grid(grid: TextGrid, changed_anything: bool, grid_file_in_abs: Path, grid_file_out_abs: Path, directory: Path, output_directory: Path, encoding: str, output_format: str, skip_unchanged: bool, logger: LoggerAdapter, records: List[LogRecord], start: float) -> GridResult:
+  write_avoided = False
+  if changed_anything:
+    # the method might have changed the tiers without invalidating their validity
+    invalidate_grid(grid)
+    if skip_unchanged:
+      error, write_avoided = try_save_grid_if_changed(
+        grid_file_out_abs, grid, encoding, output_format)
+    else:
+      error = try_save_grid(grid_file_out_abs, grid, encoding, output_format)
+    if error:
+      logger.debug(error.exception)
+      logger.error(error.default_message)
+      logger.debug(f"Duration (s): {perf_counter() - start}")
+      return False, False, False, records
+    if write_avoided:
+      logger.info("Output is identical to the existing grid file, therefore didn't save it.")
+      changed_anything = False
+    else:
+      logger.info(f"Saved the grid to: \"{grid_file_out_abs.absolute()}\"")
+      if grid_file_out_abs != grid_file_in_abs and directory == output_directory:
+        remove_converted_grid_file(grid_file_in_abs, logger)
+  elif grid_file_out_abs != grid_file_in_abs:
+    logger.info("Didn't changed anything.")
+    if skip_unchanged and files_are_equal(grid_file_in_abs, grid_file_out_abs):
+      logger.info("Grid file exists already with the same content, therefore didn't copy it.")
+      write_avoided = True
+    else:
+      error = try_copy_grid(grid_file_in_abs, grid_file_out_abs, encoding)
+      if error:
+        logger.error(error.default_message, exc_info=error.exception)
+      else:
+        logger.info(f"Copied the grid to: \"{grid_file_out_abs.absolute()}\"")
+        if directory == output_directory:
+          remove_converted_grid_file(grid_file_in_abs, logger)
+
   logger.debug(f"Duration (s): {perf_counter() - start}")
-  return file_stem, (success, changed_anything, handler.records)
+  return True, changed_anything, write_avoided, records
+
+
+def remove_converted_grid_file(path: Path, logger: LoggerAdapter) -> None:
+  # the grid was written in-place with another compression
+  path.unlink()
+  logger.info(f"Removed the former grid file: \"{path.absolute()}\"")
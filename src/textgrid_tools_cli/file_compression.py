@@ -0,0 +1,103 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Dict, Optional
+
+# Compressed grid files are recognized by an additional file extension, e.g.,
+# ".TextGrid.gz". All supported modules provide the same interface: open,
+# compress and decompress.
+COMPRESSIONS: Dict[str, ModuleType] = {
+  ".gz": gzip,
+  ".bz2": bz2,
+  ".xz": lzma,
+}
+
+try:
+  # Python >= 3.14
+  from compression import zstd
+except ImportError:
+  try:
+    import zstandard as zstd
+  except ImportError:
+    zstd = None
+
+if zstd is not None:
+  COMPRESSIONS[".zst"] = zstd
+
+# the defaults of gzip (9) and lzma (6) are very slow at a small gain in size
+COMPRESSION_OPTIONS: Dict[str, Dict[str, int]] = {
+  ".gz": {"compresslevel": 6},
+  ".xz": {"preset": 1},
+}
+
+NO_COMPRESSION = "none"
+OUTPUT_COMPRESSIONS = (NO_COMPRESSION,) + tuple(ext[1:] for ext in COMPRESSIONS)
+
+
+def get_compression(path: Path) -> Optional[str]:
+  """
+  Returns the file extension of the compression of path, e.g., ".gz".
+  """
+  suffix = path.suffix.lower()
+  if suffix in COMPRESSIONS:
+    return suffix
+  return None
+
+
+def remove_compression(path: Path) -> Path:
+  if get_compression(path) is None:
+    return path
+  return path.with_suffix("")
+
+
+def get_compressed_path(path: Path, output_compression: Optional[str]) -> Path:
+  """
+  Returns the path with the file extension of output_compression; None keeps
+  the current compression.
+  """
+  if output_compression is None:
+    return path
+  result = remove_compression(path)
+  if output_compression != NO_COMPRESSION:
+    result = result.with_name(f"{result.name}.{output_compression}")
+  return result
+
+
+def open_file(path: Path, mode: str, encoding: Optional[str] = None, buffering: int = -1) -> IO:
+  compression = get_compression(path)
+  if compression is None:
+    return open(path, mode, encoding=encoding, buffering=buffering)
+  options = COMPRESSION_OPTIONS.get(compression, {}) if "w" in mode else {}
+  return COMPRESSIONS[compression].open(path, mode, encoding=encoding, **options)
+
+
+def read_data(path: Path) -> bytes:
+  with open(path, "rb") as f:
+    data = f.read()
+  return decompress_data(path, data)
+
+
+def write_data(path: Path, data: bytes) -> None:
+  data = compress_data(path, data)
+  with open(path, "wb") as f:
+    f.write(data)
+
+
+def decompress_data(path: Path, data: bytes) -> bytes:
+  """
+  Decompresses data according to the compression of path, e.g., for members
+  of a shard.
+  """
+  compression = get_compression(path)
+  if compression is None:
+    return data
+  return COMPRESSIONS[compression].decompress(data)
+
+
+def compress_data(path: Path, data: bytes) -> bytes:
+  compression = get_compression(path)
+  if compression is None:
+    return data
+  return COMPRESSIONS[compression].compress(data, **COMPRESSION_OPTIONS.get(compression, {}))
@@ -7,8 +7,9 @@ from textgrid_tools.globals import ChangedAnything
 
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_N_JOBS = cpu_count()
-DEFAULT_N_FILE_CHUNKSIZE = 1
+DEFAULT_N_FILE_CHUNKSIZE = None
 DEFAULT_MAXTASKSPERCHILD = None
+DEFAULT_IO_THREADS = 0
 DEFAULT_PUNCTUATION = list(OrderedSet(sorted((
   "!", "\"", "#", "$", "%", "&", "'", "(", ")", "*", "+", ",", "-", ".", "/", ":", ";", "<", "=", ">", "?", "@", "[", "\\", "]", "{", "}", "~", "`",
   "、", "。", "？", "！", "：", "；", "।", "¿", "¡", "【", "】", "，", "…", "‥", "「", "」", "『", "』", "〝", "〟", "″", "⟨", "⟩", "♪", "・", "‹", "›", "«", "»", "～", "′", "“", "”"
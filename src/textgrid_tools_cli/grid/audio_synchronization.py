@@ -5,10 +5,10 @@ from tqdm import tqdm
 from textgrid_tools import sync_grid_to_audio
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
-                                       get_audio_files, get_grid_files, get_optional,
-                                       parse_existing_directory, read_audio, try_copy_grid,
-                                       try_load_grid, try_save_grid)
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, get_audio_files, get_grid_files,
+                                       get_optional, parse_existing_directory, read_audio,
+                                       try_copy_grid, try_load_grid, try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
 
@@ -20,6 +20,7 @@ def get_audio_synchronization_parser(parser: ArgumentParser):
   add_encoding_argument(parser)
   add_output_directory_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   return app_sync_grid_to_audio
 
 
@@ -83,7 +84,7 @@ def app_sync_grid_to_audio(ns: Namespace) -> ExecutionResult:
       continue
 
     if changed_anything:
-      error = try_save_grid(grid_file_out_abs, grid, ns.encoding)
+      error = try_save_grid(grid_file_out_abs, grid, ns.encoding, ns.output_format)
       if error is not None:
         flogger.debug(error.exception)
         flogger.error(error.default_message)
@@ -91,7 +92,7 @@ def app_sync_grid_to_audio(ns: Namespace) -> ExecutionResult:
         total_success = False
         continue
     elif ns.directory != output_directory:
-      error = try_copy_grid(grid_file_in_abs, grid_file_out_abs)
+      error = try_copy_grid(grid_file_in_abs, grid_file_out_abs, ns.encoding)
       if error is not None:
         flogger.debug(error.exception)
         flogger.error(error.default_message)
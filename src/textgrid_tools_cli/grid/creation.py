@@ -5,9 +5,9 @@ from tqdm import tqdm
 from textgrid_tools import create_grid_from_text
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
-                                       get_audio_files, get_files_dict, get_optional,
-                                       get_text_files, parse_existing_directory,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, get_audio_files, get_files_dict,
+                                       get_optional, get_text_files, parse_existing_directory,
                                        parse_non_empty_or_whitespace, parse_positive_float,
                                        read_audio, try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
@@ -32,6 +32,7 @@ def get_creation_parser(parser: ArgumentParser):
                       help="the speech rate (characters per second) which should be used to calculate the duration of the grids if no corresponding audio file exists")
   add_output_directory_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   return app_create_grid_from_text
 
 
@@ -116,7 +117,7 @@ def app_create_grid_from_text(ns: Namespace) -> ExecutionResult:
       flogger.info("Skipped.")
       continue
 
-    error = try_save_grid(grid_file_out_abs, grid, ns.encoding)
+    error = try_save_grid(grid_file_out_abs, grid, ns.encoding, ns.output_format)
     if error is not None:
       flogger.debug(error.exception)
       flogger.error(error.default_message)
@@ -7,7 +7,8 @@ from tqdm import tqdm
 from textgrid_tools import split_grid_on_intervals
 from textgrid_tools.helper import number_prepend_zeros
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
+from textgrid_tools_cli.helper import (add_boundary_epsilon_argument, add_directory_argument,
+                                       add_encoding_argument, add_output_format_argument,
                                        add_overwrite_argument, add_tier_argument, get_audio_files,
                                        get_grid_files, get_optional, parse_existing_directory,
                                        parse_path, save_audio, try_load_grid, try_save_grid)
@@ -28,8 +29,10 @@ def get_splitting_parser(parser: ArgumentParser):
                       help="directory where to output the grids and audios if not to the same directory")
   parser.add_argument("--output-audio-directory", metavar='OUTPUT-AUDIO-PATH', type=get_optional(parse_path),
                       help="directory where to output the modified audios if not to directory")
+  add_boundary_epsilon_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   return app_split_grid_on_intervals
 
 
@@ -96,7 +99,7 @@ def app_split_grid_on_intervals(ns: Namespace) -> ExecutionResult:
       sample_rate, audio = read(audio_file_in_abs)
 
     (error, changed_anything), grids_audios = split_grid_on_intervals(
-      grid, audio, sample_rate, ns.tier, ns.include_empty, flogger)
+      grid, audio, sample_rate, ns.tier, ns.include_empty, flogger, ns.boundary_epsilon)
 
     success = error is None
     total_success &= success
@@ -114,7 +117,7 @@ def app_split_grid_on_intervals(ns: Namespace) -> ExecutionResult:
       if grid_file_out_abs.exists() and not ns.overwrite:
         flogger.info(f"Grid {file_nr} already exists. Skipped.")
       else:
-        error = try_save_grid(grid_file_out_abs, new_grid, ns.encoding)
+        error = try_save_grid(grid_file_out_abs, new_grid, ns.encoding, ns.output_format)
         if error is not None:
           flogger.debug(error.exception)
           flogger.error(error.default_message)
@@ -0,0 +1,221 @@
+import os
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from textgrid import Interval, IntervalTier, Point, PointTier, TextGrid
+
+from textgrid_tools_cli.textgrid_io import get_unparsed_tiers, read_file_faster
+
+# Parsed grids are cached in a directory as one .npz file per grid file. The
+# tiers are stored columnar: float64 arrays for the times and per tier a table
+# of the distinct marks together with the index of each mark into this table.
+# Strings (the table and the tier names) are stored as one UTF-8 encoded byte
+# array with the offsets of the strings, see `get_string_blob`.
+# An entry is only valid if the size and the modification time of the grid
+# file (and the encoding used for decoding it) didn't change since the entry
+# was written.
+CACHE_VERSION = 2
+CACHE_FILE_TYPE = ".npz"
+
+INTERVAL_TIER = 0
+POINT_TIER = 1
+
+cache_directory: Optional[Path] = None
+
+
+def set_cache_directory(directory: Optional[Path]) -> None:
+  global cache_directory
+  cache_directory = directory
+
+
+def get_cache_directory() -> Optional[Path]:
+  return cache_directory
+
+
+def get_cache_path(directory: Path, path: Path) -> Path:
+  key = sha1(str(path.absolute()).encode("utf-8")).hexdigest()
+  return directory / f"{key}{CACHE_FILE_TYPE}"
+
+
+def load_grid_cached(path: Path, encoding: str) -> TextGrid:
+  """
+  Returns the grid from the cache; on a miss the file is parsed and the
+  result is written to the cache.
+  """
+  assert cache_directory is not None
+  stat = os.stat(path)
+  cache_path = get_cache_path(cache_directory, path)
+  grid = try_read_cache_entry(cache_path, path, encoding, stat)
+  if grid is None:
+    grid = read_file_faster(path, encoding)
+    write_cache_entry(cache_path, path, encoding, stat, grid)
+  return grid
+
+
+def update_cache(path: Path, grid: TextGrid, encoding: str) -> None:
+  """
+  Writes the grid that was just saved to path to the cache, so that the next
+  command doesn't need to parse the file again.
+  """
+  assert cache_directory is not None
+  if len(get_unparsed_tiers(grid)) > 0:
+    return
+  stat = os.stat(path)
+  cache_path = get_cache_path(cache_directory, path)
+  write_cache_entry(cache_path, path, encoding, stat, get_grid_as_written(grid))
+
+
+def copy_cache_entry(path_in: Path, path_out: Path, encoding: str) -> None:
+  assert cache_directory is not None
+  cache_path_in = get_cache_path(cache_directory, path_in)
+  grid = try_read_cache_entry(cache_path_in, path_in, encoding, os.stat(path_in))
+  if grid is not None:
+    cache_path_out = get_cache_path(cache_directory, path_out)
+    write_cache_entry(cache_path_out, path_out, encoding, os.stat(path_out), grid)
+
+
+def try_read_cache_entry(cache_path: Path, path: Path, encoding: str, stat: os.stat_result) -> Optional[TextGrid]:
+  if not cache_path.is_file():
+    return None
+  try:
+    with np.load(cache_path, allow_pickle=False) as entry:
+      if not entry_is_valid(entry, path, encoding, stat):
+        return None
+      return get_grid_from_columns(dict(entry))
+  except Exception:
+    # corrupt or incompatible entry -> parse the file
+    return None
+
+
+def entry_is_valid(entry: np.lib.npyio.NpzFile, path: Path, encoding: str, stat: os.stat_result) -> bool:
+  version, size, mtime_ns = entry["source"].tolist()
+  return version == CACHE_VERSION \
+      and size == stat.st_size \
+      and mtime_ns == stat.st_mtime_ns \
+      and str(entry["encoding"]) == encoding.lower() \
+      and str(entry["path"]) == str(path.absolute())
+
+
+def write_cache_entry(cache_path: Path, path: Path, encoding: str, stat: os.stat_result, grid: TextGrid) -> None:
+  columns = get_columns(grid)
+  columns["source"] = np.array([CACHE_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+  columns["encoding"] = np.array(encoding.lower())
+  columns["path"] = np.array(str(path.absolute()))
+  tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+  try:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, "wb") as f:
+      np.savez(f, **columns)
+    os.replace(tmp_path, cache_path)
+  except OSError:
+    # the cache is optional, i.e., the grid is parsed again next time
+    tmp_path.unlink(missing_ok=True)
+
+
+def get_columns(grid: TextGrid) -> Dict[str, np.ndarray]:
+  result = {
+    "grid_times": np.array([grid.minTime, grid.maxTime], dtype=np.float64),
+    "tier_types": np.array([
+      INTERVAL_TIER if isinstance(tier, IntervalTier) else POINT_TIER
+      for tier in grid.tiers
+    ], dtype=np.int8),
+  }
+  result["tier_names"], result["tier_names_offsets"] = get_string_blob(
+    [tier.name for tier in grid.tiers])
+  for tier_nr, tier in enumerate(grid.tiers):
+    if isinstance(tier, IntervalTier):
+      result[f"{tier_nr}_times"] = np.array([tier.minTime, tier.maxTime], dtype=np.float64)
+      result[f"{tier_nr}_starts"] = np.array([i.minTime for i in tier.intervals], dtype=np.float64)
+      result[f"{tier_nr}_ends"] = np.array([i.maxTime for i in tier.intervals], dtype=np.float64)
+      marks = [i.mark for i in tier.intervals]
+    else:
+      result[f"{tier_nr}_starts"] = np.array([p.time for p in tier.points], dtype=np.float64)
+      marks = [p.mark for p in tier.points]
+    table, indices = get_string_table(marks)
+    result[f"{tier_nr}_table"], result[f"{tier_nr}_table_offsets"] = get_string_blob(table)
+    result[f"{tier_nr}_marks"] = indices
+  return result
+
+
+def get_string_table(marks: List[str]) -> Tuple[List[str], np.ndarray]:
+  table: Dict[str, int] = {}
+  indices = [table.setdefault(mark, len(table)) for mark in marks]
+  return list(table.keys()), np.array(indices, dtype=np.int32)
+
+
+def get_string_blob(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+  """
+  Returns the UTF-8 encoded strings concatenated as uint8 array and the
+  offsets of the strings in it (one more than strings). Unlike a numpy string
+  array, the strings are not padded to the longest one and keep trailing null
+  characters.
+  """
+  encoded = [string.encode("utf-8", "surrogatepass") for string in strings]
+  offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+  offsets[1:] = np.cumsum([len(string) for string in encoded], dtype=np.int64)
+  blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+  return blob, offsets
+
+
+def get_strings_from_blob(blob: np.ndarray, offsets: np.ndarray) -> List[str]:
+  data = blob.tobytes()
+  positions = offsets.tolist()
+  return [
+    data[start:end].decode("utf-8", "surrogatepass")
+    for start, end in zip(positions, positions[1:])
+  ]
+
+
+def get_grid_from_columns(columns: Dict[str, np.ndarray]) -> TextGrid:
+  min_time, max_time = columns["grid_times"].tolist()
+  result = TextGrid(None, min_time, max_time)
+  tier_types = columns["tier_types"].tolist()
+  tier_names = get_strings_from_blob(columns["tier_names"], columns["tier_names_offsets"])
+  for tier_nr, (name, tier_type) in enumerate(zip(tier_names, tier_types)):
+    table = get_strings_from_blob(columns[f"{tier_nr}_table"], columns[f"{tier_nr}_table_offsets"])
+    marks = [table[index] for index in columns[f"{tier_nr}_marks"].tolist()]
+    starts = columns[f"{tier_nr}_starts"].tolist()
+    if tier_type == INTERVAL_TIER:
+      tier_min_time, tier_max_time = columns[f"{tier_nr}_times"].tolist()
+      tier = IntervalTier(name, tier_min_time, tier_max_time)
+      tier.intervals.extend(
+        Interval(start, end, mark)
+        for start, end, mark in zip(starts, columns[f"{tier_nr}_ends"].tolist(), marks)
+      )
+    else:
+      tier = PointTier(name)
+      tier.points.extend(Point(time, mark) for time, mark in zip(starts, marks))
+    result.append(tier)
+  return result
+
+
+def get_grid_as_written(grid: TextGrid) -> TextGrid:
+  """
+  Returns the grid as it is read from the file that `save_file_faster` writes,
+  i.e., with the maximum time of the grid applied to all tiers, filled gaps
+  and without null intervals.
+  """
+  max_time = grid.maxTime
+  if not max_time:
+    max_time = max(t.maxTime if t.maxTime else t[-1].maxTime for t in grid.tiers)
+  result = TextGrid(None, float(grid.minTime), float(max_time))
+  for tier in grid.tiers:
+    if isinstance(tier, IntervalTier):
+      result_tier = IntervalTier(tier.name, float(tier.minTime), float(max_time))
+      prev_time = tier.minTime
+      for interval in tier.intervals:
+        if prev_time < interval.minTime:
+          result_tier.intervals.append(Interval(float(prev_time), float(interval.minTime), ""))
+        if interval.minTime < interval.maxTime:
+          result_tier.intervals.append(
+            Interval(float(interval.minTime), float(interval.maxTime), interval.mark or ""))
+        prev_time = interval.maxTime
+      if tier.maxTime is not None and prev_time < tier.maxTime:
+        result_tier.intervals.append(Interval(float(prev_time), float(tier.maxTime), ""))
+    else:
+      result_tier = PointTier(tier.name)
+      result_tier.points.extend(Point(float(p.time), p.mark or "") for p in tier.points)
+    result.tiers.append(result_tier)
+  return result
@@ -1,6 +1,5 @@
 import math
 from argparse import ArgumentParser, Namespace
-from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List
 from typing import OrderedDict as OrderedDictType
@@ -12,12 +11,12 @@ from tqdm import tqdm
 
 from textgrid_tools.grids.durations_labelling import label_durations
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (GRID_FILE_TYPE, ConvertToOrderedSetAction,
+from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_boundary_epsilon_argument,
                                        add_directory_argument, add_encoding_argument,
-                                       add_overwrite_argument, get_files_in_folder, get_grid_files,
-                                       get_subfolders, parse_non_empty_or_whitespace,
-                                       parse_non_negative_float, parse_positive_integer,
-                                       try_load_grid, try_save_grid)
+                                       add_output_format_argument, add_overwrite_argument,
+                                       get_grid_files, get_grid_files_in_folder, get_subfolders,
+                                       parse_non_empty_or_whitespace, parse_non_negative_float,
+                                       parse_positive_integer, try_load_grid, try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
 
@@ -44,8 +43,10 @@ def get_grids_label_durations_parser(parser: ArgumentParser):
                       help="exclusive maximum; on percent/percentile in range (0, inf)", default=math.inf)
   parser.add_argument("--min-count", type=parse_positive_integer, metavar="MIN-COUNT",
                       help="minimum count of a mark to occur (total occurrence in SCOPE, i.e., independent of range) before MARK will be assigned if RANGE-MODE is not absolute: on MARKS-MODE \"separate\" -> each mark is counted independently; on MARKS-MODE \"all\": all marks are counted together. This is useful if a mark only occurs once and MAX-VALUE is \"inf\" and in that case the mark should not be assigned then MIN-COUNT could be set to \"2\".", default=1)
+  add_boundary_epsilon_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   # add_output_directory_argument(parser)
   return app_label_durations
 
@@ -54,12 +55,7 @@ def app_label_durations(ns: Namespace) -> ExecutionResult:
   logger = init_and_get_console_logger(__name__)
   flogger = get_file_logger()
 
-  resulting_files = (f for f in get_files_in_folder(
-    ns.directory) if f.suffix.lower() == GRID_FILE_TYPE.lower())
-  resulting_files = OrderedDict(sorted(
-    (str(file.relative_to(ns.directory).parent / file.stem), file.relative_to(ns.directory))
-      for file in resulting_files
-  ))
+  resulting_files = get_grid_files_in_folder(ns.directory)
 
   grids_to_groups: Dict[str, OrderedDictType[str, Path]] = {}
   if len(resulting_files) > 0:
@@ -94,7 +90,7 @@ def app_label_durations(ns: Namespace) -> ExecutionResult:
       loaded_grids[group_name].append(grid)
 
   error, changed_anything = label_durations(loaded_grids, ns.tier, ns.assign_tier, ns.assign,
-                                            ns.scope, ns.selection, ns.range_mode, ns.marks_mode, ns.range_min, ns.range_max, ns.min_count, flogger)
+                                            ns.scope, ns.selection, ns.range_mode, ns.marks_mode, ns.range_min, ns.range_max, ns.min_count, flogger, ns.boundary_epsilon)
 
   success = error is None
 
@@ -117,7 +113,7 @@ def app_label_durations(ns: Namespace) -> ExecutionResult:
           grid_file_in_abs = ns.directory / group_name / rel_path
         if grid_changed:
           changed_any_file = True
-          error = try_save_grid(grid_file_in_abs, grid, ns.encoding)
+          error = try_save_grid(grid_file_in_abs, grid, ns.encoding, ns.output_format)
           if error:
             logger.debug(error.exception)
             logger.error(error.default_message)
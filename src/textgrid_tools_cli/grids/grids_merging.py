@@ -7,8 +7,9 @@ from tqdm import tqdm
 from textgrid_tools.grids.grid_merging import merge_grids
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
-                                       get_grid_files, get_optional, parse_path,
-                                       parse_positive_float, try_load_grid, try_save_grid)
+                                       add_output_format_argument, get_grid_files, get_optional,
+                                       parse_path, parse_positive_float, try_load_grid,
+                                       try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
 
@@ -22,6 +23,7 @@ def get_grids_merging_parser(parser: ArgumentParser) -> Callable:
   parser.add_argument(
     "--insert-mark", type=str, help="set this mark in the inserted interval (only if insert-duration > 0)", metavar="MARK", default="")
   add_encoding_argument(parser)
+  add_output_format_argument(parser)
   return merge_grids_app
 
 
@@ -62,7 +64,7 @@ def merge_grids_app(ns: Namespace) -> ExecutionResult:
     return False, False
 
   logger.info("Saving grid...")
-  error = try_save_grid(ns.output, merged_grid, ns.encoding)
+  error = try_save_grid(ns.output, merged_grid, ns.encoding, ns.output_format)
   if error is not None:
     flogger.debug(error.exception)
     flogger.error(error.default_message)
@@ -9,12 +9,13 @@ from pronunciation_dictionary import PronunciationDict, SerializationOptions, sa
 from textgrid import TextGrid
 from tqdm import tqdm
 
+from textgrid_tools.compact_tier import MarkTable
 from textgrid_tools.grids.dictionary_exporting import create_dictionaries
 from textgrid_tools.validation import ValidationError
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (GRID_FILE_TYPE, ConvertToOrderedSetAction,
+from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_boundary_epsilon_argument,
                                        add_directory_argument, add_encoding_argument,
-                                       get_files_in_folder, get_grid_files, get_subfolders,
+                                       get_grid_files, get_grid_files_in_folder, get_subfolders,
                                        parse_non_empty_or_whitespace, try_load_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
@@ -32,6 +33,7 @@ def get_pronunciations_exporting_parser(parser: ArgumentParser):
                       metavar="SCOPE", help="scope for creation of dictionary file(s): folder -> consider all files of the subfolders together; all -> consider all files together", default="all")
   parser.add_argument("--ignore", type=str, metavar="MARK", nargs="*",
                       help="ignore intervals in the WORDS-TIER containing these marks", default=OrderedSet(("",)), action=ConvertToOrderedSetAction)
+  add_boundary_epsilon_argument(parser)
   add_encoding_argument(parser)
   return app_create_dictionary
 
@@ -40,12 +42,7 @@ def app_create_dictionary(ns: Namespace) -> ExecutionResult:
   logger = init_and_get_console_logger(__name__)
   flogger = get_file_logger()
 
-  resulting_files = (f for f in get_files_in_folder(
-    ns.directory) if f.suffix.lower() == GRID_FILE_TYPE.lower())
-  resulting_files = OrderedDict(sorted(
-    (str(file.relative_to(ns.directory).parent / file.stem), file.relative_to(ns.directory))
-      for file in resulting_files
-  ))
+  resulting_files = get_grid_files_in_folder(ns.directory)
 
   grids_to_groups: Dict[str, OrderedDictType[str, Path]] = {}
   if len(resulting_files) > 0:
@@ -57,6 +54,8 @@ def app_create_dictionary(ns: Namespace) -> ExecutionResult:
     grids_to_groups[subfolder_name] = get_grid_files(subfolder)
 
   loaded_grids: Dict[str, List[TextGrid]] = {}
+  # the grids are only read, therefore their tiers are kept compact in memory
+  mark_table = MarkTable()
   loaded_successful = True
   logger.info("Reading files...")
   for group_name, grids in tqdm(grids_to_groups.items()):
@@ -66,7 +65,7 @@ def app_create_dictionary(ns: Namespace) -> ExecutionResult:
         grid_file_in_abs = ns.directory / rel_path
       else:
         grid_file_in_abs = ns.directory / group_name / rel_path
-      error, grid = try_load_grid(grid_file_in_abs, ns.encoding)
+      error, grid = try_load_grid(grid_file_in_abs, ns.encoding, mark_table=mark_table)
 
       if error:
         flogger.debug(error.exception)
@@ -85,7 +84,7 @@ def app_create_dictionary(ns: Namespace) -> ExecutionResult:
     return loaded_successful, False
 
   error, result = create_dictionaries(
-    loaded_grids, ns.words_tier, ns.pronunciations_tier, ns.scope, ns.ignore, flogger)
+    loaded_grids, ns.words_tier, ns.pronunciations_tier, ns.scope, ns.ignore, flogger, ns.boundary_epsilon)
 
   success = error is None
 
@@ -6,6 +6,7 @@ from typing import List, cast
 from textgrid import TextGrid
 from tqdm import tqdm
 
+from textgrid_tools.compact_tier import MarkTable
 from textgrid_tools.grids.stats_generation import print_stats
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
@@ -50,10 +51,12 @@ def app_plot_stats(ns: Namespace) -> ExecutionResult:
     return False, False
 
   grids: List[TextGrid] = []
+  # the grids are only read, therefore their tiers are kept compact in memory
+  mark_table = MarkTable()
   for file_nr, (file_stem, rel_path) in enumerate(tqdm(grid_files.items()), start=1):
     flogger.info(f"Processing {file_stem}")
     grid_file_in_abs = ns.directory / rel_path
-    error, grid = try_load_grid(grid_file_in_abs, ns.encoding)
+    error, grid = try_load_grid(grid_file_in_abs, ns.encoding, mark_table=mark_table)
 
     if error:
       flogger.debug(error.exception)
@@ -1,6 +1,5 @@
 from argparse import ArgumentParser, Namespace
 from collections import Counter
-from itertools import chain
 from logging import Logger
 from typing import Callable, List, Optional, Set, Tuple
 
@@ -8,7 +7,8 @@ from ordered_set import OrderedSet
 from textgrid import TextGrid
 from tqdm import tqdm
 
-from textgrid_tools.helper import get_all_intervals
+from textgrid_tools.compact_tier import MarkTable, count_marks
+from textgrid_tools.helper import get_all_tiers
 from textgrid_tools.validation import InvalidGridError, NotExistingTierError, ValidationError
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (ConvertToSetAction, add_directory_argument,
@@ -37,10 +37,12 @@ def get_vocabulary_parsed(ns: Namespace) -> ExecutionResult:
   grid_files = get_grid_files(ns.directory)
 
   grids: List[TextGrid] = []
+  # the grids are only read, therefore their tiers are kept compact in memory
+  mark_table = MarkTable()
   for file_nr, (file_stem, rel_path) in enumerate(tqdm(grid_files.items(), desc="Reading grids", unit=" file(s)"), start=1):
     flogger.info(f"Processing {file_stem}")
     grid_file_in_abs = ns.directory / rel_path
-    error, grid = try_load_grid(grid_file_in_abs, ns.encoding)
+    error, grid = try_load_grid(grid_file_in_abs, ns.encoding, mark_table=mark_table)
 
     if error:
       flogger.debug(error.exception)
@@ -86,7 +88,6 @@ def get_vocabulary(grids: List[TextGrid], tier_names: Set[str], ignore: Set[str]
   assert len(grids) > 0
   assert len(tier_names) > 0
 
-  all_intervals = None
   for grid in grids:
     if error := InvalidGridError.validate(grid):
       return error, None
@@ -95,13 +96,10 @@ def get_vocabulary(grids: List[TextGrid], tier_names: Set[str], ignore: Set[str]
       if error := NotExistingTierError.validate(grid, tier_name):
         return error, None
 
-    intervals = get_all_intervals(grid, tier_names)
-    if all_intervals is None:
-      all_intervals = intervals
-    else:
-      all_intervals = chain(all_intervals, intervals)
-  all_marks_counter = Counter(interval.mark for interval in tqdm(
-    all_intervals, desc="Parsing intervals", unit=" interval(s)"))
+  # the marks of the (compact) tiers are counted by their index in the mark table
+  all_marks_counter = Counter()
+  for grid in tqdm(grids, desc="Counting marks", unit=" grid(s)"):
+    all_marks_counter.update(count_marks(get_all_tiers(grid, tier_names)))
   flogger = get_file_logger()
 
   flogger.info("Occurrences:")
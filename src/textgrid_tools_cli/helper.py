@@ -5,6 +5,7 @@ import os
 import re
 from argparse import ArgumentParser, ArgumentTypeError
 from collections import OrderedDict
+from filecmp import cmp
 from functools import partial
 from os import cpu_count
 from pathlib import Path
@@ -16,12 +17,20 @@ from typing import Set, Tuple, TypeVar
 import numpy as np
 from ordered_set import OrderedSet
 from scipy.io.wavfile import read, write
-from textgrid import TextGrid
+from textgrid import IntervalTier, TextGrid
 
+from textgrid_tools.compact_tier import MarkTable, get_compact_tier_from_interval_tier
 from textgrid_tools.helper import check_is_valid_grid
-from textgrid_tools_cli.globals import (DEFAULT_ENCODING, DEFAULT_MAXTASKSPERCHILD,
-                                        DEFAULT_N_FILE_CHUNKSIZE, DEFAULT_N_JOBS)
-from textgrid_tools_cli.textgrid_io import read_file_faster, save_file_faster
+from textgrid_tools.ticks import snap_grid
+from textgrid_tools_cli.file_compression import (OUTPUT_COMPRESSIONS, get_compression,
+                                                 read_data, remove_compression, write_data)
+from textgrid_tools_cli.globals import (DEFAULT_ENCODING, DEFAULT_IO_THREADS,
+                                        DEFAULT_MAXTASKSPERCHILD, DEFAULT_N_FILE_CHUNKSIZE,
+                                        DEFAULT_N_JOBS)
+from textgrid_tools_cli.grid_caching import (copy_cache_entry, get_cache_directory,
+                                             load_grid_cached, update_cache)
+from textgrid_tools_cli.textgrid_io import (OUTPUT_FORMATS, TEXT_FORMAT, get_file_data, parse_data,
+                                            read_file_faster, save_file_faster)
 from textgrid_tools_cli.validation import GridCouldNotBeLoadedError, GridCouldNotBeSavedError
 
 GRID_FILE_TYPE = ".TextGrid"
@@ -105,6 +114,26 @@ def add_encoding_argument(parser: ArgumentParser, help_str: str = "encoding of t
                       help=help_str + "; see all available codecs at https://docs.python.org/3.8/library/codecs.html#standard-encodings", default=DEFAULT_ENCODING)
 
 
+def add_output_format_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--output-format", type=str, choices=OUTPUT_FORMATS, metavar="FORMAT", default=TEXT_FORMAT,
+                      help="format of the written grids: text = Praat's text format; short = Praat's short text format (ooTextFile short) which is smaller; binary = Praat's binary format (ooBinaryFile) which is smaller and faster to read; grids that are copied unchanged keep their format")
+
+
+def add_skip_unchanged_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--skip-unchanged", action="store_true",
+                      help="don't write grids whose file would be identical to the existing one, e.g., if an operation didn't result in a different output")
+
+
+def add_output_compression_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--output-compression", type=str, choices=OUTPUT_COMPRESSIONS, metavar="COMPRESSION", default=None,
+                      help=f"compression of the written grids ({', '.join(OUTPUT_COMPRESSIONS)}), e.g., gz writes .TextGrid.gz files; if not set, grids keep their current compression; grids that are converted in-place replace their former file")
+
+
+def add_manifest_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--manifest", type=get_optional(parse_path), metavar="MANIFEST-PATH", default=None,
+                      help="write the result of each processed grid (file, success, changed, duration in seconds) as tab-separated line to this file as soon as the grid is processed")
+
+
 def add_overwrite_argument(parser: ArgumentParser) -> None:
   parser.add_argument("-o", "--overwrite", action="store_true",
                       help="overwrite existing files")
@@ -120,6 +149,11 @@ def add_directory_argument(parser: ArgumentParser, help_str: str = "directory co
                       help=help_str)
 
 
+def add_corpus_argument(parser: ArgumentParser, help_str: str = "directory containing the grids; can also be a tar shard or a .txt file listing tar shards") -> None:
+  parser.add_argument("directory", type=parse_existing_directory_or_shards, metavar="DIRECTORY",
+                      help=help_str)
+
+
 def add_tiers_argument(parser: ArgumentParser, help_str: str, meta_var: str = "TIER") -> None:
   parser.add_argument("tiers", metavar=meta_var, type=parse_non_empty_or_whitespace,
                       nargs="+", help=help_str, action=ConvertToOrderedSetAction)
@@ -209,6 +243,17 @@ def parse_existing_directory(value: str) -> Path:
   return path
 
 
+def parse_existing_directory_or_shards(value: str) -> Path:
+  path = parse_path(value)
+  if path.is_dir():
+    return path
+  if not path.is_file():
+    raise ArgumentTypeError("Directory or shard was not found!")
+  if path.suffix.lower() not in (".tar", TXT_FILE_TYPE):
+    raise ArgumentTypeError("Value needs to be a directory, a .tar shard or a .txt shard list!")
+  return path
+
+
 def parse_required(value: Optional[str]) -> str:
   if value is None:
     raise ArgumentTypeError("Value must not be None!")
@@ -283,9 +328,9 @@ def parse_non_negative_integer(value: str) -> int:
   return value
 
 
-def add_chunksize_argument(parser: ArgumentParser, target: str = "files", default: int = DEFAULT_N_FILE_CHUNKSIZE) -> None:
-  parser.add_argument("-s", "--chunksize", type=parse_positive_integer, metavar="NUMBER",
-                      help=f"amount of {target} to chunk into one job", default=default)
+def add_chunksize_argument(parser: ArgumentParser, target: str = "files", default: Optional[int] = DEFAULT_N_FILE_CHUNKSIZE) -> None:
+  parser.add_argument("-s", "--chunksize", type=get_optional(parse_positive_integer), metavar="NUMBER",
+                      help=f"amount of {target} to chunk into one job; per default the {target} are processed largest first and small {target} are chunked by their size", default=default)
 
 
 def add_maxtaskperchild_argument(parser: ArgumentParser) -> None:
@@ -293,13 +338,43 @@ def add_maxtaskperchild_argument(parser: ArgumentParser) -> None:
                       help="amount of tasks per child", default=DEFAULT_MAXTASKSPERCHILD)
 
 
+def add_io_threads_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--io-threads", type=parse_non_negative_integer, metavar="NUMBER",
+                      help="amount of threads per job that read the next files ahead while the current file is processed; the processed grids are then written on an additional thread; 0 = read, process and write each file in sequence; useful if the files are on a slow disk or a network share", default=DEFAULT_IO_THREADS)
+
+
+def add_boundary_epsilon_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("--boundary-epsilon", type=parse_non_negative_float, metavar="SECONDS",
+                      help="boundaries whose distance to a required boundary is at most this value are moved onto it instead of reporting that the boundary doesn't exist, e.g., to accept floating point deviations; 0 = boundaries need to match exactly", default=0)
+
+
 def get_grid_files(folder: Path) -> OrderedDictType[str, Path]:
-  result = get_files_dict(folder, filetypes={GRID_FILE_TYPE})
+  result = OrderedDict(sorted(
+    (get_grid_file_stem(file.relative_to(folder)), file.relative_to(folder))
+    for file in get_all_files_in_all_subfolders(folder) if is_grid_file(file)
+  ))
   # logger = getLogger(__name__)
   # logger.info(f"Found {len(result)} grid files.")
   return result
 
 
+def get_grid_files_in_folder(folder: Path) -> OrderedDictType[str, Path]:
+  result = OrderedDict(sorted(
+    (get_grid_file_stem(file.relative_to(folder)), file.relative_to(folder))
+    for file in get_files_in_folder(folder) if is_grid_file(file)
+  ))
+  return result
+
+
+def is_grid_file(path: Path) -> bool:
+  # grid files can be compressed, e.g., .TextGrid.gz
+  return remove_compression(path).suffix.lower() == GRID_FILE_TYPE.lower()
+
+
+def get_grid_file_stem(path: Path) -> str:
+  return str(path.parent / remove_compression(path).stem)
+
+
 def get_audio_files(folder: Path) -> OrderedDictType[str, Path]:
   result = get_files_dict(folder, filetypes={WAV_FILE_TYPE})
   # logger = getLogger(__name__)
@@ -314,9 +389,46 @@ def get_text_files(folder: Path) -> OrderedDictType[str, Path]:
   return result
 
 
-def try_load_grid(path: Path, encoding: str = "UTF-8") -> Tuple[Optional[GridCouldNotBeLoadedError], Optional[TextGrid]]:
+# If set, all times are snapped to ticks of this resolution (ticks per second)
+# when grids are loaded and saved, see `textgrid_tools.ticks`.
+time_resolution: Optional[int] = None
+
+
+def set_time_resolution(resolution: Optional[int]) -> None:
+  global time_resolution
+  time_resolution = resolution
+
+
+def get_time_resolution() -> Optional[int]:
+  return time_resolution
+
+
+def snap_grid_to_time_resolution(grid: TextGrid) -> None:
+  if time_resolution is not None:
+    snap_grid(grid, time_resolution)
+
+
+def try_load_grid(path: Path, encoding: str = "UTF-8", tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None, data: Optional[bytes] = None) -> Tuple[Optional[GridCouldNotBeLoadedError], Optional[TextGrid]]:
+  """
+  mark_table: if set, the interval tiers are loaded as read-only `CompactIntervalTier`
+  data: the decompressed content of the file if it was read already (not considered if a cache is used)
+  """
   try:
-    grid_in = read_file_faster(path, encoding)
+    if get_cache_directory() is None:
+      if data is None:
+        grid_in = read_file_faster(path, encoding, tier_names, mark_table)
+      else:
+        grid_in = parse_data(data, encoding, tier_names, mark_table)
+    else:
+      # cached grids are always complete, i.e., tier_names is not considered
+      grid_in = load_grid_cached(path, encoding)
+      if mark_table is not None:
+        grid_in.tiers = [
+          get_compact_tier_from_interval_tier(tier, mark_table)
+          if isinstance(tier, IntervalTier) else tier
+          for tier in grid_in.tiers
+        ]
+    snap_grid_to_time_resolution(grid_in)
   except Exception as ex:
     # logger = getLogger(__name__)
     # logger.debug(ex)
@@ -324,32 +436,77 @@ def try_load_grid(path: Path, encoding: str = "UTF-8") -> Tuple[Optional[GridCou
   return None, grid_in
 
 
-def try_save_grid(path: Path, grid: TextGrid, encoding: str = "UTF-8") -> Optional[GridCouldNotBeLoadedError]:
+def try_save_grid(path: Path, grid: TextGrid, encoding: str = "UTF-8", output_format: str = TEXT_FORMAT) -> Optional[GridCouldNotBeLoadedError]:
   try:
-    save_grid(path, grid, encoding)
+    save_grid(path, grid, encoding, output_format)
   except Exception as ex:
     return GridCouldNotBeSavedError(path, ex)
   return None
 
 
-def try_copy_grid(grid_in: Path, grid_out: Path) -> Optional[GridCouldNotBeLoadedError]:
+def try_save_grid_if_changed(path: Path, grid: TextGrid, encoding: str = "UTF-8", output_format: str = TEXT_FORMAT) -> Tuple[Optional[GridCouldNotBeSavedError], bool]:
+  try:
+    write_avoided = save_grid_if_changed(path, grid, encoding, output_format)
+  except Exception as ex:
+    return GridCouldNotBeSavedError(path, ex), False
+  return None, write_avoided
+
+
+def try_copy_grid(grid_in: Path, grid_out: Path, encoding: str = "UTF-8") -> Optional[GridCouldNotBeLoadedError]:
   try:
     copy_grid(grid_in, grid_out)
+    if get_cache_directory() is not None:
+      copy_cache_entry(grid_in, grid_out, encoding)
   except Exception as ex:
     return GridCouldNotBeSavedError(grid_out, ex)
   return None
 
 
-def save_grid(path: Path, grid: TextGrid, encoding: str = "UTF-8") -> None:
+def save_grid(path: Path, grid: TextGrid, encoding: str = "UTF-8", output_format: str = TEXT_FORMAT) -> None:
+  snap_grid_to_time_resolution(grid)
+  assert check_is_valid_grid(grid)
+  path.parent.mkdir(exist_ok=True, parents=True)
+  save_file_faster(grid, path, encoding, output_format)
+  if get_cache_directory() is not None:
+    update_cache(path, grid, encoding)
+
+
+def save_grid_if_changed(path: Path, grid: TextGrid, encoding: str = "UTF-8", output_format: str = TEXT_FORMAT) -> bool:
+  """
+  Saves the grid only if the file would change; returns whether the write was avoided.
+  """
+  snap_grid_to_time_resolution(grid)
   assert check_is_valid_grid(grid)
+  data = get_file_data(grid, encoding, output_format)
+  if file_has_content(path, data):
+    return True
   path.parent.mkdir(exist_ok=True, parents=True)
-  save_file_faster(grid, path, encoding)
+  write_data(path, data)
+  if get_cache_directory() is not None:
+    update_cache(path, grid, encoding)
+  return False
+
+
+def file_has_content(path: Path, data: bytes) -> bool:
+  if not path.is_file():
+    return False
+  if get_compression(path) is None and path.stat().st_size != len(data):
+    return False
+  return read_data(path) == data
+
+
+def files_are_equal(path1: Path, path2: Path) -> bool:
+  return path2.is_file() and cmp(path1, path2, shallow=False)
 
 
 def copy_grid(grid_in: Path, grid_out: Path) -> None:
   # logger = getLogger(__name__)
   # logger.debug("Copying grid...")
-  copy_file(grid_in, grid_out)
+  if get_compression(grid_in) == get_compression(grid_out):
+    copy_file(grid_in, grid_out)
+  else:
+    grid_out.parent.mkdir(parents=True, exist_ok=True)
+    write_data(grid_out, read_data(grid_in))
 
 
 def copy_audio(audio_in: Path, audio_out: Path) -> None:
@@ -4,16 +4,19 @@ from functools import partial
 from textgrid_tools import fix_interval_boundaries
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (add_chunksize_argument, add_directory_argument,
+from textgrid_tools_cli.helper import (add_chunksize_argument, add_corpus_argument,
                                        add_dry_run_argument, add_encoding_argument,
+                                       add_io_threads_argument, add_manifest_argument,
                                        add_maxtaskperchild_argument, add_n_jobs_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
+                                       add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
                                        add_tier_argument, add_tiers_argument, parse_positive_float)
 
 
 def get_boundary_fixing_parser(parser: ArgumentParser):
   parser.description = "This command set the closest boundaries of tiers to those of a reference tier."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tier_argument(parser, "tier with contains the right boundaries", meta_var="REFERENCE-TIER")
   add_tiers_argument(parser, "tiers that should be fixed")
   parser.add_argument("--difference-threshold", type=parse_positive_float, default=0.005, metavar="THRESHOLD",
@@ -21,9 +24,14 @@ def get_boundary_fixing_parser(parser: ArgumentParser):
   add_output_directory_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_fix_interval_boundaries
 
@@ -36,4 +44,4 @@ def app_fix_interval_boundaries(ns: Namespace) -> ExecutionResult:
     tier_names=ns.tiers,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, tier_names=ns.tiers | {ns.tier}, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
@@ -7,10 +7,13 @@ from textgrid_tools import join_marks
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_chunksize_argument,
-                                       add_directory_argument, add_dry_run_argument,
-                                       add_encoding_argument, add_maxtaskperchild_argument,
-                                       add_n_jobs_argument, add_output_directory_argument,
-                                       add_overwrite_argument, add_tiers_argument, parse_non_empty)
+                                       add_corpus_argument, add_dry_run_argument,
+                                       add_encoding_argument, add_io_threads_argument,
+                                       add_manifest_argument, add_maxtaskperchild_argument,
+                                       add_n_jobs_argument, add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
+                                       add_tiers_argument, parse_non_empty)
 from textgrid_tools_cli.intervals.common import add_join_empty_argument, add_join_with_argument
 from textgrid_tools_cli.logging_configuration import init_and_get_console_logger
 from textgrid_tools_cli.validation import ValidationError
@@ -30,7 +33,7 @@ class NoMarkDefinedError(ValidationError):
 
 def get_mark_joining_parser(parser: ArgumentParser):
   parser.description = "This command joins adjacent intervals containing specific marks."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tiers_argument(parser, "tiers on which the intervals should be joined")
   parser.add_argument("--empty", action="store_true",
                       help="join empty marks")
@@ -41,9 +44,14 @@ def get_mark_joining_parser(parser: ArgumentParser):
   add_output_directory_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_join_marks
 
@@ -63,4 +71,4 @@ def app_join_marks(ns: Namespace) -> ExecutionResult:
     marks=ns.marks,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
@@ -7,11 +7,11 @@ from tqdm import tqdm
 from textgrid_tools import remove_intervals
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_directory_argument,
-                                       add_encoding_argument, add_overwrite_argument,
-                                       add_tier_argument, copy_audio, get_audio_files,
-                                       get_grid_files, get_optional, parse_existing_directory,
-                                       parse_path, save_audio, try_copy_grid, try_load_grid,
-                                       try_save_grid)
+                                       add_encoding_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_tier_argument, copy_audio,
+                                       get_audio_files, get_grid_files, get_optional,
+                                       parse_existing_directory, parse_path, save_audio,
+                                       try_copy_grid, try_load_grid, try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
 # TODO maybe tiers support
@@ -36,6 +36,7 @@ def get_removing_parser(parser: ArgumentParser):
                       help="the directory where to output the modified audio files if not to directory.")
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   return app_remove_intervals
 
 
@@ -123,7 +124,7 @@ def app_remove_intervals(ns: Namespace) -> ExecutionResult:
       continue
 
     if changed_anything:
-      error = try_save_grid(grid_file_out_abs, grid, ns.encoding)
+      error = try_save_grid(grid_file_out_abs, grid, ns.encoding, ns.output_format)
       if error is not None:
         flogger.debug(error.exception)
         flogger.error(error.default_message)
@@ -131,7 +132,7 @@ def app_remove_intervals(ns: Namespace) -> ExecutionResult:
         total_success = False
         continue
     elif ns.directory != output_directory:
-      error = try_copy_grid(grid_file_in_abs, grid_file_out_abs)
+      error = try_copy_grid(grid_file_in_abs, grid_file_out_abs, ns.encoding)
       if error is not None:
         flogger.debug(error.exception)
         flogger.error(error.default_message)
@@ -7,16 +7,19 @@ from textgrid_tools import join_interval_symbols
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import DEFAULT_PUNCTUATION, ExecutionResult
 from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_chunksize_argument,
-                                       add_directory_argument, add_dry_run_argument,
-                                       add_encoding_argument, add_maxtaskperchild_argument,
-                                       add_n_jobs_argument, add_output_directory_argument,
-                                       add_overwrite_argument, add_tiers_argument)
+                                       add_corpus_argument, add_dry_run_argument,
+                                       add_encoding_argument, add_io_threads_argument,
+                                       add_manifest_argument, add_maxtaskperchild_argument,
+                                       add_n_jobs_argument, add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
+                                       add_tiers_argument)
 from textgrid_tools_cli.intervals.common import add_join_empty_argument, add_join_with_argument
 
 
 def get_symbols_joining_parser(parser: ArgumentParser):
   parser.description = "This command joins adjacent intervals based on content. Tip: Merge right first and then left."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tiers_argument(parser, "tiers on which the intervals should be joined")
   parser.add_argument('--mode', type=str, choices=["right", "left", "together"],
                       help="mode to join: right -> join marks from right; left -> join marks from left; together -> join adjacent intervals containing these marks together", default="right")
@@ -30,9 +33,14 @@ def get_symbols_joining_parser(parser: ArgumentParser):
   add_output_directory_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_join_intervals_between_pauses
 
@@ -48,4 +56,4 @@ def app_join_intervals_between_pauses(ns: Namespace) -> ExecutionResult:
     ignore_empty=not ns.join_empty,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
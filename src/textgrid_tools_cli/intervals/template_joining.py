@@ -4,10 +4,13 @@ from functools import partial
 from textgrid_tools import join_by_template
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (add_chunksize_argument, add_directory_argument,
-                                       add_dry_run_argument, add_encoding_argument,
-                                       add_maxtaskperchild_argument, add_n_jobs_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
+from textgrid_tools_cli.helper import (add_boundary_epsilon_argument, add_chunksize_argument,
+                                       add_corpus_argument, add_dry_run_argument,
+                                       add_encoding_argument, add_io_threads_argument,
+                                       add_manifest_argument, add_maxtaskperchild_argument,
+                                       add_n_jobs_argument, add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
                                        add_tier_argument, get_optional, parse_non_empty,
                                        parse_non_empty_or_whitespace)
 from textgrid_tools_cli.intervals.common import add_join_empty_argument, add_join_with_argument
@@ -15,7 +18,7 @@ from textgrid_tools_cli.intervals.common import add_join_empty_argument, add_joi
 
 def get_template_joining_parser(parser: ArgumentParser):
   parser.description = "This command joins adjacent intervals according to a template."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tier_argument(parser, "tier on which the intervals should be joined")
   parser.add_argument('template', type=parse_non_empty, metavar="MARK", nargs="+",
                       help="join adjacent intervals equaling to this template")
@@ -23,12 +26,18 @@ def get_template_joining_parser(parser: ArgumentParser):
                       help="only apply templates in the intervals boundaries of this tier", default=None)
   add_join_with_argument(parser)
   add_join_empty_argument(parser)
+  add_boundary_epsilon_argument(parser)
   add_output_directory_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_join_template
 
@@ -41,6 +50,7 @@ def app_join_template(ns: Namespace) -> ExecutionResult:
     join_with=ns.join_with,
     ignore_empty=not ns.join_empty,
     template=ns.template,
+    boundary_epsilon=ns.boundary_epsilon,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
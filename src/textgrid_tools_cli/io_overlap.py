@@ -0,0 +1,100 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from threading import BoundedSemaphore
+from typing import Callable, Deque, Generator, Iterable, Optional, Set, Tuple, TypeVar
+
+# A worker can overlap the I/O of its files with processing: the files that
+# come next are read on a small thread pool while the current one is
+# processed and the processed grids are written on a separate thread. Reading
+# and writing files releases the GIL, i.e., the worker doesn't wait for the
+# disk (or the network share) as long as the threads keep up. The amount of
+# files read ahead and of pending writes is limited, so the memory of a
+# worker stays bounded.
+FILES_READ_AHEAD_PER_THREAD = 2
+MAX_PENDING_WRITES = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Prefetcher():
+  def __init__(self, read: Callable[[T], R], n_threads: int) -> None:
+    assert n_threads > 0
+    self.__read = read
+    self.__read_ahead = n_threads * FILES_READ_AHEAD_PER_THREAD
+    self.__executor = ThreadPoolExecutor(max_workers=n_threads, thread_name_prefix="prefetch")
+    self.__pending: Set[Future] = set()
+
+  def __enter__(self) -> "Prefetcher":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def iterate(self, items: Iterable[T]) -> Generator[Tuple[T, "Future[R]"], None, None]:
+    """
+    Yields each item together with the future of its content; the next items
+    are read while the current one is consumed.
+    """
+    pending: Deque[Tuple[T, Future]] = deque()
+    iterator = iter(items)
+    for item in islice(iterator, self.__read_ahead):
+      pending.append((item, self.__submit(item)))
+    while len(pending) > 0:
+      item, future = pending.popleft()
+      for next_item in islice(iterator, 1):
+        pending.append((next_item, self.__submit(next_item)))
+      yield item, future
+
+  def close(self) -> None:
+    # the reads that didn't start yet are not needed anymore, e.g., if the
+    # iteration was stopped early (cancel_futures requires Python 3.9)
+    for future in list(self.__pending):
+      future.cancel()
+    self.__executor.shutdown(wait=True)
+
+  def __submit(self, item: T) -> Future:
+    future = self.__executor.submit(self.__read, item)
+    self.__pending.add(future)
+    future.add_done_callback(self.__pending.discard)
+    return future
+
+
+class WriteBehind():
+  def __init__(self, max_pending: int = MAX_PENDING_WRITES) -> None:
+    # one thread, i.e., the writes are done in the order they were submitted
+    self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write-behind")
+    self.__slots = BoundedSemaphore(max_pending)
+
+  def __enter__(self) -> "WriteBehind":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def submit(self, write: Callable[[], R]) -> "Future[R]":
+    """
+    Blocks while max_pending writes are not finished yet.
+    """
+    self.__slots.acquire()
+    future = self.__executor.submit(write)
+    future.add_done_callback(self.__release)
+    return future
+
+  def close(self) -> None:
+    # waits until all writes are done
+    self.__executor.shutdown(wait=True)
+
+  def __release(self, _: Future) -> None:
+    self.__slots.release()
+
+
+def get_result_or_none(future: "Future[R]") -> Optional[R]:
+  """
+  Returns None if the future failed, e.g., if a file couldn't be prefetched
+  it is read again without prefetching to report the error.
+  """
+  if future.exception() is not None:
+    return None
+  return future.result()
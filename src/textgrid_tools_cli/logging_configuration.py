@@ -1,10 +1,13 @@
 import logging
 import os
-from logging import DEBUG, Formatter, Handler, Logger, LogRecord, StreamHandler, getLogger
+from logging import (DEBUG, Formatter, Handler, Logger, LoggerAdapter, LogRecord, StreamHandler,
+                     getLogger)
 from logging.handlers import QueueHandler
+from multiprocessing import SimpleQueue
 from pathlib import Path
 from queue import Queue
-from typing import Dict, Generator, List, Tuple
+from threading import Thread
+from typing import Dict, Generator, List, Optional, Tuple
 
 from ordered_set import OrderedSet
 
@@ -26,18 +29,114 @@ from ordered_set import OrderedSet
 
 
 class StoreRecordsHandler():
-  def __init__(self) -> None:
+  def __init__(self, level: int = DEBUG) -> None:
     self.__records = []
-    self.level = DEBUG
+    self.level = level
 
   def handle(self, record) -> None:
-    self.__records.append(record)
+    if record.levelno >= self.level:
+      self.__records.append(record)
 
   @property
   def records(self) -> List[LogRecord]:
     return self.__records
 
 
+class RecordsListener():
+  """
+  Writes the records which the worker processes put into the queue (one list
+  of records per file) to the file logger as they arrive.
+  """
+
+  def __init__(self, queue: SimpleQueue) -> None:
+    self.__queue = queue
+    self.__thread = Thread(target=self.__listen, daemon=True)
+
+  def start(self) -> None:
+    self.__thread.start()
+
+  def stop(self) -> None:
+    # all records were put into the queue before the sentinel
+    self.__queue.put(None)
+    self.__thread.join()
+
+  def __listen(self) -> None:
+    flogger = get_file_logger()
+    while True:
+      records: Optional[List[LogRecord]] = self.__queue.get()
+      if records is None:
+        break
+      for record in records:
+        flogger.handle(record)
+
+
+# The workers log all grids through one logger (a logger per grid would never
+# be freed); the grid of a record is set through a `LoggerAdapter` and its
+# records are stored per grid until the grid is processed.
+WORKER_LOGGER_NAME = "worker-logger"
+GRID_ATTRIBUTE = "grid"
+
+
+class GridRecordsHandler():
+  """
+  Stores the records of the grids that are currently processed in the worker
+  (with io_threads, a grid is written while the next one is processed).
+  """
+
+  def __init__(self, level: int = DEBUG) -> None:
+    self.level = level
+    self.__records: Dict[str, List[LogRecord]] = {}
+
+  def handle(self, record: LogRecord) -> None:
+    grid = getattr(record, GRID_ATTRIBUTE, None)
+    records = self.__records.get(grid)
+    if records is not None and record.levelno >= self.level:
+      # the records are written with the name of their grid
+      record.name = grid
+      records.append(record)
+
+  def add(self, grid: str) -> List[LogRecord]:
+    result: List[LogRecord] = []
+    self.__records[grid] = result
+    return result
+
+  def remove(self, grid: str) -> None:
+    self.__records.pop(grid, None)
+
+
+worker_records_handler: Optional[GridRecordsHandler] = None
+
+
+def init_worker_logger(level: int) -> None:
+  """
+  level: only records of at least this level are stored, e.g., the result of `get_file_logger_level`
+  """
+  global worker_records_handler
+  logger = getLogger(WORKER_LOGGER_NAME)
+  logger.propagate = False
+  logger.handlers.clear()
+  worker_records_handler = GridRecordsHandler(level)
+  logger.addHandler(worker_records_handler)
+
+
+def get_grid_logger(grid: str) -> Tuple[LoggerAdapter, List[LogRecord]]:
+  """
+  Returns the logger for the grid and the list in which its records are
+  stored until `release_grid_logger` is called.
+  """
+  global worker_records_handler
+  assert worker_records_handler is not None
+  records = worker_records_handler.add(grid)
+  logger = LoggerAdapter(getLogger(WORKER_LOGGER_NAME), {GRID_ATTRIBUTE: grid})
+  return logger, records
+
+
+def release_grid_logger(grid: str) -> None:
+  global worker_records_handler
+  assert worker_records_handler is not None
+  worker_records_handler.remove(grid)
+
+
 class ConsoleFormatter(logging.Formatter):
   """Logging colored formatter, adapted from https://stackoverflow.com/a/56944256/3638629"""
 
@@ -163,6 +262,16 @@ def get_file_logger() -> Logger:
   return logger
 
 
+def get_file_logger_level() -> int:
+  """
+  Returns the lowest level of the records that are written to the log file;
+  if there is no log file, no records are written at all.
+  """
+  flogger = get_file_logger()
+  result = min((handler.level for handler in flogger.handlers), default=logging.CRITICAL + 1)
+  return result
+
+
 def try_init_file_logger(path: Path, debug: bool = False) -> bool:
   if path.is_dir():
     logger = getLogger(__name__)
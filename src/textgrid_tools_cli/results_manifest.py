@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Optional, TextIO
+
+# The results of processing grid files are aggregated as they arrive, i.e.,
+# the results of all files are not kept in memory. Optionally, they are
+# written to a manifest: a tab-separated file with one line per file (as they
+# were finished, not sorted).
+MANIFEST_HEADER = ("file", "success", "changed", "duration")
+MANIFEST_SEP = "\t"
+
+
+class ResultsAggregator():
+  def __init__(self, manifest_path: Optional[Path] = None) -> None:
+    self.n_files = 0
+    self.total_success = True
+    self.total_changed_anything = False
+    self.avoided_writes = 0
+    self.__manifest: Optional[TextIO] = None
+    if manifest_path is not None:
+      manifest_path.parent.mkdir(parents=True, exist_ok=True)
+      # line buffered, i.e., the manifest is complete up to the last finished file
+      self.__manifest = open(manifest_path, mode="w", encoding="utf-8", buffering=1)
+      self.__write_line(MANIFEST_HEADER)
+
+  def __enter__(self) -> "ResultsAggregator":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def add(self, file: str, success: bool, changed_anything: bool, write_avoided: bool, duration: float) -> None:
+    self.n_files += 1
+    self.total_success &= success
+    self.total_changed_anything |= changed_anything
+    if write_avoided:
+      self.avoided_writes += 1
+    if self.__manifest is not None:
+      self.__write_line((file, str(success), str(changed_anything), f"{duration:.6f}"))
+
+  def close(self) -> None:
+    if self.__manifest is not None:
+      self.__manifest.close()
+      self.__manifest = None
+
+  def __write_line(self, values) -> None:
+    self.__manifest.write(f"{MANIFEST_SEP.join(values)}\n")
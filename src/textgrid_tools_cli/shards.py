@@ -0,0 +1,295 @@
+import os
+import tarfile
+from copy import copy
+from functools import partial
+from io import BytesIO
+from logging import LogRecord
+from multiprocessing import Pool, SimpleQueue
+from pathlib import Path
+from tarfile import TarFile, TarInfo
+from time import perf_counter
+from typing import Callable, List, Optional, Set, Tuple
+
+from textgrid import TextGrid
+from tqdm import tqdm
+
+from textgrid_tools.globals import ExecutionResult
+from textgrid_tools.helper import check_is_valid_grid, get_changed_tiers, invalidate_grid
+from textgrid_tools_cli.file_compression import (compress_data, decompress_data,
+                                                 get_compressed_path)
+from textgrid_tools_cli.helper import (files_are_equal, get_grid_file_stem, get_time_resolution,
+                                       is_grid_file, set_time_resolution,
+                                       snap_grid_to_time_resolution)
+from textgrid_tools_cli.logging_configuration import (RecordsListener, get_file_logger,
+                                                      get_file_logger_level, get_grid_logger,
+                                                      init_and_get_console_logger,
+                                                      init_worker_logger, release_grid_logger)
+from textgrid_tools_cli.results_manifest import ResultsAggregator
+from textgrid_tools_cli.textgrid_io import TEXT_FORMAT, get_file_data, parse_data
+from textgrid_tools_cli.validation import GridCouldNotBeLoadedError, GridCouldNotBeSavedError
+
+# A corpus can be stored as tar shards (WebDataset-style) instead of one file
+# per grid: all files of an utterance share a key, e.g., "a/b.TextGrid" and
+# "a/b.wav". The members of a shard are streamed in order; the grids are
+# processed and all other members (e.g. audio) are written unchanged into the
+# resulting shard. A shard list is a .txt file containing one shard path per
+# line (relative to the list).
+SHARD_FILE_TYPE = ".tar"
+SHARD_LIST_FILE_TYPE = ".txt"
+
+# success, changed anything, write avoided, duration (s)
+MemberResult = Tuple[bool, bool, bool, float]
+
+
+def is_shard_file(path: Path) -> bool:
+  return path.suffix.lower() == SHARD_FILE_TYPE
+
+
+def is_shard_list_file(path: Path) -> bool:
+  return path.suffix.lower() == SHARD_LIST_FILE_TYPE
+
+
+def get_shards(path: Path) -> List[Path]:
+  if is_shard_file(path):
+    return [path]
+  assert is_shard_list_file(path)
+  lines = path.read_text("utf-8").splitlines()
+  return [path.parent / line.strip() for line in lines if line.strip() != ""]
+
+
+def get_shard_output_path(shard: Path, shards_directory: Path, output_directory: Optional[Path]) -> Path:
+  """
+  Returns the path of the resulting shard; in the output directory, the shards
+  keep their path relative to shards_directory (the directory of the shard
+  list) or only their name if they are not located below it.
+  """
+  if output_directory is None:
+    return shard
+  try:
+    rel_path = shard.relative_to(shards_directory)
+  except ValueError:
+    rel_path = Path(shard.name)
+  if ".." in rel_path.parts:
+    rel_path = Path(shard.name)
+  return output_directory / rel_path
+
+
+def process_shards_mp(shard_list: Path, encoding: str, output_directory: Optional[Path], overwrite: bool, method: Callable[[TextGrid], ExecutionResult], n_jobs: int, maxtasksperchild: Optional[int], dry_run: bool, tier_names: Optional[Set[str]] = None, output_format: str = TEXT_FORMAT, skip_unchanged: bool = False, output_compression: Optional[str] = None, manifest: Optional[Path] = None) -> ExecutionResult:
+  """
+  output_directory: directory where the resulting shards are written to (see `get_shard_output_path`); if None, the shards are replaced
+  manifest: if set, the result of each grid and each shard is written to this file as soon as its shard is processed
+  """
+  logger = init_and_get_console_logger(__name__)
+  flogger = get_file_logger()
+
+  shards = get_shards(shard_list)
+  logger.info(f"Found {len(shards)} shard(s).")
+
+  shards_out = [get_shard_output_path(shard, shard_list.parent, output_directory)
+                for shard in shards]
+  if len(set(shards_out)) != len(shards_out):
+    duplicates = sorted({str(path) for path in shards_out if shards_out.count(path) > 1})
+    logger.error(
+      f"Multiple shards would be written to the same path: {', '.join(duplicates)}!")
+    return False, False
+
+  # the method is sent once to each worker, see `process_grids_mp`
+  method_proxy = partial(
+    process_shard,
+    encoding=encoding,
+    overwrite=overwrite,
+    shards_directory=shard_list.parent,
+    output_directory=output_directory,
+    dry_run=dry_run,
+    tier_names=tier_names,
+    output_format=output_format,
+    skip_unchanged=skip_unchanged,
+    output_compression=output_compression,
+  )
+
+  # a shard is the unit of work, i.e., its members are processed sequentially
+  n_jobs = max(1, min(n_jobs, len(shards)))
+  flogger.debug(f"Shards: {len(shards)}")
+  flogger.debug(f"Jobs (final): {n_jobs}")
+
+  # the workers send the log records of each grid through the queue, see
+  # `process_grids_mp`
+  log_queue = SimpleQueue()
+  with ResultsAggregator(manifest) as results, Pool(
+    processes=n_jobs,
+    initializer=__init_pool,
+    initargs=(method, get_time_resolution(), log_queue, get_file_logger_level()),
+    maxtasksperchild=maxtasksperchild,
+  ) as pool:
+    listener = RecordsListener(log_queue)
+    listener.start()
+    try:
+      iterator = pool.imap_unordered(method_proxy, shards, chunksize=1)
+      for shard_result in tqdm(iterator, total=len(shards), desc="Processing", unit=" shard(s)"):
+        for key, member_result in shard_result:
+          results.add(key, *member_result)
+    finally:
+      listener.stop()
+
+  if manifest is not None:
+    logger.info(f"Written results to: \"{manifest.absolute()}\"")
+
+  if skip_unchanged:
+    logger.info(
+      f"Avoided writing {results.avoided_writes} grid file(s) whose content didn't change.")
+    flogger.info(f"Avoided writes: {results.avoided_writes}")
+
+  return results.total_success, results.total_changed_anything
+
+
+process_method: Callable[[TextGrid], ExecutionResult] = None
+process_log_queue: Optional[SimpleQueue] = None
+
+
+def __init_pool(method: Callable[[TextGrid], ExecutionResult], time_resolution: Optional[int], log_queue: SimpleQueue, log_level: int) -> None:
+  global process_method
+  global process_log_queue
+  process_method = method
+  process_log_queue = log_queue
+  init_worker_logger(log_level)
+  set_time_resolution(time_resolution)
+
+
+def send_grid_records(name: str, records: List[LogRecord]) -> None:
+  """
+  Releases the logger of the grid and puts its records into the log queue,
+  i.e., the records of a grid stay together.
+  """
+  global process_log_queue
+
+  release_grid_logger(name)
+  if process_log_queue is not None and len(records) > 0:
+    process_log_queue.put(records)
+  records.clear()
+
+
+def process_shard(shard: Path, encoding: str, overwrite: bool, shards_directory: Path, output_directory: Optional[Path], dry_run: bool, tier_names: Optional[Set[str]], output_format: str, skip_unchanged: bool, output_compression: Optional[str]) -> List[Tuple[str, MemberResult]]:
+  global process_method
+
+  start = perf_counter()
+  logger, records = get_grid_logger(str(shard))
+  try:
+    shard_out = get_shard_output_path(shard, shards_directory, output_directory)
+
+    if shard_out.exists() and not overwrite:
+      logger.info(f"Shard \"{shard_out.absolute()}\" already exists. Skipped.")
+      return [(str(shard), (True, False, False, perf_counter() - start))]
+
+    results: List[Tuple[str, MemberResult]] = []
+    tmp_path = shard_out.with_name(f"{shard_out.name}.{os.getpid()}.tmp")
+    shard_out.parent.mkdir(parents=True, exist_ok=True)
+    try:
+      with tarfile.open(shard, "r|") as tar_in, tarfile.open(tmp_path, "w|") as tar_out:
+        for member in tar_in:
+          if member.isfile() and is_grid_file(Path(member.name)):
+            results.append(process_member(
+              shard, tar_in, tar_out, member, encoding, process_method, tier_names,
+              output_format, skip_unchanged, output_compression,
+            ))
+          elif member.isfile():
+            tar_out.addfile(member, tar_in.extractfile(member))
+          else:
+            tar_out.addfile(member)
+    except Exception as ex:
+      tmp_path.unlink(missing_ok=True)
+      logger.debug(ex)
+      logger.error(f"Shard \"{shard.absolute()}\" couldn't be processed!")
+      return results + [(str(shard), (False, False, False, perf_counter() - start))]
+
+    changed_anything = any(changed for _, (_, changed, _, _) in results)
+    if dry_run:
+      tmp_path.unlink()
+      logger.info(f"DRY RUN, therefore didn't saved shard to \"{shard_out.absolute()}\".")
+    elif shard_out == shard and not changed_anything and output_compression is None:
+      tmp_path.unlink()
+      logger.info(f"Didn't changed anything in shard \"{shard.absolute()}\".")
+    elif skip_unchanged and files_are_equal(tmp_path, shard_out):
+      tmp_path.unlink()
+      logger.info(f"Shard \"{shard_out.absolute()}\" exists already with the same content, therefore didn't save it.")
+    else:
+      os.replace(tmp_path, shard_out)
+      logger.info(f"Saved the shard to: \"{shard_out.absolute()}\"")
+    results.append((str(shard), (True, False, False, perf_counter() - start)))
+    return results
+  finally:
+    send_grid_records(str(shard), records)
+
+
+def process_member(shard: Path, tar_in: TarFile, tar_out: TarFile, member: TarInfo, encoding: str, method: Callable[[TextGrid], ExecutionResult], tier_names: Optional[Set[str]], output_format: str, skip_unchanged: bool, output_compression: Optional[str]) -> Tuple[str, MemberResult]:
+  start = perf_counter()
+  member_path = Path(member.name)
+  key = f"{shard}/{get_grid_file_stem(member_path)}"
+  logger, records = get_grid_logger(key)
+  try:
+    logger.info(f"Processing \"{key}\"")
+    data_in = tar_in.extractfile(member).read()
+
+    try:
+      grid = parse_data(decompress_data(member_path, data_in), encoding, tier_names)
+      snap_grid_to_time_resolution(grid)
+    except Exception as ex:
+      error = GridCouldNotBeLoadedError(shard / member_path, ex)
+      logger.debug(error.exception)
+      logger.error(error.default_message)
+      tar_out.addfile(member, BytesIO(data_in))
+      duration = perf_counter() - start
+      logger.debug(f"Duration (s): {duration}")
+      return key, (False, False, False, duration)
+
+    error, changed_anything = method(grid, logger=logger)
+    success = error is None
+    write_avoided = False
+    member_out = copy(member)
+    member_out.name = get_compressed_path(member_path, output_compression).as_posix()
+    data_out = data_in
+
+    if not success:
+      logger.error(error.default_message)
+      logger.info("Skipped.")
+      assert not changed_anything
+    else:
+      logger.info("Applied operations successfully.")
+      # the helpers that changed the grid recorded it on the changed tiers
+      changed_tiers = get_changed_tiers(grid)
+      if len(changed_tiers) > 0:
+        logger.debug(f"Changed tier(s): {', '.join(str(tier.name) for tier in changed_tiers)}")
+        changed_anything = True
+      try:
+        if changed_anything:
+          # the method might have changed the tiers without invalidating their validity
+          invalidate_grid(grid)
+          snap_grid_to_time_resolution(grid)
+          assert check_is_valid_grid(grid)
+          data = get_file_data(grid, encoding, output_format)
+          if skip_unchanged and data == decompress_data(member_path, data_in):
+            logger.info("Output is identical to the existing grid, therefore didn't save it.")
+            write_avoided = True
+            changed_anything = False
+          else:
+            data_out = compress_data(Path(member_out.name), data)
+        elif member_out.name != member.name:
+          data_out = compress_data(Path(member_out.name), decompress_data(member_path, data_in))
+      except Exception as ex:
+        error = GridCouldNotBeSavedError(shard / member_path, ex)
+        logger.debug(error.exception)
+        logger.error(error.default_message)
+        success = False
+        changed_anything = False
+        data_out = data_in
+
+    if data_out is data_in:
+      member_out.name = member.name
+    member_out.size = len(data_out)
+    tar_out.addfile(member_out, BytesIO(data_out))
+
+    del grid
+    duration = perf_counter() - start
+    logger.debug(f"Duration (s): {duration}")
+    return key, (success, changed_anything, write_avoided, duration)
+  finally:
+    send_grid_records(key, records)
@@ -1,11 +1,24 @@
 # taken from textgrid: see https://github.com/kylebgorman/textgrid
 
+import os
 import re
+from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, lookup, utf_16_be_decode
+from itertools import islice
+from math import inf
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from typing import Generator, Iterator, Union
+from struct import Struct
+from typing import (AnyStr, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Set,
+                    Tuple, Union)
 
 from textgrid import Interval, IntervalTier, Point, PointTier, TextGrid
 
+from textgrid_tools.compact_tier import (CompactIntervalTier, MarkTable, get_compact_tier,
+                                         get_compact_tier_from_interval_tier)
+from textgrid_tools.helper import (check_minTime_and_maxTime_are_valid, iter_intervals,
+                                   set_tier_validity)
+from textgrid_tools_cli.file_compression import get_compression, open_file, read_data
+
 
 def read_original(path: Path, n_digits: int, encoding: str) -> TextGrid:
   #start = perf_counter()
@@ -72,17 +85,455 @@ def parse_line(line, short):
   return float(m.groups()[0])
 
 
-def read_file_faster(path: Path, encoding: str) -> TextGrid:
-  with open(path, "r", encoding=encoding) as f:
-    lines = f.readlines()
-  result = parse_lines(iter(lines))
-  del f
-  del lines
-  return result
+def read_file_faster(path: Path, encoding: str, tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None) -> TextGrid:
+  """
+  Compressed files (e.g. .TextGrid.gz) are decompressed in memory, all
+  others are memory-mapped.
+  """
+  if get_compression(path) is not None:
+    return parse_data(read_data(path), encoding, tier_names, mark_table)
+  with open(path, "rb") as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      # empty files can't be mapped
+      return parse_data(b"", encoding, tier_names, mark_table)
+    with mmap(f.fileno(), 0, access=ACCESS_READ) as data:
+      return parse_data(data, encoding, tier_names, mark_table)
+
+
+def parse_data(data: Union[bytes, mmap], encoding: str, tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None) -> TextGrid:
+  """
+  Parse the content of a TextGrid file; binary files (ooBinaryFile) are
+  detected from their header. Text files with a byte order mark are decoded
+  as UTF-8 or UTF-16 respectively, all others using encoding.
+  Files in an ASCII-compatible encoding (e.g. UTF-8) are not decoded as a
+  whole, only their values are decoded, see `tokenize_data`.
+  If mark_table is given, interval tiers are parsed as `CompactIntervalTier`
+  whose marks are interned in mark_table.
+  """
+  if data[:len(BINARY_HEADER)] == BINARY_HEADER:
+    return parse_binary(data, tier_names, mark_table)
+  start = 0
+  if data[:len(BOM_UTF8)] == BOM_UTF8:
+    encoding = "utf-8"
+    start = len(BOM_UTF8)
+  elif data[:len(BOM_UTF16_BE)] in (BOM_UTF16_BE, BOM_UTF16_LE):
+    # Praat writes UTF-16 if a grid contains non-ASCII characters
+    encoding = "utf-16"
+  if is_ascii_compatible(encoding):
+    return parse_tokens(tokenize_data(data, start, encoding), tier_names, mark_table)
+  content = str(data[start:], encoding)
+  if "\r" in content:
+    # same as reading in text mode (universal newlines)
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+  return parse_content(content, tier_names, mark_table)
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+  name = lookup(encoding).name
+  return name in ("utf-8", "utf-8-sig", "ascii", "latin-1") or name.startswith(("iso8859-", "cp125"))
 
 
 def parse_text(text: str) -> TextGrid:
-  return parse_lines(iter(text.splitlines(True)))
+  return parse_content(text)
+
+
+class UnparsedTier():
+  """
+  Tier that was not parsed while reading a grid. Its content is kept as it
+  occurred in the file and is written back unchanged by `save_file_faster`
+  (if the output format differs, the tier is parsed beforehand).
+  """
+
+  def __init__(self, position: int, tier_class: str, name: str, content: Union[List[str], bytes]) -> None:
+    self.position = position
+    self.tier_class = tier_class
+    self.name = name
+    # text: raw values of name, xmin, xmax, size and the intervals/points
+    # binary: bytes from the name until the end of the tier
+    self.content = content
+
+  @property
+  def is_binary(self) -> bool:
+    return isinstance(self.content, bytes)
+
+
+def get_unparsed_tiers(grid: TextGrid) -> List[UnparsedTier]:
+  return getattr(grid, "unparsed_tiers", [])
+
+
+def parse_unparsed_tier(tier: UnparsedTier) -> Union[IntervalTier, PointTier]:
+  if tier.is_binary:
+    reader = BinaryReader(tier.content, 0)
+    reader.read_w16()  # name
+    return _parse_binary_tier(reader, tier.tier_class, tier.name, strict=True)
+  tokens = iter(tier.content)
+  next(tokens)  # name
+  return _parse_tier(tokens, tier.tier_class, tier.name, strict=True)
+
+
+def _add_intervals(tier: IntervalTier, entries: Iterable[Tuple[float, float, str]]) -> None:
+  """
+  Adds the intervals to the tier and sets the validity of the tier (see
+  `is_tier_valid`) as a by-product, i.e., the grid needs not to be validated
+  again before it is processed.
+  """
+  intervals = tier.intervals
+  strict = tier.strict
+  last_max_time = tier.minTime
+  tier_max_time = tier.maxTime if tier.maxTime else inf
+  is_consecutive = True
+  is_sorted = True
+  for jmin, jmax, jmrk in entries:
+    if jmin < jmax:  # non-null
+      interval = Interval(jmin, jmax, jmrk)
+      if last_max_time <= jmin and jmax <= tier_max_time:
+        # sorted and non-overlapping: same as addInterval but without bisecting
+        interval.strict = strict
+        intervals.append(interval)
+        is_consecutive = is_consecutive and last_max_time == jmin
+        last_max_time = jmax
+      else:
+        tier.addInterval(interval)
+        last_max_time = intervals[-1].maxTime
+        is_sorted = False
+  if is_sorted:
+    # the first interval starts at tier.minTime and all intervals have a positive duration
+    is_valid = check_minTime_and_maxTime_are_valid(tier.minTime, tier.maxTime) \
+        and is_consecutive \
+        and (len(intervals) == 0 or last_max_time == tier.maxTime)
+    set_tier_validity(tier, is_valid)
+
+
+def _get_compact_tier(name: str, min_time: float, max_time: float, strict: bool, entries: Iterable[Tuple[float, float, str]], mark_table: MarkTable) -> CompactIntervalTier:
+  # same intervals as _add_intervals would add
+  entries = [entry for entry in entries if entry[0] < entry[1]]
+  is_sorted = all(
+    prev_entry[1] <= entry[0]
+    for prev_entry, entry in zip(entries, entries[1:])
+  )
+  if is_sorted and (len(entries) == 0 or (min_time <= entries[0][0] and entries[-1][1] <= max_time)):
+    result = get_compact_tier(name, min_time, max_time, entries, mark_table)
+  else:
+    tier = IntervalTier(name, min_time, max_time)
+    tier.strict = strict
+    _add_intervals(tier, entries)
+    result = get_compact_tier_from_interval_tier(tier, mark_table)
+  result.strict = strict
+  return result
+
+
+# Praat text files (long and short) consist of the same sequence of values
+# which are either quoted strings ("" escapes a double-quote and newlines are
+# allowed), numbers or the <exists>/<absent> flag of the tiers.
+# In the long format every value follows a "= " (or "? " for the flag),
+# in the short format every value starts a line.
+HEADER_PATTERN = re.compile(r'\s*File type = "([^"]*)"\s*(?:Object class = )?"([^"]*)"[ \t]*\r?\n')
+LONG_TOKEN_PATTERN = re.compile(r'[=?] ("[^"]*(?:""[^"]*)*"|[^\s"]+)')
+SHORT_TOKEN_PATTERN = re.compile(r'^[ \t]*("[^"]*(?:""[^"]*)*"|[^\s"]+)', re.MULTILINE)
+LONG_BODY_PATTERN = re.compile(r'\s*xmin = ')
+HEADER_BYTES_PATTERN = re.compile(HEADER_PATTERN.pattern.encode("ascii"))
+LONG_TOKEN_BYTES_PATTERN = re.compile(LONG_TOKEN_PATTERN.pattern.encode("ascii"))
+SHORT_TOKEN_BYTES_PATTERN = re.compile(SHORT_TOKEN_PATTERN.pattern.encode("ascii"), re.MULTILINE)
+LONG_BODY_BYTES_PATTERN = re.compile(LONG_BODY_PATTERN.pattern.encode("ascii"))
+QUOTE = ord('"')
+
+
+def tokenize(content: str) -> List[str]:
+  header = HEADER_PATTERN.match(content)
+  _check_header(header)
+  body_start = header.end()
+  if LONG_BODY_PATTERN.match(content, body_start):
+    pattern = LONG_TOKEN_PATTERN
+  else:
+    pattern = SHORT_TOKEN_PATTERN
+  return pattern.findall(content, body_start)
+
+
+def tokenize_data(data: Union[bytes, mmap], start: int, encoding: str) -> Iterator[str]:
+  """
+  Same as `tokenize` but on the encoded content of a file (encoding needs to
+  be ASCII-compatible), i.e., the content is not decoded as a whole. Each
+  value is decoded when it is consumed, strings (marks and names) are decoded
+  only once per distinct value.
+  """
+  header = HEADER_BYTES_PATTERN.match(data, start)
+  _check_header(header)
+  body_start = header.end()
+  if LONG_BODY_BYTES_PATTERN.match(data, body_start):
+    pattern = LONG_TOKEN_BYTES_PATTERN
+  else:
+    pattern = SHORT_TOKEN_BYTES_PATTERN
+  tokens = pattern.findall(data, body_start)
+  normalize_newlines = data.find(b"\r", body_start) != -1
+  return _decode_tokens(tokens, encoding, normalize_newlines)
+
+
+def _check_header(header: Optional[re.Match]) -> None:
+  if header is None:
+    file_type, object_class = None, None
+  else:
+    file_type, object_class = (
+      group.decode("latin-1") if isinstance(group, bytes) else group
+      for group in header.groups()
+    )
+  if file_type is None or not file_type.startswith('ooTextFile'):
+    raise Exception(
+      'The file could not be parsed as a Praat text file as it is lacking a proper header.')
+  if object_class != 'TextGrid':
+    raise Exception(
+      'The file could not be parsed as a TextGrid as it is lacking a proper header.')
+
+
+def _decode_tokens(tokens: List[bytes], encoding: str, normalize_newlines: bool) -> Generator[str, None, None]:
+  decoded_strings: Dict[bytes, str] = {}
+  # consume the tokens from the end of the list to free each one right after
+  # it was parsed
+  tokens.reverse()
+  while tokens:
+    token = tokens.pop()
+    if token[0] != QUOTE:
+      yield token.decode(encoding)
+      continue
+    value = decoded_strings.get(token)
+    if value is None:
+      value = token.decode(encoding)
+      if normalize_newlines:
+        # same as reading in text mode (universal newlines)
+        value = value.replace("\r\n", "\n").replace("\r", "\n")
+      decoded_strings[token] = value
+    yield value
+
+
+def parse_content(content: str, tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None) -> TextGrid:
+  """
+  Parse a Praat-formatted TextGrid (long or short text format) in a single
+  pass over its values. Yields the same result as `parse_lines`.
+  If tier_names are given, only these tiers are parsed, see `parse_tokens`.
+  """
+  tokens = tokenize(content)
+  return parse_tokens(iter(tokens), tier_names, mark_table)
+
+
+def _get_string(token: str) -> str:
+  if token[0] != '"':
+    raise ValueError('Bad entry: ' + token[:20])
+  return token[1:-1]
+
+
+def _get_mark(token: str) -> str:
+  return _get_string(token).replace('""', '"')
+
+
+def _get_mark_parser(get_mark: Callable[[AnyStr], str], mark_table: Optional[MarkTable]) -> Callable[[AnyStr], str]:
+  """
+  Returns get_mark with a cache, i.e., each distinct mark of a grid is parsed
+  only once and all equal marks are the same object. If mark_table is given,
+  the marks are interned in it, i.e., they are also shared across grids.
+  """
+  marks: Dict[AnyStr, str] = {}
+
+  def parse_mark(value: AnyStr) -> str:
+    mark = marks.get(value)
+    if mark is None:
+      mark = get_mark(value)
+      if mark_table is not None:
+        mark = mark_table.intern(mark)
+      marks[value] = mark
+    return mark
+  return parse_mark
+
+
+def parse_tokens(tokens: Iterator[str], tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None) -> TextGrid:
+  """
+  Build the grid out of the values of a TextGrid file (without its header).
+  If tier_names are given, all other tiers are not parsed into intervals/points
+  but are kept as `UnparsedTier` on the grid. They are not part of `grid.tiers`
+  (therefore they are also not validated) and are written back unchanged at
+  their former position by `save_file_faster`.
+  """
+  result = TextGrid()
+  result.minTime = float(next(tokens))
+  result.maxTime = float(next(tokens))
+  if next(tokens) == '<absent>':
+    return result
+  if tier_names is not None:
+    result.unparsed_tiers = []
+  parse_mark = _get_mark_parser(_get_mark, mark_table)
+  m = int(next(tokens))
+  for position in range(m):
+    tier_class = _get_string(next(tokens))
+    name_value = next(tokens)
+    inam = _get_string(name_value)
+    if tier_names is not None and inam not in tier_names:
+      values = [name_value, next(tokens), next(tokens), next(tokens)]
+      values_per_entry = 3 if tier_class == 'IntervalTier' else 2
+      values.extend(islice(tokens, int(values[3]) * values_per_entry))
+      result.unparsed_tiers.append(UnparsedTier(position, tier_class, inam, values))
+      continue
+    result.append(_parse_tier(tokens, tier_class, inam, result.strict, mark_table, parse_mark))
+  return result
+
+
+def _parse_tier(tokens: Iterator[str], tier_class: str, inam: str, strict: bool, mark_table: Optional[MarkTable] = None, parse_mark: Callable[[str], str] = _get_mark) -> Union[IntervalTier, PointTier]:
+  imin = float(next(tokens))
+  imax = float(next(tokens))
+  n = int(next(tokens))
+  if tier_class == 'IntervalTier':
+    entries = (
+      (float(jmin), float(jmax), parse_mark(jmrk))
+      for jmin, jmax, jmrk in islice(zip(tokens, tokens, tokens), n)
+    )
+    if mark_table is not None:
+      return _get_compact_tier(inam, imin, imax, strict, entries, mark_table)
+    itie = IntervalTier(inam, imin, imax)
+    itie.strict = strict
+    _add_intervals(itie, entries)
+  else:  # pointTier
+    itie = PointTier(inam)
+    for jtim, jmrk in islice(zip(tokens, tokens), n):
+      itie.addPoint(Point(float(jtim), parse_mark(jmrk)))
+  return itie
+
+
+# Praat binary files start with "ooBinaryFile" followed by the class name.
+# Numbers are big-endian, strings are prefixed by their length (8 bit for
+# class names, 16 bit otherwise) and are either ASCII or, marked by a length
+# of 0xFF/0xFFFF followed by the actual length, UTF-16.
+BINARY_HEADER = b"ooBinaryFile"
+
+
+class BinaryReader():
+  def __init__(self, data: bytes, position: int) -> None:
+    self.data = data
+    self.position = position
+
+  def read(self, fmt: Struct) -> Tuple:
+    result = fmt.unpack_from(self.data, self.position)
+    self.position += fmt.size
+    return result
+
+  def read_w8(self) -> str:
+    length = self.data[self.position]
+    self.position += 1
+    if length == 0xFF:
+      length = self.data[self.position]
+      self.position += 1
+      return self._read_utf16(length)
+    return self._read_ascii(length)
+
+  def read_w16(self) -> str:
+    length, = self.read(UINT16)
+    if length == 0xFFFF:
+      length, = self.read(UINT16)
+      return self._read_utf16(length)
+    return self._read_ascii(length)
+
+  def _read_ascii(self, length: int) -> str:
+    end = self.position + length
+    if end > len(self.data):
+      raise EOFError()
+    result = self.data[self.position:end].decode("latin-1")
+    self.position = end
+    return result
+
+  def _read_utf16(self, length: int) -> str:
+    # length is the count of characters, characters outside of the BMP take two code units
+    start = self.position
+    end = start + 2 * length
+    while True:
+      if end > len(self.data):
+        raise EOFError()
+      result, _ = utf_16_be_decode(self.data[start:end])
+      if len(result) == length:
+        break
+      end += 2 * (length - len(result))
+    self.position = end
+    return result
+
+
+UINT16 = Struct(">H")
+INT32 = Struct(">i")
+DOUBLE = Struct(">d")
+BOOL = Struct(">?")
+DOUBLE_DOUBLE = Struct(">dd")
+TIER_HEADER = Struct(">ddi")
+INTERVAL = Struct(">ddH")
+
+
+def _decode_latin1(data: bytes) -> str:
+  return data.decode("latin-1")
+
+
+def parse_binary(data: bytes, tier_names: Optional[Set[str]] = None, mark_table: Optional[MarkTable] = None) -> TextGrid:
+  """
+  Parse a TextGrid in Praat's binary format (ooBinaryFile).
+  If tier_names are given, only these tiers are parsed, see `parse_tokens`.
+  """
+  if data[:len(BINARY_HEADER)] != BINARY_HEADER:
+    raise Exception(
+      'The file could not be parsed as a Praat binary file as it is lacking a proper header.')
+  reader = BinaryReader(data, len(BINARY_HEADER))
+  if reader.read_w8() != 'TextGrid':
+    raise Exception(
+      'The file could not be parsed as a TextGrid as it is lacking a proper header.')
+  result = TextGrid()
+  result.minTime, result.maxTime = reader.read(DOUBLE_DOUBLE)
+  tiers_exist, = reader.read(BOOL)
+  if not tiers_exist:
+    return result
+  if tier_names is not None:
+    result.unparsed_tiers = []
+  parse_mark = _get_mark_parser(_decode_latin1, mark_table)
+  m, = reader.read(INT32)
+  for position in range(m):
+    tier_class = reader.read_w8()
+    start = reader.position
+    inam = reader.read_w16()
+    if tier_names is not None and inam not in tier_names:
+      _parse_binary_tier(reader, tier_class, inam, result.strict)
+      content = data[start:reader.position]
+      result.unparsed_tiers.append(UnparsedTier(position, tier_class, inam, content))
+      continue
+    result.append(_parse_binary_tier(reader, tier_class, inam, result.strict, mark_table, parse_mark))
+  return result
+
+
+def _parse_binary_tier(reader: BinaryReader, tier_class: str, inam: str, strict: bool, mark_table: Optional[MarkTable] = None, parse_mark: Callable[[bytes], str] = _decode_latin1) -> Union[IntervalTier, PointTier]:
+  imin, imax, n = reader.read(TIER_HEADER)
+  if tier_class == 'IntervalTier':
+    if mark_table is not None:
+      return _get_compact_tier(inam, imin, imax, strict, _read_binary_intervals(reader, n, parse_mark), mark_table)
+    itie = IntervalTier(inam, imin, imax)
+    itie.strict = strict
+    _add_intervals(itie, _read_binary_intervals(reader, n, parse_mark))
+  else:  # pointTier
+    itie = PointTier(inam)
+    for _ in range(n):
+      jtim, = reader.read(DOUBLE)
+      itie.addPoint(Point(jtim, reader.read_w16()))
+  return itie
+
+
+def _read_binary_intervals(reader: BinaryReader, n: int, parse_mark: Callable[[bytes], str] = _decode_latin1) -> Generator[Tuple[float, float, str], None, None]:
+  # inlined version of reading xmin, xmax and the ASCII text of each interval
+  data = reader.data
+  position = reader.position
+  unpack_interval = INTERVAL.unpack_from
+  for _ in range(n):
+    jmin, jmax, length = unpack_interval(data, position)
+    position += INTERVAL.size
+    if length == 0xFFFF:
+      reader.position = position - UINT16.size
+      jmrk = reader.read_w16()
+      position = reader.position
+    else:
+      end = position + length
+      if end > len(data):
+        raise EOFError()
+      jmrk = parse_mark(data[position:end])
+      position = end
+    yield jmin, jmax, jmrk
+  reader.position = position
 
 
 def parse_lines(lines: Iterator[str]) -> TextGrid:
@@ -105,6 +556,8 @@ def parse_lines(lines: Iterator[str]) -> TextGrid:
     m = int(next(lines).strip().split()[2])  # will be self.n
   if not short:
     next(lines)
+  # equal marks are the same object
+  marks: Dict[str, str] = {}
   for i in range(m):  # loop over grids
     if not short:
       next(lines)
@@ -121,6 +574,7 @@ def parse_lines(lines: Iterator[str]) -> TextGrid:
         jmin = parse_line(next(lines), short)
         jmax = parse_line(next(lines), short)
         jmrk = _getMark(lines, short)
+        jmrk = marks.setdefault(jmrk, jmrk)
         if jmin < jmax:  # non-null
           itie.addInterval(Interval(jmin, jmax, jmrk))
       result.append(itie)
@@ -134,6 +588,7 @@ def parse_lines(lines: Iterator[str]) -> TextGrid:
         next(lines)  # header junk
         jtim = parse_line(next(lines), short)
         jmrk = _getMark(lines, short)
+        jmrk = marks.setdefault(jmrk, jmrk)
         itie.addPoint(Point(jtim, jmrk))
       result.append(itie)
   # duration = perf_counter() - start
@@ -141,11 +596,204 @@ def parse_lines(lines: Iterator[str]) -> TextGrid:
   return result
 
 
-def save_file_faster(grid: TextGrid, path: Path, encoding: str) -> None:
-  lines = get_lines(grid)
-  text = "\n".join(lines)
-  with open(path, "w", encoding=encoding) as f:
-    f.write(text)
+TEXT_FORMAT = "text"
+SHORT_TEXT_FORMAT = "short"
+BINARY_FORMAT = "binary"
+OUTPUT_FORMATS = (TEXT_FORMAT, SHORT_TEXT_FORMAT, BINARY_FORMAT)
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+# amount of parts that are joined before they are written to the file
+WRITE_BATCH_SIZE = 4096
+
+
+def save_file_faster(grid: TextGrid, path: Path, encoding: str, output_format: str = TEXT_FORMAT) -> None:
+  """
+  The file is compressed if path has the extension of a compression (e.g. .gz).
+  """
+  if output_format == BINARY_FORMAT:
+    with open_file(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+      for batch in _get_batches(get_binary_parts(grid)):
+        f.write(b"".join(batch))
+    return
+  assert output_format in (TEXT_FORMAT, SHORT_TEXT_FORMAT)
+  parts = get_text_parts(grid, short=output_format == SHORT_TEXT_FORMAT)
+  with open_file(path, "wt", encoding=encoding, buffering=WRITE_BUFFER_SIZE) as f:
+    for batch in _get_batches(parts):
+      f.write("".join(batch))
+
+
+def get_file_data(grid: TextGrid, encoding: str, output_format: str = TEXT_FORMAT) -> bytes:
+  """
+  Returns the content of the file that `save_file_faster` writes.
+  """
+  if output_format == BINARY_FORMAT:
+    return b"".join(get_binary_parts(grid))
+  assert output_format in (TEXT_FORMAT, SHORT_TEXT_FORMAT)
+  text = "".join(get_text_parts(grid, short=output_format == SHORT_TEXT_FORMAT))
+  if os.linesep != "\n":
+    # same as writing in text mode
+    text = text.replace("\n", os.linesep)
+  return text.encode(encoding)
+
+
+def _get_batches(parts: Iterator[Union[str, bytes]]) -> Generator[List[Union[str, bytes]], None, None]:
+  parts = iter(parts)
+  while True:
+    batch = list(islice(parts, WRITE_BATCH_SIZE))
+    if len(batch) == 0:
+      break
+    yield batch
+
+
+class TextTemplates():
+  def __init__(self, file_type: str, object_class: str, grid: str, interval_tier: str, intervals: str, interval: str, point_tier: str, points: str, point: str) -> None:
+    self.file_type = file_type
+    self.object_class = object_class
+    self.grid = grid
+    self.interval_tier = interval_tier
+    self.intervals = intervals
+    self.interval = interval
+    self.point_tier = point_tier
+    self.points = points
+    self.point = point
+
+
+# the templates produce the same output as `get_lines`
+LONG_TEMPLATES = TextTemplates(
+  file_type='File type = "ooTextFile"\n',
+  object_class='Object class = "{0}"\n\n',
+  grid='xmin = {0} \nxmax = {1} \ntiers? <exists> \nsize = {2} \nitem []: \n',
+  interval_tier='    item [{0}]:\n'
+  '        class = "IntervalTier" \n'
+  '        name = {1} \n'
+  '        xmin = {2} \n'
+  '        xmax = {3} \n',
+  intervals='        intervals: size = {0} \n',
+  interval='        intervals [{0}]:\n'
+  '            xmin = {1} \n'
+  '            xmax = {2} \n'
+  '            text = {3} \n',
+  point_tier='    item [{0}]:\n'
+  '        class = "TextTier" \n'
+  '        name = {1} \n'
+  '        xmin = {2} \n'
+  '        xmax = {3} \n',
+  points='        points: size = {0} \n',
+  point='            points [{0}]: \n'
+  '                time = {1} \n'
+  '                mark = {2} \n',
+)
+
+SHORT_TEMPLATES = TextTemplates(
+  file_type='File type = "ooTextFile short"\n',
+  object_class='"{0}"\n\n',
+  grid='{0}\n{1}\n<exists>\n{2}\n',
+  interval_tier='"IntervalTier"\n{1}\n{2}\n{3}\n',
+  intervals='{0}\n',
+  interval='{1}\n{2}\n{3}\n',
+  point_tier='"TextTier"\n{1}\n{2}\n{3}\n',
+  points='{0}\n',
+  point='{1}\n{2}\n',
+)
+
+
+def get_text_parts(grid: TextGrid, short: bool = False, null='') -> Generator[str, None, None]:
+  """
+  Write the grid in Praat's text format (long or short) in parts that end
+  with a new-line. Gaps between intervals are filled with null intervals.
+  """
+  templates = SHORT_TEMPLATES if short else LONG_TEMPLATES
+  max_time = _get_max_time(grid)
+  max_time_str = _get_time_str(max_time)
+  tiers = get_tiers_in_file_order(grid)
+  yield templates.file_type
+  yield templates.object_class.format('TextGrid')
+  yield templates.grid.format(_get_time_str(grid.minTime), max_time_str, len(tiers))
+  for (i, tier) in enumerate(tiers, 1):
+    if tier.__class__ == UnparsedTier:
+      if not tier.is_binary:
+        yield from _get_unparsed_tier_parts(tier, i, templates)
+        continue
+      tier = parse_unparsed_tier(tier)
+    name = _get_quoted(tier.name)
+    min_time_str = _get_time_str(tier.minTime)
+    if isinstance(tier, IntervalTier):
+      yield templates.interval_tier.format(i, name, min_time_str, max_time_str)
+      yield templates.intervals.format(len(tier) + _get_gap_count(tier))
+      yield from _get_interval_parts(tier, templates.interval, null)
+    elif isinstance(tier, PointTier):
+      yield templates.point_tier.format(i, name, min_time_str, max_time_str)
+      yield templates.points.format(len(tier))
+      format_point = templates.point.format
+      for (k, point) in enumerate(tier, 1):
+        yield format_point(k, _get_time_str(point.time), _get_quoted(point.mark))
+
+
+def _get_interval_parts(tier: IntervalTier, template: str, null: str) -> Generator[str, None, None]:
+  format_interval = template.format
+  null = _get_quoted(null)
+  prev_time = tier.minTime
+  # the end of an interval is usually the start of the next one
+  prev_time_str = _get_time_str(prev_time)
+  j = 0
+  for interval in iter_intervals(tier):
+    min_time = interval.minTime
+    if min_time != prev_time:
+      min_time_str = _get_time_str(min_time)
+      if prev_time < min_time:
+        j += 1
+        yield format_interval(j, prev_time_str, min_time_str, null)
+      prev_time_str = min_time_str
+    prev_time = interval.maxTime
+    max_time_str = _get_time_str(prev_time)
+    j += 1
+    yield format_interval(j, prev_time_str, max_time_str, _get_quoted(interval.mark))
+    prev_time_str = max_time_str
+  if tier.maxTime is not None and prev_time < tier.maxTime:
+    j += 1
+    yield format_interval(j, prev_time_str, _get_time_str(tier.maxTime), null)
+
+
+def _get_gap_count(tier: IntervalTier) -> int:
+  # same as len(_fillInTheGaps(tier)) - len(tier.intervals)
+  result = 0
+  prev_time = tier.minTime
+  for interval in iter_intervals(tier):
+    if prev_time < interval.minTime:
+      result += 1
+    prev_time = interval.maxTime
+  if tier.maxTime is not None and prev_time < tier.maxTime:
+    result += 1
+  return result
+
+
+def _get_unparsed_tier_parts(tier: UnparsedTier, i: int, templates: TextTemplates) -> Generator[str, None, None]:
+  values = iter(tier.content)
+  name, min_time, max_time, size = islice(values, 4)
+  if tier.tier_class == 'IntervalTier':
+    yield templates.interval_tier.format(i, name, min_time, max_time)
+    yield templates.intervals.format(size)
+    format_interval = templates.interval.format
+    for (j, (jmin, jmax, jmrk)) in enumerate(zip(values, values, values), 1):
+      yield format_interval(j, jmin, jmax, jmrk)
+  else:
+    yield templates.point_tier.format(i, name, min_time, max_time)
+    yield templates.points.format(size)
+    format_point = templates.point.format
+    for (k, (jtim, jmrk)) in enumerate(zip(values, values), 1):
+      yield format_point(k, jtim, jmrk)
+
+
+def _get_time_str(time: Union[float, int]) -> str:
+  # same as str(try_get_time_as_int(time))
+  result = str(time)
+  if result.endswith(".0"):
+    return result[:-2]
+  return result
+
+
+def _get_quoted(text: str) -> str:
+  return '"' + text.replace('"', '""') + '"'
 
 
 def try_get_time_as_int(time: Union[float, int]) -> Union[int, float]:
@@ -169,18 +817,20 @@ def get_lines(grid: TextGrid, null='') -> Generator[str, None, None]:
   yield 'Object class = "TextGrid"'
   yield ""
   yield 'xmin = {0} '.format(try_get_time_as_int(grid.minTime))
-  # compute max time
-  maxT = grid.maxTime
-  if not maxT:
-    maxT = max([t.maxTime if t.maxTime else t[-1].maxTime
-                for t in grid.tiers])
+  maxT = _get_max_time(grid)
   yield 'xmax = {0} '.format(try_get_time_as_int(maxT))
   yield 'tiers? <exists> '
-  yield 'size = {0} '.format(len(grid))
+  tiers = get_tiers_in_file_order(grid)
+  yield 'size = {0} '.format(len(tiers))
   yield 'item []: '
-  for (i, tier) in enumerate(grid.tiers, 1):
+  for (i, tier) in enumerate(tiers, 1):
     yield '    item [{0}]:'.format(i)
-    if tier.__class__ == IntervalTier:
+    if tier.__class__ == UnparsedTier:
+      if not tier.is_binary:
+        yield from _get_unparsed_tier_lines(tier)
+        continue
+      tier = parse_unparsed_tier(tier)
+    if isinstance(tier, IntervalTier):
       yield '        class = "IntervalTier" '
       yield '        name = "{0}" '.format(tier.name)
       yield '        xmin = {0} '.format(try_get_time_as_int(tier.minTime))
@@ -194,7 +844,7 @@ def get_lines(grid: TextGrid, null='') -> Generator[str, None, None]:
         yield '            xmax = {0} '.format(try_get_time_as_int(interval.maxTime))
         mark = _formatMark(interval.mark)
         yield '            text = "{0}" '.format(mark)
-    elif tier.__class__ == PointTier:  # PointTier
+    elif isinstance(tier, PointTier):  # PointTier
       yield '        class = "TextTier" '
       yield '        name = "{0}" '.format(tier.name)
       yield '        xmin = {0} '.format(try_get_time_as_int(tier.minTime))
@@ -209,6 +859,101 @@ def get_lines(grid: TextGrid, null='') -> Generator[str, None, None]:
   yield ""
 
 
+def _get_max_time(grid: TextGrid) -> float:
+  maxT = grid.maxTime
+  if not maxT:
+    maxT = max([t.maxTime if t.maxTime else t[-1].maxTime
+                for t in grid.tiers])
+  return maxT
+
+
+def get_tiers_in_file_order(grid: TextGrid) -> List[Union[IntervalTier, PointTier, UnparsedTier]]:
+  result = list(grid.tiers)
+  for unparsed_tier in sorted(get_unparsed_tiers(grid), key=lambda x: x.position):
+    result.insert(min(unparsed_tier.position, len(result)), unparsed_tier)
+  return result
+
+
+def _get_unparsed_tier_lines(tier: UnparsedTier) -> Generator[str, None, None]:
+  values = iter(tier.content)
+  if tier.tier_class == 'IntervalTier':
+    yield '        class = "IntervalTier" '
+    yield '        name = {0} '.format(next(values))
+    yield '        xmin = {0} '.format(next(values))
+    yield '        xmax = {0} '.format(next(values))
+    yield '        intervals: size = {0} '.format(next(values))
+    for (j, (jmin, jmax, jmrk)) in enumerate(zip(values, values, values), 1):
+      yield '        intervals [{0}]:'.format(j)
+      yield '            xmin = {0} '.format(jmin)
+      yield '            xmax = {0} '.format(jmax)
+      yield '            text = {0} '.format(jmrk)
+  else:
+    yield '        class = "TextTier" '
+    yield '        name = {0} '.format(next(values))
+    yield '        xmin = {0} '.format(next(values))
+    yield '        xmax = {0} '.format(next(values))
+    yield '        points: size = {0} '.format(next(values))
+    for (k, (jtim, jmrk)) in enumerate(zip(values, values), 1):
+      yield '            points [{0}]: '.format(k)
+      yield '                time = {0} '.format(jtim)
+      yield '                mark = {0} '.format(jmrk)
+
+
+def get_binary_parts(grid: TextGrid, null='') -> Generator[bytes, None, None]:
+  """
+  Write the current state in Praat's binary format (ooBinaryFile).
+  """
+  maxT = _get_max_time(grid)
+  tiers = get_tiers_in_file_order(grid)
+  yield BINARY_HEADER
+  yield _get_w8('TextGrid')
+  yield DOUBLE_DOUBLE.pack(grid.minTime, maxT)
+  yield BOOL.pack(True)
+  yield INT32.pack(len(tiers))
+  encoded_marks = {}
+  for tier in tiers:
+    if tier.__class__ == UnparsedTier:
+      if tier.is_binary:
+        yield _get_w8(tier.tier_class)
+        yield tier.content
+        continue
+      tier = parse_unparsed_tier(tier)
+    if isinstance(tier, IntervalTier):
+      output = _fillInTheGaps(tier, null)
+      yield _get_w8('IntervalTier')
+      yield _get_w16(tier.name)
+      yield TIER_HEADER.pack(tier.minTime, maxT, len(output))
+      for interval in output:
+        yield DOUBLE_DOUBLE.pack(interval.minTime, interval.maxTime)
+        mark = interval.mark
+        encoded_mark = encoded_marks.get(mark)
+        if encoded_mark is None:
+          encoded_mark = _get_w16(mark)
+          encoded_marks[mark] = encoded_mark
+        yield encoded_mark
+    elif isinstance(tier, PointTier):
+      yield _get_w8('TextTier')
+      yield _get_w16(tier.name)
+      yield TIER_HEADER.pack(tier.minTime, maxT, len(tier))
+      for point in tier:
+        yield DOUBLE.pack(point.time)
+        yield _get_w16(point.mark)
+
+
+def _get_w8(text: str) -> bytes:
+  if text.isascii():
+    return bytes((len(text),)) + text.encode("ascii")
+  return bytes((0xFF, len(text))) + text.encode("utf-16-be")
+
+
+def _get_w16(text: Optional[str]) -> bytes:
+  if text is None:
+    text = ""
+  if text.isascii():
+    return UINT16.pack(len(text)) + text.encode("ascii")
+  return UINT16.pack(0xFFFF) + UINT16.pack(len(text)) + text.encode("utf-16-be")
+
+
 def _formatMark(text):
   return text.replace('"', '""')
 
@@ -219,7 +964,7 @@ def _fillInTheGaps(tier: IntervalTier, null):
   """
   prev_t = tier.minTime
   output = []
-  for interval in tier.intervals:
+  for interval in iter_intervals(tier):
     if prev_t < interval.minTime:
       output.append(Interval(prev_t, interval.minTime, null))
     output.append(interval)
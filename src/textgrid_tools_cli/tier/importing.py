@@ -5,9 +5,10 @@ from tqdm import tqdm
 from textgrid_tools.tier.importing import import_text_to_tier
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (add_directory_argument, add_encoding_argument,
-                                       add_overwrite_argument, add_tier_argument, get_optional,
-                                       get_text_files, parse_existing_directory, parse_path,
-                                       try_load_grid, try_save_grid)
+                                       add_output_format_argument, add_overwrite_argument,
+                                       add_tier_argument, get_optional, get_text_files,
+                                       parse_existing_directory, parse_path, try_load_grid,
+                                       try_save_grid)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
 
 
@@ -24,6 +25,7 @@ def get_importing_parser(parser: ArgumentParser):
   parser.add_argument('--sep', type=str, metavar="SYMBOL",
                       help="use this symbol to separate the marks of each interval", default="\n")
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
   return import_text_to_tier_ns
 
 
@@ -81,7 +83,7 @@ def import_text_to_tier_ns(ns: Namespace) -> ExecutionResult:
       flogger.info("Skipped.")
       continue
 
-    error = try_save_grid(grid_file_out_abs, grid, ns.encoding)
+    error = try_save_grid(grid_file_out_abs, grid, ns.encoding, ns.output_format)
     if error is not None:
       flogger.debug(error.exception)
       flogger.error(error.default_message)
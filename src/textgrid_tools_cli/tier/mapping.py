@@ -7,16 +7,18 @@ from textgrid_tools import map_tier
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
 from textgrid_tools_cli.helper import (ConvertToOrderedSetAction, add_chunksize_argument,
-                                       add_directory_argument, add_dry_run_argument,
-                                       add_encoding_argument, add_maxtaskperchild_argument,
-                                       add_n_jobs_argument, add_output_directory_argument,
-                                       add_overwrite_argument, add_tier_argument,
-                                       parse_non_empty_or_whitespace)
+                                       add_corpus_argument, add_dry_run_argument,
+                                       add_encoding_argument, add_io_threads_argument,
+                                       add_manifest_argument, add_maxtaskperchild_argument,
+                                       add_n_jobs_argument, add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
+                                       add_tier_argument, parse_non_empty_or_whitespace)
 
 
 def get_mapping_parser(parser: ArgumentParser):
   parser.description = "This command maps the content of a tier to another tier while ignoring empty intervals on default."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tier_argument(parser, "tier which should be mapped")
   parser.add_argument("target_tiers", metavar="TARGET-TIER",
                       type=parse_non_empty_or_whitespace, nargs="+", help="tiers to which the content should be mapped", action=ConvertToOrderedSetAction)
@@ -33,9 +35,14 @@ def get_mapping_parser(parser: ArgumentParser):
   add_output_directory_argument(parser)
   add_encoding_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_map_tier
 
@@ -52,4 +59,4 @@ def app_map_tier(ns: Namespace) -> ExecutionResult:
     filter_to_mode=ns.filter_to_mode,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
@@ -5,10 +5,13 @@ from math import inf
 from textgrid_tools import mark_silence
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (add_chunksize_argument, add_directory_argument,
+from textgrid_tools_cli.helper import (add_chunksize_argument, add_corpus_argument,
                                        add_dry_run_argument, add_encoding_argument,
+                                       add_io_threads_argument, add_manifest_argument,
                                        add_maxtaskperchild_argument, add_n_jobs_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
+                                       add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
                                        add_tiers_argument, parse_non_empty,
                                        parse_non_negative_float)
 from textgrid_tools_cli.logging_configuration import init_and_get_console_logger
@@ -34,7 +37,7 @@ class MaxNotGreaterThanMinError(ValidationError):
 
 def get_label_silence_parser(parser: ArgumentParser):
   parser.description = "This command labels silence intervals."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   add_tiers_argument(parser, "tiers where to label silence")
   parser.add_argument("--mark", type=parse_non_empty, metavar="ASSIGN-MARK",
                       help="mark to assign to silence intervals", default="sil")
@@ -45,9 +48,14 @@ def get_label_silence_parser(parser: ArgumentParser):
   add_encoding_argument(parser)
   add_output_directory_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
   add_n_jobs_argument(parser)
   add_chunksize_argument(parser)
   add_maxtaskperchild_argument(parser)
+  add_io_threads_argument(parser)
   add_dry_run_argument(parser)
   return app_label_silence
 
@@ -66,4 +74,4 @@ def app_label_silence(ns: Namespace) -> ExecutionResult:
     max_duration=ns.max_duration,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
@@ -6,10 +6,13 @@ from pronunciation_dictionary import DeserializationOptions, MultiprocessingOpti
 from textgrid_tools import transcribe_text
 from textgrid_tools_cli.common import process_grids_mp
 from textgrid_tools_cli.globals import ExecutionResult
-from textgrid_tools_cli.helper import (add_chunksize_argument, add_directory_argument,
+from textgrid_tools_cli.helper import (add_chunksize_argument, add_corpus_argument,
                                        add_dry_run_argument, add_encoding_argument,
+                                       add_io_threads_argument, add_manifest_argument,
                                        add_maxtaskperchild_argument, add_n_jobs_argument,
-                                       add_output_directory_argument, add_overwrite_argument,
+                                       add_output_compression_argument,
+                                       add_output_directory_argument, add_output_format_argument,
+                                       add_overwrite_argument, add_skip_unchanged_argument,
                                        add_tiers_argument, get_optional, parse_existing_file,
                                        parse_non_negative_integer, parse_positive_integer)
 from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_get_console_logger
@@ -17,7 +20,7 @@ from textgrid_tools_cli.logging_configuration import get_file_logger, init_and_g
 
 def get_transcription_parser(parser: ArgumentParser):
   parser.description = "This command transcribes words using a pronunciation dictionary."
-  add_directory_argument(parser)
+  add_corpus_argument(parser)
   parser.add_argument("dictionary", metavar="DICTIONARY", type=parse_existing_file,
                       help="path to the pronunciation dictionary that contains pronunciations to all occurring marks")
   add_tiers_argument(parser, "tiers which should be transcribed")
@@ -30,6 +33,10 @@ def get_transcription_parser(parser: ArgumentParser):
   add_deserialization_group(parser)
   add_output_directory_argument(parser)
   add_overwrite_argument(parser)
+  add_output_format_argument(parser)
+  add_skip_unchanged_argument(parser)
+  add_output_compression_argument(parser)
+  add_manifest_argument(parser)
 
   mp_group = parser.add_argument_group('multiprocessing arguments')
   add_n_jobs_argument(mp_group)
@@ -37,6 +44,7 @@ def get_transcription_parser(parser: ArgumentParser):
   mp_group.add_argument("-sd", "--chunksize-dictionary", type=parse_positive_integer, metavar="NUMBER",
                         help="amount of lines to chunk into one job", default=10000)
   add_maxtaskperchild_argument(mp_group)
+  add_io_threads_argument(mp_group)
   add_dry_run_argument(parser)
   return app_transcribe_text_v2
 
@@ -76,4 +84,4 @@ def app_transcribe_text_v2(ns: Namespace) -> ExecutionResult:
     replace_missing=ns.assign_mark_to_missing,
   )
 
-  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry)
+  return process_grids_mp(ns.directory, ns.encoding, ns.output_directory, ns.overwrite, method, ns.chunksize, ns.n_jobs, ns.maxtasksperchild, ns.dry, tier_names=ns.tiers, output_format=ns.output_format, skip_unchanged=ns.skip_unchanged, output_compression=ns.output_compression, manifest=ns.manifest, io_threads=ns.io_threads)
@@ -0,0 +1,34 @@
+from random import Random
+from time import perf_counter
+from typing import Callable, List
+
+from textgrid import Interval, IntervalTier, TextGrid
+
+SYMBOLS = [
+  "a", "b", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "r", "s", "t", "u",
+  "v", "w", "z", "aɪ", "aʊ", "eɪ", "oʊ", "ɔɪ", "ŋ", "ʃ", "ʒ", "θ", "ð", "ɹ", "ə", "ɛ", "ɪ", "ʊ", "ʌ",
+  "æ", "ɑ", "ɔ", "tʃ", "dʒ", "\"", "",
+]
+
+
+def create_synthetic_grid(n_tiers: int, n_intervals: int, seed: int = 1111) -> TextGrid:
+  rng = Random(seed)
+  max_time = n_intervals * 0.08
+  grid = TextGrid(None, 0, max_time)
+  for tier_nr in range(n_tiers):
+    tier = IntervalTier(f"tier{tier_nr}", 0, max_time)
+    boundaries = sorted(rng.sample(range(1, n_intervals * 8), n_intervals - 1))
+    times = [0] + [boundary / 100 for boundary in boundaries] + [max_time]
+    for min_time, max_time_interval in zip(times[:-1], times[1:]):
+      tier.intervals.append(Interval(min_time, max_time_interval, rng.choice(SYMBOLS)))
+    grid.tiers.append(tier)
+  return grid
+
+
+def measure(method: Callable[[], object], repetitions: int) -> float:
+  durations: List[float] = []
+  for _ in range(repetitions):
+    start = perf_counter()
+    method()
+    durations.append(perf_counter() - start)
+  return min(durations)
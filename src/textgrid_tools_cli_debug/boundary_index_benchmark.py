@@ -0,0 +1,39 @@
+from copy import deepcopy
+
+from textgrid import TextGrid
+
+from textgrid_tools.intervals.boundary_fixing import fix_interval_boundaries
+from textgrid_tools.validation import BoundaryError
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+
+
+def create_grid(n_intervals: int) -> TextGrid:
+  # tier1 contains all boundaries of tier0 slightly shifted
+  grid = create_synthetic_grid(n_tiers=1, n_intervals=n_intervals)
+  tier = deepcopy(grid.tiers[0])
+  tier.name = "tier1"
+  for interval in tier.intervals[1:]:
+    interval.minTime += 0.001
+  for interval in tier.intervals[:-1]:
+    interval.maxTime += 0.001
+  grid.tiers.append(tier)
+  return grid
+
+
+def run_benchmark() -> None:
+  for n_intervals in (1_000, 10_000, 100_000):
+    grid = create_grid(n_intervals)
+
+    def validate():
+      timepoints = [interval.minTime for interval in grid.tiers[0].intervals]
+      return BoundaryError.validate(timepoints, [grid.tiers[0]])
+
+    def fix():
+      fix_interval_boundaries(deepcopy(grid), "tier0", {"tier1"}, 0.01, None)
+
+    print(f"Intervals: {n_intervals}, BoundaryError.validate: {measure(validate, 3):.3f} s, "
+          f"fix_interval_boundaries: {measure(fix, 1):.3f} s")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,93 @@
+import pickle
+from collections import OrderedDict
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+
+from pronunciation_dictionary import PronunciationDict
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools import transcribe_text
+from textgrid_tools.globals import ExecutionResult
+from textgrid_tools_cli.common import process_grids_mp
+from textgrid_tools_cli.textgrid_io import read_file_faster, save_file_faster
+
+N_ENTRIES = 500_000
+N_FILES = 40
+N_WORDS = 20
+N_JOBS = 4
+
+
+def create_dictionary(n_entries: int) -> PronunciationDict:
+  result: PronunciationDict = OrderedDict()
+  for nr in range(n_entries):
+    result[f"w{nr}"] = OrderedDict({(f"p{nr % 40}", f"p{nr % 13}"): 1.0})
+  return result
+
+
+def create_grid(file_nr: int) -> TextGrid:
+  grid = TextGrid(None, 0, N_WORDS)
+  tier = IntervalTier("words", 0, N_WORDS)
+  for nr in range(N_WORDS):
+    tier.intervals.append(Interval(nr, nr + 1, f"w{file_nr * N_WORDS + nr}"))
+  grid.tiers.append(tier)
+  return grid
+
+
+def get_method(dictionary: PronunciationDict) -> Callable[[TextGrid], ExecutionResult]:
+  return partial(
+    transcribe_text,
+    tier_names={"words"},
+    pronunciation_dictionary=dictionary,
+    seed=None,
+    ignore_missing=True,
+    replace_missing=None,
+  )
+
+
+def transcribe_file(path: Path, method: Callable[[TextGrid], ExecutionResult]) -> ExecutionResult:
+  grid = read_file_faster(path, "utf-8")
+  return method(grid, logger=None)
+
+
+def process_files_per_task(paths, method: Callable[[TextGrid], ExecutionResult]) -> None:
+  # former implementation: the method is sent with each file
+  with Pool(processes=N_JOBS) as pool:
+    list(pool.imap_unordered(partial(transcribe_file, method=method), paths, chunksize=1))
+
+
+def run_benchmark() -> None:
+  dictionary = create_dictionary(N_ENTRIES)
+  small_dictionary = create_dictionary(N_FILES * N_WORDS)
+  method = get_method(dictionary)
+  method_size = len(pickle.dumps(method, pickle.HIGHEST_PROTOCOL))
+  print(f"Entries: {N_ENTRIES}, files: {N_FILES}, jobs: {N_JOBS}")
+  print(f"Pickled method (MB): {method_size / 1024 / 1024:.1f}")
+
+  with TemporaryDirectory() as tmp_dir:
+    directory = Path(tmp_dir)
+    paths = []
+    for file_nr in range(N_FILES):
+      path = directory / f"{file_nr}.TextGrid"
+      save_file_faster(create_grid(file_nr), path, "utf-8")
+      paths.append(path)
+
+    for name, run in (
+      ("per task (small dictionary)", lambda: process_files_per_task(paths, get_method(small_dictionary))),
+      ("per task", lambda: process_files_per_task(paths, method)),
+      ("per worker (small dictionary)", lambda: process_grids_mp(
+        directory, "utf-8", None, True, get_method(small_dictionary), 1, N_JOBS, None, True)),
+      ("per worker", lambda: process_grids_mp(
+        directory, "utf-8", None, True, method, 1, N_JOBS, None, True)),
+    ):
+      start = perf_counter()
+      run()
+      duration = perf_counter() - start
+      print(f"{name}: {duration:.3f} s ({duration / N_FILES * 1000:.2f} ms per file)")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,35 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from textgrid_tools_cli.grid_caching import load_grid_cached, set_cache_directory
+from textgrid_tools_cli.textgrid_io import read_file_faster, save_file_faster
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+
+
+def run_benchmark() -> None:
+  grid = create_synthetic_grid(n_tiers=4, n_intervals=100_000)
+  with TemporaryDirectory() as tmp_dir:
+    path = Path(tmp_dir) / "grid.TextGrid"
+    save_file_faster(grid, path, "utf-8")
+    set_cache_directory(Path(tmp_dir) / "cache")
+    load_grid_cached(path, "utf-8")
+
+    def parse() -> None:
+      read_file_faster(path, "utf-8")
+
+    def load_from_cache() -> None:
+      load_grid_cached(path, "utf-8")
+
+    duration_parse = measure(parse, 3)
+    duration_cache = measure(load_from_cache, 3)
+    cache_size = sum(file.stat().st_size for file in (Path(tmp_dir) / "cache").iterdir())
+    print(f"Size (MB): {path.stat().st_size / 1024 / 1024:.2f}")
+    print(f"Cache size (MB): {cache_size / 1024 / 1024:.2f}")
+    set_cache_directory(None)
+  print(f"read_file_faster (s): {duration_parse:.3f}")
+  print(f"load_grid_cached (s): {duration_cache:.3f}")
+  print(f"Speedup: {duration_parse / duration_cache:.2f}x")
+
+
+if __name__ == "__main__":
+  run_benchmark()
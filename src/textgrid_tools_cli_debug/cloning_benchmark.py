@@ -0,0 +1,64 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.cloning import copy_intervals, copy_tier, get_shared_tier
+from textgrid_tools.grid.splitting import extract_grid
+from textgrid_tools.helper import get_intervals_on_tier
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+from textgrid_tools_cli_debug.reading_benchmark import measure_peak_memory
+
+N_INTERVALS = 100_000
+N_SEGMENTS = 1_000
+
+
+def copy_tier_deep(tier: IntervalTier) -> IntervalTier:
+  # former implementation of copy_tier
+  result = IntervalTier(tier.name, tier.minTime, tier.maxTime)
+  result.intervals.extend(copy_intervals(tier.intervals, False))
+  return result
+
+
+def extract_grid_deep(grid: TextGrid, interval: Interval) -> TextGrid:
+  # former implementation of extract_grid
+  result = TextGrid(grid.name, 0, 0)
+  for tier in grid.tiers:
+    intervals = list(copy_intervals(get_intervals_on_tier(interval, tier), False))
+    offset = intervals[0].minTime
+    for x in intervals:
+      x.minTime -= offset
+      x.maxTime -= offset
+    excerpt = IntervalTier(tier.name, 0, intervals[-1].maxTime)
+    excerpt.intervals.extend(intervals)
+    result.tiers.append(excerpt)
+  result.maxTime = result.tiers[0].maxTime
+  return result
+
+
+def run_benchmark() -> None:
+  grid = create_synthetic_grid(n_tiers=1, n_intervals=N_INTERVALS)
+  tier = grid.tiers[0]
+  # segments of consecutive intervals
+  step = N_INTERVALS // N_SEGMENTS
+  segments = [
+    Interval(tier.intervals[i].minTime, tier.intervals[i + step - 1].maxTime, "")
+    for i in range(0, N_INTERVALS, step)
+  ]
+
+  def extract_deep():
+    return [extract_grid_deep(grid, segment) for segment in segments]
+
+  def extract_copy_on_write():
+    shared_tiers = [get_shared_tier(grid_tier) for grid_tier in grid.tiers]
+    return [extract_grid(grid, segment, shared_tiers) for segment in segments]
+
+  print(f"Intervals: {N_INTERVALS}, segments: {N_SEGMENTS}")
+  for name, method in (("clone (deep copy)", lambda: copy_tier_deep(tier)),
+                       ("clone (copy-on-write)", lambda: copy_tier(tier, False)),
+                       ("extract (deep copy)", extract_deep),
+                       ("extract (copy-on-write)", extract_copy_on_write)):
+    size, peak = measure_peak_memory(method)
+    duration = measure(method, 3)
+    print(f"{name}: {duration:.3f} s, result (MB): {size:.1f}, peak (MB): {peak:.1f}")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,52 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from textgrid import TextGrid
+
+from textgrid_tools.compact_tier import MarkTable
+from textgrid_tools_cli.textgrid_io import read_file_faster, save_file_faster
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+from textgrid_tools_cli_debug.reading_benchmark import measure_peak_memory
+
+# corpus of utterances with a words and a phones tier
+N_GRIDS = 5_000
+N_WORDS = 12
+N_PHONES = 50
+
+
+def run_benchmark() -> None:
+  with TemporaryDirectory() as tmp_dir:
+    paths: List[Path] = []
+    for grid_nr in range(N_GRIDS):
+      words = create_synthetic_grid(n_tiers=1, n_intervals=N_WORDS, seed=grid_nr)
+      phones = create_synthetic_grid(n_tiers=1, n_intervals=N_PHONES, seed=grid_nr)
+      grid = TextGrid(None, 0, N_PHONES * 0.08)
+      words.tiers[0].name = "words"
+      phones.tiers[0].name = "phones"
+      # same duration for both tiers
+      words.tiers[0].maxTime = words.tiers[0].intervals[-1].maxTime = N_PHONES * 0.08
+      grid.tiers.extend((words.tiers[0], phones.tiers[0]))
+      path = Path(tmp_dir) / f"{grid_nr}.TextGrid"
+      save_file_faster(grid, path, "utf-8")
+      paths.append(path)
+
+    def read_grids():
+      return [read_file_faster(path, "utf-8") for path in paths]
+
+    def read_grids_compact():
+      mark_table = MarkTable()
+      return [read_file_faster(path, "utf-8", mark_table=mark_table) for path in paths]
+
+    n_intervals = N_GRIDS * (N_WORDS + N_PHONES)
+    print(f"Grids: {N_GRIDS}, intervals: {n_intervals}")
+    for name, method in (("IntervalTier", read_grids),
+                         ("CompactIntervalTier", read_grids_compact)):
+      grids_size, peak = measure_peak_memory(method)
+      duration = measure(method, 3)
+      print(f"{name}: {duration:.3f} s, grids (MB): {grids_size:.1f}, "
+            f"per interval (B): {grids_size * 1024 * 1024 / n_intervals:.0f}, peak (MB): {peak:.1f}")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,30 @@
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+from textgrid_tools_cli.textgrid_io import parse_content, parse_lines, save_file_faster
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+
+
+def run_benchmark() -> None:
+  grid = create_synthetic_grid(n_tiers=4, n_intervals=100_000)
+  with TemporaryDirectory() as tmp_dir:
+    path = Path(tmp_dir) / "grid.TextGrid"
+    save_file_faster(grid, path, "utf-8")
+    content = path.read_text("utf-8")
+
+  def parse_per_line() -> None:
+    parse_lines(iter(content.splitlines(True)))
+
+  def parse_tokenized() -> None:
+    parse_content(content)
+
+  duration_lines = measure(parse_per_line, 3)
+  duration_tokens = measure(parse_tokenized, 3)
+  print(f"Size (MB): {len(content.encode('utf-8')) / 1024 / 1024:.2f}")
+  print(f"parse_lines (s): {duration_lines:.3f}")
+  print(f"parse_content (s): {duration_tokens:.3f}")
+  print(f"Speedup: {duration_lines / duration_tokens:.2f}x")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,47 @@
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Tuple
+
+from textgrid_tools_cli.textgrid_io import (parse_content, parse_lines, read_file_faster,
+                                            save_file_faster)
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+
+
+def measure_peak_memory(method: Callable[[], object]) -> Tuple[float, float]:
+  tracemalloc.start()
+  result = method()
+  size, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  del result
+  return size / 1024 / 1024, peak / 1024 / 1024
+
+
+def run_benchmark() -> None:
+  grid = create_synthetic_grid(n_tiers=4, n_intervals=100_000)
+  with TemporaryDirectory() as tmp_dir:
+    path = Path(tmp_dir) / "grid.TextGrid"
+    save_file_faster(grid, path, "utf-8")
+    del grid
+
+    def read_lines():
+      with open(path, "r", encoding="utf-8") as f:
+        return parse_lines(iter(f.readlines()))
+
+    def read_decoded():
+      return parse_content(path.read_text("utf-8"))
+
+    def read_mapped():
+      return read_file_faster(path, "utf-8")
+
+    print(f"Size (MB): {path.stat().st_size / 1024 / 1024:.2f}")
+    for name, method in (("readlines + parse_lines", read_lines),
+                         ("read_text + parse_content", read_decoded),
+                         ("read_file_faster (mmap)", read_mapped)):
+      grid_size, peak = measure_peak_memory(method)
+      duration = measure(method, 3)
+      print(f"{name}: {duration:.3f} s, grid (MB): {grid_size:.1f}, peak (MB): {peak:.1f}")
+
+
+if __name__ == "__main__":
+  run_benchmark()
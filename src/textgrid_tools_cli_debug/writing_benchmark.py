@@ -0,0 +1,27 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from textgrid_tools_cli.textgrid_io import (BINARY_FORMAT, SHORT_TEXT_FORMAT, TEXT_FORMAT,
+                                            get_lines, save_file_faster)
+from textgrid_tools_cli_debug.benchmarking import create_synthetic_grid, measure
+
+
+def run_benchmark() -> None:
+  grid = create_synthetic_grid(n_tiers=4, n_intervals=100_000)
+  with TemporaryDirectory() as tmp_dir:
+    path = Path(tmp_dir) / "grid.TextGrid"
+
+    def save_lines() -> None:
+      text = "\n".join(get_lines(grid))
+      with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+    duration = measure(save_lines, 3)
+    print(f"get_lines (s): {duration:.3f}, size (MB): {path.stat().st_size / 1024 / 1024:.2f}")
+    for output_format in (TEXT_FORMAT, SHORT_TEXT_FORMAT, BINARY_FORMAT):
+      duration = measure(lambda: save_file_faster(grid, path, "utf-8", output_format), 3)
+      print(f"save_file_faster {output_format} (s): {duration:.3f}, size (MB): {path.stat().st_size / 1024 / 1024:.2f}")
+
+
+if __name__ == "__main__":
+  run_benchmark()
@@ -0,0 +1,34 @@
+from textgrid_tools_cli.common import get_chunks_by_size, get_target_chunk_size
+
+
+def test_largest_files__come_first():
+  file_sizes = {"a": 1, "b": 30, "c": 20}
+
+  result = get_chunks_by_size(file_sizes, 10)
+
+  assert result == [["b"], ["c"], ["a"]]
+
+
+def test_small_files__are_chunked_up_to_target_size():
+  file_sizes = {"a": 3, "b": 4, "c": 3, "d": 2, "e": 100}
+
+  result = get_chunks_by_size(file_sizes, 10)
+
+  assert result == [["e"], ["b", "a", "c"], ["d"]]
+
+
+def test_files_of_same_size__keep_their_order():
+  file_sizes = {"b": 1, "a": 1, "c": 1}
+
+  result = get_chunks_by_size(file_sizes, 2)
+
+  assert result == [["b", "a"], ["c"]]
+
+
+def test_empty__returns_no_chunks():
+  assert get_chunks_by_size({}, 10) == []
+
+
+def test_target_chunk_size__gives_each_job_several_chunks():
+  assert get_target_chunk_size(1000, 2) == 125
+  assert get_target_chunk_size(0, 2) == 1
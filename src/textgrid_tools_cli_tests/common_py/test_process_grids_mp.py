@@ -0,0 +1,253 @@
+import os
+from functools import partial
+from logging import DEBUG, INFO, Handler, Logger, LogRecord, getLogger
+from multiprocessing import SimpleQueue
+from pathlib import Path
+from typing import List
+
+from textgrid import TextGrid
+
+from textgrid_tools_cli import common
+from textgrid_tools_cli.common import process_grid, process_grid_chunk, process_grids_mp
+from textgrid_tools_cli.logging_configuration import get_file_logger
+from textgrid_tools_cli.textgrid_io import TEXT_FORMAT, read_file_faster, save_file_faster
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+
+
+def report_change(grid: TextGrid, logger=None):
+  return None, True
+
+
+def report_no_change(grid: TextGrid, logger=None):
+  return None, False
+
+
+def rename_tier(grid: TextGrid, logger=None):
+  grid.tiers[0].name = "X"
+  return None, True
+
+
+def create_grid_file(directory: Path) -> Path:
+  path = directory / "grid.TextGrid"
+  directory.mkdir(parents=True, exist_ok=True)
+  save_file_faster(get_grid(), path, "utf-8")
+  # set an old modification time to detect writes
+  os.utime(path, ns=(0, 0))
+  return path
+
+
+def test_skip_unchanged__identical_output_is_not_written(tmp_path: Path):
+  path = create_grid_file(tmp_path)
+
+  result = process_grids_mp(tmp_path, "utf-8", None, True, report_change,
+                            1, 1, None, False, skip_unchanged=True)
+
+  assert result == (True, False)
+  assert path.stat().st_mtime_ns == 0
+
+
+def test_skip_unchanged__changed_output_is_written(tmp_path: Path):
+  path = create_grid_file(tmp_path)
+
+  result = process_grids_mp(tmp_path, "utf-8", None, True, rename_tier,
+                            1, 1, None, False, skip_unchanged=True)
+
+  assert result == (True, True)
+  assert path.stat().st_mtime_ns != 0
+  assert 'name = "X"' in path.read_text("utf-8")
+
+
+def test_without_skip_unchanged__identical_output_is_written(tmp_path: Path):
+  path = create_grid_file(tmp_path)
+
+  result = process_grids_mp(tmp_path, "utf-8", None, True, report_change,
+                            1, 1, None, False)
+
+  assert result == (True, True)
+  assert path.stat().st_mtime_ns != 0
+
+
+def test_skip_unchanged__identical_file_is_not_copied(tmp_path: Path):
+  create_grid_file(tmp_path / "in")
+  path_out = create_grid_file(tmp_path / "out")
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, report_no_change,
+                            1, 1, None, False, skip_unchanged=True)
+
+  assert result == (True, False)
+  assert path_out.stat().st_mtime_ns == 0
+
+
+def test_output_compression__in_place_replaces_file(tmp_path: Path):
+  path = create_grid_file(tmp_path)
+
+  result = process_grids_mp(tmp_path, "utf-8", None, True, report_no_change,
+                            1, 1, None, False, output_compression="gz")
+
+  assert result == (True, False)
+  assert not path.exists()
+  assert (tmp_path / "grid.TextGrid.gz").is_file()
+
+
+def test_output_compression__changed_grid_is_written_compressed(tmp_path: Path):
+  create_grid_file(tmp_path / "in")
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, rename_tier,
+                            1, 1, None, False, output_compression="xz")
+
+  assert result == (True, True)
+  assert (tmp_path / "in" / "grid.TextGrid").is_file()
+  grid = read_file_faster(tmp_path / "out" / "grid.TextGrid.xz", "utf-8")
+  assert grid.tiers[0].name == "X"
+
+
+class PicklingCounter():
+  """
+  Method that appends a line to a file each time it is pickled.
+  """
+
+  def __init__(self, path: Path) -> None:
+    self.path = path
+
+  def __reduce__(self):
+    with open(self.path, "a", encoding="utf-8") as file:
+      file.write("pickled\n")
+    return PicklingCounter, (self.path,)
+
+  def __call__(self, grid: TextGrid, logger=None):
+    return None, False
+
+
+def test_method__is_sent_once_per_worker(tmp_path: Path):
+  for nr in range(5):
+    create_grid_file(tmp_path / "in" / str(nr))
+  counter_path = tmp_path / "counter.txt"
+  counter_path.touch()
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True,
+                            PicklingCounter(counter_path), 1, 1, None, False)
+
+  assert result == (True, False)
+  assert len(list((tmp_path / "out").rglob("*.TextGrid"))) == 5
+  assert len(counter_path.read_text("utf-8").splitlines()) <= 1
+
+
+def test_automatic_chunksize__processes_all_files(tmp_path: Path):
+  for nr in range(5):
+    create_grid_file(tmp_path / "in" / str(nr))
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, rename_tier,
+                            None, 2, None, False)
+
+  assert result == (True, True)
+  assert len(list((tmp_path / "out").rglob("*.TextGrid"))) == 5
+
+
+class CollectingHandler(Handler):
+  def __init__(self, level: int) -> None:
+    super().__init__(level)
+    self.records: List[LogRecord] = []
+
+  def emit(self, record: LogRecord) -> None:
+    self.records.append(record)
+
+
+def test_log_records__are_written_per_file_and_filtered(tmp_path: Path):
+  for nr in range(3):
+    create_grid_file(tmp_path / "in" / str(nr))
+  flogger = get_file_logger()
+  handler = CollectingHandler(INFO)
+  flogger.addHandler(handler)
+  root_level = getLogger().level
+  getLogger().setLevel(DEBUG)
+  try:
+    result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, rename_tier,
+                              1, 2, None, False)
+  finally:
+    getLogger().setLevel(root_level)
+    flogger.removeHandler(handler)
+
+  assert result == (True, True)
+  file_records = [record for record in handler.records if record.name.endswith("/grid")]
+  assert all(record.levelno >= INFO for record in file_records)
+  names = [record.name for record in file_records]
+  assert set(names) == {"0/grid", "1/grid", "2/grid"}
+  # the records of a file are not interleaved with the records of other files
+  changes = sum(1 for prev, current in zip(names, names[1:]) if prev != current)
+  assert changes == 2
+
+
+
+def test_process_grid_chunk__creates_no_logger_per_file_and_sends_records(tmp_path: Path):
+  create_grid_file(tmp_path / "in")
+  log_queue = SimpleQueue()
+  init_pool = getattr(common, "__init_pool")
+  init_pool({"grid": Path("grid.TextGrid")}, rename_tier, None, None, log_queue, INFO)
+  process = partial(process_grid, encoding="utf-8", overwrite=True, directory=tmp_path / "in",
+                    output_directory=tmp_path / "out", dry_run=False, tier_names=None,
+                    output_format=TEXT_FORMAT, skip_unchanged=False, output_compression=None)
+  root_level = getLogger().level
+  getLogger().setLevel(DEBUG)
+  try:
+    result = process_grid_chunk(["grid"], process, tmp_path / "in")
+  finally:
+    getLogger().setLevel(root_level)
+    init_pool(None, None, None, None, None, DEBUG)
+
+  assert [(stem, file_result[:3]) for stem, file_result in result] == [
+    ("grid", (True, True, False))]
+  assert "grid" not in Logger.manager.loggerDict
+  records = log_queue.get()
+  assert len(records) > 0
+  assert all(record.levelno >= INFO for record in records)
+  assert all(record.name == "grid" for record in records)
+  assert log_queue.empty()
+
+def test_manifest__contains_one_line_per_file(tmp_path: Path):
+  for nr in range(3):
+    create_grid_file(tmp_path / "in" / str(nr))
+  manifest = tmp_path / "results" / "manifest.tsv"
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, rename_tier,
+                            None, 2, None, False, manifest=manifest)
+
+  assert result == (True, True)
+  lines = [line.split("\t") for line in manifest.read_text("utf-8").splitlines()]
+  assert lines[0] == ["file", "success", "changed", "duration"]
+  assert sorted(line[:3] for line in lines[1:]) == [
+    ["0/grid", "True", "True"],
+    ["1/grid", "True", "True"],
+    ["2/grid", "True", "True"],
+  ]
+  assert all(float(line[3]) >= 0 for line in lines[1:])
+
+
+def test_io_threads__processes_all_files(tmp_path: Path):
+  for nr in range(5):
+    create_grid_file(tmp_path / "in" / str(nr))
+
+  result = process_grids_mp(tmp_path / "in", "utf-8", tmp_path / "out", True, rename_tier,
+                            2, 2, None, False, io_threads=2)
+
+  assert result == (True, True)
+  paths = list((tmp_path / "out").rglob("*.TextGrid"))
+  assert len(paths) == 5
+  assert all('name = "X"' in path.read_text("utf-8") for path in paths)
+
+
+def test_io_threads__in_place_with_compression_and_invalid_file(tmp_path: Path):
+  for nr in range(3):
+    create_grid_file(tmp_path / str(nr))
+  (tmp_path / "invalid.TextGrid").write_text("invalid", "utf-8")
+  manifest = tmp_path / "manifest.tsv"
+
+  result = process_grids_mp(tmp_path, "utf-8", None, True, report_no_change,
+                            None, 1, None, False, output_compression="gz", manifest=manifest,
+                            io_threads=1)
+
+  assert result == (False, False)
+  assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.TextGrid*")) == [
+    "0/grid.TextGrid.gz", "1/grid.TextGrid.gz", "2/grid.TextGrid.gz", "invalid.TextGrid",
+  ]
+  lines = sorted(line.split("\t")[:2] for line in manifest.read_text("utf-8").splitlines()[1:])
+  assert lines == [["0/grid", "True"], ["1/grid", "True"], ["2/grid", "True"], ["invalid", "False"]]
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from textgrid_tools_cli.file_compression import NO_COMPRESSION, get_compressed_path
+
+
+def test_none__keeps_path():
+  assert get_compressed_path(Path("a/b.TextGrid.gz"), None) == Path("a/b.TextGrid.gz")
+
+
+def test_no_compression__removes_extension():
+  assert get_compressed_path(Path("a/b.TextGrid.gz"), NO_COMPRESSION) == Path("a/b.TextGrid")
+
+
+def test_other_compression__replaces_extension():
+  assert get_compressed_path(Path("a/b.TextGrid.gz"), "xz") == Path("a/b.TextGrid.xz")
+
+
+def test_uncompressed__adds_extension():
+  assert get_compressed_path(Path("a/b.TextGrid"), "bz2") == Path("a/b.TextGrid.bz2")
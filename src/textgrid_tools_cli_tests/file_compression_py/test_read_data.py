@@ -0,0 +1,37 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from textgrid_tools_cli.file_compression import COMPRESSIONS, read_data, write_data
+from textgrid_tools_cli.textgrid_io import read_file_faster, save_file_faster
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+from textgrid_tools_cli_tests.textgrid_io_py.test_parse_content import assert_grids_are_equal
+
+
+@pytest.mark.parametrize("extension", list(COMPRESSIONS))
+def test_write_data__is_compressed(tmp_path: Path, extension: str):
+  path = tmp_path / f"grid.TextGrid{extension}"
+
+  write_data(path, b"abc" * 100)
+
+  assert path.read_bytes() != b"abc" * 100
+  assert read_data(path) == b"abc" * 100
+
+
+def test_gz__can_be_read_by_gzip(tmp_path: Path):
+  path = tmp_path / "grid.TextGrid.gz"
+
+  write_data(path, b"abc")
+
+  assert gzip.decompress(path.read_bytes()) == b"abc"
+
+
+@pytest.mark.parametrize("output_format", ["text", "short", "binary"])
+@pytest.mark.parametrize("extension", list(COMPRESSIONS))
+def test_save_file_faster__roundtrip(tmp_path: Path, extension: str, output_format: str):
+  path = tmp_path / f"grid.TextGrid{extension}"
+
+  save_file_faster(get_grid(), path, "utf-8", output_format)
+
+  assert_grids_are_equal(read_file_faster(path, "utf-8"), get_grid())
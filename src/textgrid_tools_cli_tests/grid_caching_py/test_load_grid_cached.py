@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+import pytest
+from textgrid import Interval
+
+from textgrid_tools_cli.grid_caching import (get_cache_path, get_columns, load_grid_cached,
+                                             set_cache_directory, update_cache)
+from textgrid_tools_cli.textgrid_io import parse_content, save_file_faster
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+from textgrid_tools_cli_tests.textgrid_io_py.test_parse_content import (LONG_GRID,
+                                                                        assert_grids_are_equal)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+  result = tmp_path / "cache"
+  set_cache_directory(result)
+  yield result
+  set_cache_directory(None)
+
+
+def test_miss__parses_and_creates_entry(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(LONG_GRID, "utf-8")
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(LONG_GRID))
+  assert get_cache_path(cache_dir, path).is_file()
+
+
+def test_hit__returns_cached_grid(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(LONG_GRID, "utf-8")
+  load_grid_cached(path, "utf-8")
+  stat = os.stat(path)
+  # same size and modification time but other content -> entry is used
+  path.write_text(LONG_GRID.replace('"words"', '"abcde"'), "utf-8")
+  os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(LONG_GRID))
+
+
+def test_changed_file__is_parsed_again(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(LONG_GRID, "utf-8")
+  load_grid_cached(path, "utf-8")
+  changed = LONG_GRID.replace('"words"', '"other words"')
+  path.write_text(changed, "utf-8")
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(changed))
+
+
+def test_corrupt_entry__is_parsed_again(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(LONG_GRID, "utf-8")
+  load_grid_cached(path, "utf-8")
+  get_cache_path(cache_dir, path).write_bytes(b"abc")
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(LONG_GRID))
+
+
+def test_update_cache__equals_parsed_file(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  grid = get_grid()
+  # creates a gap which is filled while writing
+  grid.tiers[0].intervals[1] = Interval(1.5, 2, "c")
+  save_file_faster(grid, path, "utf-8")
+  update_cache(path, grid, "utf-8")
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(path.read_text("utf-8")))
+
+
+def test_hit__keeps_marks_with_trailing_null_characters(tmp_path: Path, cache_dir: Path):
+  path = tmp_path / "grid.TextGrid"
+  grid = get_grid()
+  grid.tiers[0].intervals[0].mark = "a\x00"
+  grid.tiers[0].intervals[1].mark = "ä" * 1000
+  save_file_faster(grid, path, "utf-8")
+  load_grid_cached(path, "utf-8")
+
+  result = load_grid_cached(path, "utf-8")
+
+  assert [interval.mark for interval in result.tiers[0].intervals[:2]] == ["a\x00", "ä" * 1000]
+  assert_grids_are_equal(result, parse_content(path.read_text("utf-8")))
+
+
+def test_get_columns__marks_are_not_padded():
+  grid = get_grid()
+  grid.tiers[0].intervals[0].mark = "a" * 1000
+
+  result = get_columns(grid)
+
+  marks = {interval.mark for interval in grid.tiers[0].intervals}
+  assert result["0_table"].nbytes == sum(len(mark.encode("utf-8")) for mark in marks)
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from textgrid_tools_cli.helper import get_grid_files
+
+
+def test_compressed_files__are_included(tmp_path: Path):
+  (tmp_path / "sub").mkdir()
+  for name in ("a.TextGrid", "b.TextGrid.gz", "sub/c.textgrid.xz", "d.txt.gz", "e.gz"):
+    (tmp_path / name).write_bytes(b"")
+
+  result = get_grid_files(tmp_path)
+
+  assert list(result.items()) == [
+    ("a", Path("a.TextGrid")),
+    ("b", Path("b.TextGrid.gz")),
+    ("sub/c", Path("sub/c.textgrid.xz")),
+  ]
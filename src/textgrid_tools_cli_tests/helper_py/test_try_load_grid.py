@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from textgrid import IntervalTier, PointTier
+
+from textgrid_tools_cli.helper import set_time_resolution, try_load_grid
+
+GRID_WITH_POINT_TIER = """File type = "ooTextFile"
+Object class = "TextGrid"
+
+xmin = 0
+xmax = 1
+tiers? <exists>
+size = 2
+item []:
+    item [1]:
+        class = "IntervalTier"
+        name = "A"
+        xmin = 0
+        xmax = 1
+        intervals: size = 1
+        intervals [1]:
+            xmin = 0
+            xmax = 1
+            text = "a"
+    item [2]:
+        class = "TextTier"
+        name = "B"
+        xmin = 0
+        xmax = 1
+        points: size = 1
+        points [1]:
+            number = 0.30000000000000004
+            mark = "b"
+"""
+
+
+def test_point_tier_with_time_resolution__is_loaded_and_snapped(tmp_path: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(GRID_WITH_POINT_TIER, "utf-8")
+
+  set_time_resolution(100)
+  try:
+    error, grid = try_load_grid(path)
+  finally:
+    set_time_resolution(None)
+
+  assert error is None
+  assert isinstance(grid.tiers[0], IntervalTier)
+  assert isinstance(grid.tiers[1], PointTier)
+  assert grid.tiers[1].points[0].time == 0.3
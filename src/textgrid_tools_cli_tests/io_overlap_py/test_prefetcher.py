@@ -0,0 +1,59 @@
+from threading import Event, Lock
+from time import sleep
+
+from textgrid_tools_cli.io_overlap import FILES_READ_AHEAD_PER_THREAD, Prefetcher
+
+
+def test_yields_items_in_order_with_their_content():
+  with Prefetcher(lambda x: x * 2, 2) as prefetcher:
+    result = [(item, future.result()) for item, future in prefetcher.iterate(range(10))]
+
+  assert result == [(nr, nr * 2) for nr in range(10)]
+
+
+def test_reads_at_most_read_ahead_items():
+  lock = Lock()
+  read_items = []
+
+  def read(item: int) -> int:
+    with lock:
+      read_items.append(item)
+    return item
+
+  with Prefetcher(read, 1) as prefetcher:
+    for item, future in prefetcher.iterate(range(10)):
+      future.result()
+      with lock:
+        assert len(read_items) <= item + 1 + FILES_READ_AHEAD_PER_THREAD
+
+
+def test_failed_read__is_returned_as_exception():
+  def read(item: int) -> int:
+    if item == 1:
+      raise ValueError()
+    return item
+
+  with Prefetcher(read, 1) as prefetcher:
+    result = [future.exception() is None for _, future in prefetcher.iterate(range(3))]
+
+  assert result == [True, False, True]
+
+
+def test_close__cancels_reads_that_did_not_start():
+  started = Event()
+  read_items = []
+
+  def read(item: int) -> int:
+    read_items.append(item)
+    started.set()
+    # the remaining reads are cancelled meanwhile
+    sleep(0.1)
+    return item
+
+  prefetcher = Prefetcher(read, 1)
+  _, future = next(prefetcher.iterate(range(10)))
+  started.wait()
+  prefetcher.close()
+
+  assert future.result() == 0
+  assert read_items == [0]
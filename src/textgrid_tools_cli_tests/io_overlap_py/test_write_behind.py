@@ -0,0 +1,25 @@
+from threading import Event
+
+from textgrid_tools_cli.io_overlap import WriteBehind
+
+
+def test_writes_in_submitted_order():
+  written = []
+  with WriteBehind(2) as writer:
+    futures = [writer.submit(lambda nr=nr: written.append(nr) or nr) for nr in range(10)]
+
+  assert written == list(range(10))
+  assert [future.result() for future in futures] == list(range(10))
+
+
+def test_submit__blocks_if_max_pending_writes_are_not_done():
+  release = Event()
+  with WriteBehind(1) as writer:
+    first = writer.submit(release.wait)
+    assert not first.done()
+    release.set()
+    # waits until the first write is done
+    second = writer.submit(lambda: 2)
+    assert first.done()
+
+  assert second.result() == 2
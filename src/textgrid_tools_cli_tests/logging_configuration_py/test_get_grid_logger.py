@@ -0,0 +1,25 @@
+from logging import DEBUG, INFO, getLogger
+
+from textgrid_tools_cli.logging_configuration import (get_grid_logger, init_worker_logger,
+                                                      release_grid_logger)
+
+
+def test_records_of_grids__are_stored_separately_and_filtered():
+  init_worker_logger(INFO)
+  root_level = getLogger().level
+  getLogger().setLevel(DEBUG)
+  try:
+    logger_a, records_a = get_grid_logger("a")
+    logger_b, records_b = get_grid_logger("b")
+    logger_a.info("1")
+    logger_b.info("2")
+    logger_a.debug("3")
+    release_grid_logger("a")
+    logger_a.info("4")
+    logger_b.info("5")
+    release_grid_logger("b")
+  finally:
+    getLogger().setLevel(root_level)
+
+  assert [(record.name, record.getMessage()) for record in records_a] == [("a", "1")]
+  assert [(record.name, record.getMessage()) for record in records_b] == [("b", "2"), ("b", "5")]
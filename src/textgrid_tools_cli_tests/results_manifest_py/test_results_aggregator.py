@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from textgrid_tools_cli.results_manifest import ResultsAggregator
+
+
+def test_without_manifest__aggregates_results():
+  with ResultsAggregator() as results:
+    results.add("a", True, False, True, 0.1)
+    results.add("b", False, True, False, 0.2)
+    results.add("c", True, False, True, 0.3)
+
+  assert results.n_files == 3
+  assert not results.total_success
+  assert results.total_changed_anything
+  assert results.avoided_writes == 2
+
+
+def test_empty__is_successful_and_unchanged():
+  with ResultsAggregator() as results:
+    pass
+
+  assert results.n_files == 0
+  assert results.total_success
+  assert not results.total_changed_anything
+  assert results.avoided_writes == 0
+
+
+def test_manifest__lines_are_written_as_results_arrive(tmp_path: Path):
+  path = tmp_path / "manifest.tsv"
+  with ResultsAggregator(path) as results:
+    results.add("a", True, True, False, 0.5)
+    # line buffered, i.e., the line can be read before the manifest is closed
+    assert path.read_text("utf-8") == "file\tsuccess\tchanged\tduration\na\tTrue\tTrue\t0.500000\n"
+    results.add("b", False, False, False, 1)
+
+  assert path.read_text("utf-8").splitlines()[-1] == "b\tFalse\tFalse\t1.000000"
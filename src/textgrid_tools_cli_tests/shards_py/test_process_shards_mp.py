@@ -0,0 +1,161 @@
+import os
+import tarfile
+from io import BytesIO
+from logging import DEBUG, INFO, getLogger
+from pathlib import Path
+from typing import Dict
+
+from textgrid_tools_cli.common import process_grids_mp
+from textgrid_tools_cli.logging_configuration import get_file_logger
+from textgrid_tools_cli.textgrid_io import get_file_data, parse_data
+from textgrid_tools_cli_tests.common_py.test_process_grids_mp import (CollectingHandler,
+                                                                      rename_tier, report_change,
+                                                                      report_no_change)
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+
+AUDIO = b"RIFF\x00\x00\x00\x00WAVE"
+
+
+def create_shard(path: Path, keys=("a/1", "a/2")) -> Path:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with tarfile.open(path, "w") as tar:
+    for key in keys:
+      for name, data in ((f"{key}.TextGrid", get_file_data(get_grid(), "utf-8")), (f"{key}.wav", AUDIO)):
+        member = tarfile.TarInfo(name)
+        member.size = len(data)
+        tar.addfile(member, BytesIO(data))
+  return path
+
+
+def read_shard(path: Path) -> Dict[str, bytes]:
+  with tarfile.open(path, "r") as tar:
+    return {member.name: tar.extractfile(member).read() for member in tar.getmembers()}
+
+
+def test_output_directory__writes_modified_grids_and_keeps_audio(tmp_path: Path):
+  shard = create_shard(tmp_path / "in" / "shard-0.tar")
+
+  result = process_grids_mp(shard, "utf-8", tmp_path / "out", False, rename_tier,
+                            1, 1, None, False)
+
+  assert result == (True, True)
+  members = read_shard(tmp_path / "out" / "shard-0.tar")
+  assert list(members.keys()) == ["a/1.TextGrid", "a/1.wav", "a/2.TextGrid", "a/2.wav"]
+  assert members["a/1.wav"] == AUDIO
+  assert parse_data(members["a/2.TextGrid"], "utf-8").tiers[0].name == "X"
+  assert read_shard(shard)["a/1.TextGrid"] == get_file_data(get_grid(), "utf-8")
+
+
+def test_shard_list__processes_all_shards_in_place(tmp_path: Path):
+  create_shard(tmp_path / "shard-0.tar")
+  create_shard(tmp_path / "shard-1.tar", keys=("b/1",))
+  shard_list = tmp_path / "shards.txt"
+  shard_list.write_text("shard-0.tar\nshard-1.tar\n", "utf-8")
+
+  result = process_grids_mp(shard_list, "utf-8", None, True, rename_tier,
+                            1, 2, None, False)
+
+  assert result == (True, True)
+  for name in ("shard-0.tar", "shard-1.tar"):
+    members = read_shard(tmp_path / name)
+    grids = [data for member, data in members.items() if member.endswith(".TextGrid")]
+    assert all(parse_data(data, "utf-8").tiers[0].name == "X" for data in grids)
+
+
+def test_unchanged_in_place__shard_is_not_replaced(tmp_path: Path):
+  shard = create_shard(tmp_path / "shard-0.tar")
+  os.utime(shard, ns=(0, 0))
+
+  result = process_grids_mp(shard, "utf-8", None, True, report_no_change,
+                            1, 1, None, False)
+
+  assert result == (True, False)
+  assert shard.stat().st_mtime_ns == 0
+
+
+def test_skip_unchanged__identical_grids_are_not_rewritten(tmp_path: Path):
+  shard = create_shard(tmp_path / "shard-0.tar")
+  before = shard.read_bytes()
+
+  result = process_grids_mp(shard, "utf-8", None, True, report_change,
+                            1, 1, None, False, skip_unchanged=True)
+
+  assert result == (True, False)
+  assert shard.read_bytes() == before
+
+
+def test_output_compression__renames_grid_members(tmp_path: Path):
+  shard = create_shard(tmp_path / "shard-0.tar", keys=("a/1",))
+
+  result = process_grids_mp(shard, "utf-8", None, True, report_no_change,
+                            1, 1, None, False, output_compression="gz")
+
+  assert result == (True, False)
+  assert list(read_shard(shard).keys()) == ["a/1.TextGrid.gz", "a/1.wav"]
+
+
+def test_manifest__contains_grids_and_shard(tmp_path: Path):
+  shard = create_shard(tmp_path / "in" / "shard-0.tar")
+  manifest = tmp_path / "manifest.tsv"
+
+  result = process_grids_mp(shard, "utf-8", tmp_path / "out", False, rename_tier,
+                            1, 1, None, False, manifest=manifest)
+
+  assert result == (True, True)
+  lines = [line.split("\t")[:3] for line in manifest.read_text("utf-8").splitlines()[1:]]
+  assert lines == [
+    [f"{shard}/a/1", "True", "True"],
+    [f"{shard}/a/2", "True", "True"],
+    [str(shard), "True", "False"],
+  ]
+
+
+def test_output_directory__keeps_relative_path_of_shards_with_same_name(tmp_path: Path):
+  create_shard(tmp_path / "in" / "train" / "shard-0.tar")
+  create_shard(tmp_path / "in" / "dev" / "shard-0.tar", keys=("b/1",))
+  shard_list = tmp_path / "in" / "shards.txt"
+  shard_list.write_text("train/shard-0.tar\ndev/shard-0.tar\n", "utf-8")
+
+  result = process_grids_mp(shard_list, "utf-8", tmp_path / "out", False, rename_tier,
+                            1, 2, None, False)
+
+  assert result == (True, True)
+  assert list(read_shard(tmp_path / "out" / "train" / "shard-0.tar").keys()) == [
+    "a/1.TextGrid", "a/1.wav", "a/2.TextGrid", "a/2.wav"]
+  assert list(read_shard(tmp_path / "out" / "dev" / "shard-0.tar").keys()) == [
+    "b/1.TextGrid", "b/1.wav"]
+
+
+def test_output_directory__shards_with_same_output_path_are_not_processed(tmp_path: Path):
+  create_shard(tmp_path / "a" / "shard-0.tar")
+  create_shard(tmp_path / "b" / "shard-0.tar")
+  shard_list = tmp_path / "list" / "shards.txt"
+  shard_list.parent.mkdir()
+  shard_list.write_text("../a/shard-0.tar\n../b/shard-0.tar\n", "utf-8")
+
+  result = process_grids_mp(shard_list, "utf-8", tmp_path / "out", False, rename_tier,
+                            1, 2, None, False)
+
+  assert result == (False, False)
+  assert not (tmp_path / "out").exists()
+
+
+def test_log_records__are_written_through_file_logger_and_filtered(tmp_path: Path):
+  shard = create_shard(tmp_path / "in" / "shard-0.tar")
+  flogger = get_file_logger()
+  handler = CollectingHandler(INFO)
+  flogger.addHandler(handler)
+  root_level = getLogger().level
+  getLogger().setLevel(DEBUG)
+  try:
+    result = process_grids_mp(shard, "utf-8", tmp_path / "out", False, rename_tier,
+                              1, 1, None, False)
+  finally:
+    getLogger().setLevel(root_level)
+    flogger.removeHandler(handler)
+
+  assert result == (True, True)
+  records = [record for record in handler.records if record.name.startswith(str(shard))]
+  assert all(record.levelno >= INFO for record in records)
+  names = [record.name for record in records]
+  assert list(dict.fromkeys(names)) == [f"{shard}/a/1", f"{shard}/a/2", str(shard)]
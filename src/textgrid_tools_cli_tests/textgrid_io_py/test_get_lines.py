@@ -0,0 +1,35 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools_cli.textgrid_io import get_lines, parse_content
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 2)
+  tier1 = IntervalTier("A", 0, 2)
+  tier1.intervals.append(Interval(0, 1, "a \"b\""))
+  tier1.intervals.append(Interval(1, 2, "c"))
+  tier2 = IntervalTier("B", 0, 2)
+  tier2.intervals.append(Interval(0, 0.5, "x"))
+  tier2.intervals.append(Interval(0.5, 2, ""))
+  tier3 = IntervalTier("C", 0, 2)
+  tier3.intervals.append(Interval(0, 2, "y"))
+  grid.tiers.extend((tier1, tier2, tier3))
+  return grid
+
+
+def test_unparsed_tiers__are_written_unchanged_at_their_position():
+  content = "\n".join(get_lines(get_grid()))
+  grid = parse_content(content, {"B"})
+  grid.tiers[0].intervals[0].mark = "changed"
+
+  result = "\n".join(get_lines(grid))
+
+  assert result == content.replace('text = "x"', 'text = "changed"')
+  assert [tier.name for tier in parse_content(result).tiers] == ["A", "B", "C"]
+
+
+def test_without_changes__are_written_unchanged():
+  content = "\n".join(get_lines(get_grid()))
+
+  assert "\n".join(get_lines(parse_content(content, {"C"}))) == content
+  assert "\n".join(get_lines(parse_content(content, set()))) == content
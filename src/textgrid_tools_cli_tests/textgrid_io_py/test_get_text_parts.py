@@ -0,0 +1,70 @@
+from textgrid import Interval
+
+from textgrid_tools.cloning import copy_tiers
+from textgrid_tools_cli.textgrid_io import get_lines, get_text_parts, parse_content, parse_lines
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+from textgrid_tools_cli_tests.textgrid_io_py.test_parse_content import (LONG_GRID,
+                                                                        assert_grids_are_equal)
+
+
+def test_long__equals_get_lines():
+  grid = parse_content(LONG_GRID)
+
+  result = "".join(get_text_parts(grid))
+
+  assert result == "\n".join(get_lines(grid))
+
+
+def test_long_with_gaps__equals_get_lines():
+  grid = get_grid()
+  grid.tiers[0].intervals[1] = Interval(1.5, 1.75, "c")
+
+  result = "".join(get_text_parts(grid))
+
+  assert result == "\n".join(get_lines(grid))
+  assert [(i.minTime, i.maxTime) for i in parse_content(result).tiers[0].intervals] == [
+    (0, 1), (1, 1.5), (1.5, 1.75), (1.75, 2)]
+
+
+def test_long_unparsed_tiers__equals_get_lines():
+  grid = parse_content(LONG_GRID, {"points"})
+
+  result = "".join(get_text_parts(grid))
+
+  assert result == "\n".join(get_lines(grid))
+
+
+def test_short__is_parsed_to_same_grid():
+  grid = parse_content(LONG_GRID)
+
+  result = "".join(get_text_parts(grid, short=True))
+
+  assert result.startswith('File type = "ooTextFile short"\n"TextGrid"\n\n0\n2.5\n<exists>\n2\n')
+  assert_grids_are_equal(parse_content(result), grid)
+
+
+def test_short__can_be_read_from_parse_lines():
+  grid = get_grid()
+
+  result = "".join(get_text_parts(grid, short=True))
+
+  assert_grids_are_equal(parse_lines(iter(result.splitlines(True))), grid)
+
+
+def test_short_unparsed_tiers__are_parsed_to_same_grid():
+  grid = parse_content(LONG_GRID, {"points"})
+
+  result = "".join(get_text_parts(grid, short=True))
+
+  assert_grids_are_equal(parse_content(result), parse_content(LONG_GRID))
+
+
+def test_copy_on_write_tiers__are_written_without_copying_their_intervals():
+  grid = get_grid()
+  expected = "".join(get_text_parts(grid))
+  grid.tiers = list(copy_tiers(grid.tiers, False))
+
+  result = "".join(get_text_parts(grid))
+
+  assert result == expected
+  assert all(tier.is_shared for tier in grid.tiers)
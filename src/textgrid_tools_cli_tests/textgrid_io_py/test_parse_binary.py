@@ -0,0 +1,79 @@
+import pytest
+from textgrid import Interval, IntervalTier, Point, PointTier, TextGrid
+
+from textgrid_tools_cli.textgrid_io import (BINARY_HEADER, get_binary_parts, get_lines,
+                                            get_unparsed_tiers, parse_binary, parse_content,
+                                            parse_data)
+from textgrid_tools_cli_tests.textgrid_io_py.test_get_lines import get_grid
+from textgrid_tools_cli_tests.textgrid_io_py.test_parse_content import (LONG_GRID,
+                                                                        assert_grids_are_equal)
+
+
+def get_data(grid: TextGrid) -> bytes:
+  return b"".join(get_binary_parts(grid))
+
+
+def test_roundtrip__returns_same_grid():
+  grid = parse_content(LONG_GRID)
+
+  result = parse_binary(get_data(grid))
+
+  assert_grids_are_equal(result, grid)
+
+
+def test_non_ascii_marks__are_preserved():
+  grid = TextGrid(None, 0, 3)
+  tier = IntervalTier("ˈwɜːdz", 0, 3)
+  tier.intervals.append(Interval(0, 1, "ʃ"))
+  tier.intervals.append(Interval(1, 2, "😀 ä"))
+  tier.intervals.append(Interval(2, 3, "abc"))
+  grid.tiers.append(tier)
+
+  result = parse_binary(get_data(grid))
+
+  assert result.tiers[0].name == "ˈwɜːdz"
+  assert [i.mark for i in result.tiers[0].intervals] == ["ʃ", "😀 ä", "abc"]
+
+
+def test_point_tier__is_parsed():
+  grid = TextGrid(None, 0, 2)
+  tier = PointTier("points", 0, 2)
+  tier.points.append(Point(0.5, "a"))
+  tier.points.append(Point(1.5, "b"))
+  grid.tiers.append(tier)
+
+  result = parse_binary(get_data(grid))
+
+  assert isinstance(result.tiers[0], PointTier)
+  assert [(p.time, p.mark) for p in result.tiers[0].points] == [(0.5, "a"), (1.5, "b")]
+
+
+def test_parse_data__detects_binary():
+  grid = get_grid()
+
+  result = parse_data(get_data(grid), "UTF-8")
+
+  assert_grids_are_equal(result, grid)
+
+
+def test_tier_names__unparsed_tiers_are_written_unchanged():
+  data = get_data(get_grid())
+  grid = parse_binary(data, {"B"})
+  assert [tier.name for tier in grid.tiers] == ["B"]
+  assert [tier.name for tier in get_unparsed_tiers(grid)] == ["A", "C"]
+  assert all(tier.is_binary for tier in get_unparsed_tiers(grid))
+
+  assert get_data(grid) == data
+
+
+def test_tier_names__unparsed_tiers_are_converted_to_text():
+  grid = parse_binary(get_data(get_grid()), {"B"})
+
+  result = "\n".join(get_lines(grid))
+
+  assert result == "\n".join(get_lines(get_grid()))
+
+
+def test_invalid_header__raises_exception():
+  with pytest.raises(Exception):
+    parse_binary(BINARY_HEADER + b"\x03abc")
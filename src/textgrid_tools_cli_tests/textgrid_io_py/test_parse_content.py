@@ -0,0 +1,165 @@
+import pytest
+from textgrid import IntervalTier, PointTier, TextGrid
+
+from textgrid_tools_cli.textgrid_io import get_unparsed_tiers, parse_content, parse_lines
+
+LONG_GRID = '''File type = "ooTextFile"
+Object class = "TextGrid"
+
+xmin = 0
+xmax = 2.5
+tiers? <exists>
+size = 2
+item []:
+    item [1]:
+        class = "IntervalTier"
+        name = "words"
+        xmin = 0
+        xmax = 2.5
+        intervals: size = 4
+        intervals [1]:
+            xmin = 0
+            xmax = 0.5
+            text = ""
+        intervals [2]:
+            xmin = 0.5
+            xmax = 1.25
+            text = "say ""hello"""
+        intervals [3]:
+            xmin = 1.25
+            xmax = 2
+            text = "multi
+line [2]: = 3"
+        intervals [4]:
+            xmin = 2
+            xmax = 2.5
+            text = "1.5e-3"
+    item [2]:
+        class = "TextTier"
+        name = "points"
+        xmin = 0
+        xmax = 2.5
+        points: size = 2
+            points [1]:
+                time = 0.5
+                mark = "a"
+            points [2]:
+                time = 1.75
+                mark = "b"
+'''
+
+SHORT_GRID = '''File type = "ooTextFile short"
+Object class = "TextGrid"
+
+0
+2.5
+<exists>
+1
+"IntervalTier"
+"words"
+0
+2.5
+3
+0
+0.5
+""
+0.5
+1.25
+"say ""hello"""
+1.25
+2.5
+"c"
+'''
+
+
+def assert_grids_are_equal(grid1: TextGrid, grid2: TextGrid) -> None:
+  assert grid1.minTime == grid2.minTime
+  assert grid1.maxTime == grid2.maxTime
+  assert len(grid1.tiers) == len(grid2.tiers)
+  for tier1, tier2 in zip(grid1.tiers, grid2.tiers):
+    assert type(tier1) == type(tier2)
+    assert tier1.name == tier2.name
+    assert tier1.minTime == tier2.minTime
+    assert tier1.maxTime == tier2.maxTime
+    if isinstance(tier1, IntervalTier):
+      assert [(i.minTime, i.maxTime, i.mark, i.strict) for i in tier1.intervals] == \
+          [(i.minTime, i.maxTime, i.mark, i.strict) for i in tier2.intervals]
+    else:
+      assert [(p.time, p.mark) for p in tier1.points] == [(p.time, p.mark) for p in tier2.points]
+
+
+def test_long__equals_parse_lines():
+  result = parse_content(LONG_GRID)
+
+  assert_grids_are_equal(result, parse_lines(iter(LONG_GRID.splitlines(True))))
+  assert [i.mark for i in result.tiers[0].intervals] == [
+    "", "say \"hello\"", "multi\nline [2]: = 3", "1.5e-3"]
+  assert isinstance(result.tiers[1], PointTier)
+  assert [(p.time, p.mark) for p in result.tiers[1].points] == [(0.5, "a"), (1.75, "b")]
+
+
+def test_short__is_parsed():
+  result = parse_content(SHORT_GRID)
+
+  assert result.minTime == 0
+  assert result.maxTime == 2.5
+  assert len(result.tiers) == 1
+  assert result.tiers[0].name == "words"
+  assert [(i.minTime, i.maxTime, i.mark) for i in result.tiers[0].intervals] == [
+    (0, 0.5, ""), (0.5, 1.25, "say \"hello\""), (1.25, 2.5, "c")]
+
+
+def test_short_with_long_header__is_parsed():
+  result = parse_content(SHORT_GRID.replace("ooTextFile short", "ooTextFile"))
+
+  assert_grids_are_equal(result, parse_content(SHORT_GRID))
+
+
+def test_null_interval__is_ignored():
+  content = LONG_GRID.replace("xmax = 0.5\n            text = \"\"",
+                              "xmax = 0\n            text = \"\"", 1)
+
+  result = parse_content(content)
+
+  assert len(result.tiers[0].intervals) == 3
+
+
+def test_absent_tiers__returns_empty_grid():
+  content = 'File type = "ooTextFile"\nObject class = "TextGrid"\n\nxmin = 0 \nxmax = 1 \ntiers? <absent> \n'
+
+  result = parse_content(content)
+
+  assert result.minTime == 0
+  assert result.maxTime == 1
+  assert len(result.tiers) == 0
+
+
+def test_invalid_header__raises_exception():
+  with pytest.raises(Exception):
+    parse_content(LONG_GRID.replace("ooTextFile", "abc"))
+
+
+def test_unsorted_overlapping_intervals__raises_value_error():
+  content = LONG_GRID.replace("xmin = 0.5\n            xmax = 1.25",
+                              "xmin = 0.25\n            xmax = 1.25", 1)
+
+  with pytest.raises(ValueError):
+    parse_content(content)
+
+
+def test_tier_names__parses_only_these_tiers():
+  result = parse_content(LONG_GRID, {"points"})
+
+  assert [tier.name for tier in result.tiers] == ["points"]
+  unparsed_tiers = get_unparsed_tiers(result)
+  assert len(unparsed_tiers) == 1
+  assert unparsed_tiers[0].name == "words"
+  assert unparsed_tiers[0].position == 0
+  assert unparsed_tiers[0].content[:4] == ['"words"', "0", "2.5", "4"]
+  assert len(unparsed_tiers[0].content) == 4 + 4 * 3
+
+
+def test_tier_names_none__has_no_unparsed_tiers():
+  result = parse_content(LONG_GRID)
+
+  assert get_unparsed_tiers(result) == []
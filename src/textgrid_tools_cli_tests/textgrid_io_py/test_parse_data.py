@@ -0,0 +1,176 @@
+from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.compact_tier import CompactIntervalTier, MarkTable
+from textgrid_tools.helper import TIER_VALIDITY_ATTRIBUTE, is_tier_valid
+from textgrid_tools_cli.textgrid_io import (get_binary_parts, get_lines, get_text_parts,
+                                            parse_content, parse_data, read_file_faster)
+from textgrid_tools_cli_tests.textgrid_io_py.test_parse_content import (LONG_GRID, SHORT_GRID,
+                                                                        assert_grids_are_equal)
+
+NON_ASCII_GRID = LONG_GRID.replace('"a"', '"ʃ ä 😀"')
+NON_ASCII_GRID_TEXT = "".join(get_text_parts(parse_content(NON_ASCII_GRID)))
+
+
+def test_utf8__equals_parse_content():
+  result = parse_data(NON_ASCII_GRID.encode("utf-8"), "utf-8")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_short_utf8__equals_parse_content():
+  result = parse_data(SHORT_GRID.encode("utf-8"), "utf-8")
+
+  assert_grids_are_equal(result, parse_content(SHORT_GRID))
+
+
+def test_utf8_bom__is_detected():
+  result = parse_data(BOM_UTF8 + NON_ASCII_GRID.encode("utf-8"), "latin-1")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_utf16_be_bom__is_detected():
+  result = parse_data(BOM_UTF16_BE + NON_ASCII_GRID.encode("utf-16-be"), "utf-8")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_utf16_le_bom__is_detected():
+  result = parse_data(BOM_UTF16_LE + NON_ASCII_GRID.encode("utf-16-le"), "utf-8")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_not_ascii_compatible_encoding__is_decoded():
+  result = parse_data(NON_ASCII_GRID.encode("utf-16-le"), "utf-16-le")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_single_byte_encoding__is_decoded():
+  content = LONG_GRID.replace('"a"', '"ä"')
+
+  result = parse_data(content.encode("cp1252"), "cp1252")
+
+  assert_grids_are_equal(result, parse_content(content))
+
+
+def test_crlf__is_normalized():
+  result = parse_data(LONG_GRID.replace("\n", "\r\n").encode("utf-8"), "utf-8")
+
+  assert_grids_are_equal(result, parse_content(LONG_GRID))
+  assert result.tiers[0].intervals[2].mark == "multi\nline [2]: = 3"
+
+
+def test_tier_names__unparsed_tiers_are_decoded():
+  result = parse_data(NON_ASCII_GRID.encode("utf-8"), "utf-8", {"words"})
+
+  expected = parse_content(NON_ASCII_GRID, {"words"})
+  assert result.unparsed_tiers[0].content == expected.unparsed_tiers[0].content
+
+
+def test_read_file_faster__equals_parse_content(tmp_path: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_text(NON_ASCII_GRID, "utf-8")
+
+  result = read_file_faster(path, "utf-8")
+
+  assert_grids_are_equal(result, parse_content(NON_ASCII_GRID))
+
+
+def test_read_file_faster_empty_file__raises_exception(tmp_path: Path):
+  path = tmp_path / "grid.TextGrid"
+  path.write_bytes(b"")
+
+  with pytest.raises(Exception):
+    read_file_faster(path, "utf-8")
+
+
+def get_tier_data(*intervals: Tuple[float, float]) -> bytes:
+  grid = TextGrid(None, 0, 3)
+  tier = IntervalTier("A", 0, 3)
+  tier.intervals.extend(Interval(start, end, "") for start, end in intervals)
+  grid.tiers.append(tier)
+  return "\n".join(get_lines(grid)).encode("utf-8")
+
+
+def test_validity__is_set_while_parsing():
+  grid = parse_data(get_tier_data((0, 1), (1, 3)), "utf-8")
+
+  assert getattr(grid.tiers[0], TIER_VALIDITY_ATTRIBUTE) is True
+
+
+def test_validity__gap_is_invalid():
+  data = get_tier_data((0, 1), (1, 3)).replace(b"xmin = 1 ", b"xmin = 1.5 ")
+
+  grid = parse_data(data, "utf-8")
+
+  assert getattr(grid.tiers[0], TIER_VALIDITY_ATTRIBUTE) is False
+  assert not is_tier_valid(grid.tiers[0])
+
+
+def test_validity__not_ending_at_tier_end_is_invalid():
+  data = get_tier_data((0, 1), (1, 3)).replace(b"xmax = 3 \n            text", b"xmax = 2.5 \n            text")
+
+  grid = parse_data(data, "utf-8")
+
+  assert getattr(grid.tiers[0], TIER_VALIDITY_ATTRIBUTE) is False
+  assert not is_tier_valid(grid.tiers[0])
+
+
+def test_mark_table__returns_compact_tiers_with_same_content():
+  mark_table = MarkTable()
+
+  result = parse_data(NON_ASCII_GRID.encode("utf-8"), "utf-8", mark_table=mark_table)
+
+  assert isinstance(result.tiers[0], CompactIntervalTier)
+  assert "".join(get_text_parts(result)) == NON_ASCII_GRID_TEXT
+
+
+def test_mark_table__binary_returns_compact_tiers_with_same_content():
+  data = b"".join(get_binary_parts(parse_content(NON_ASCII_GRID)))
+
+  result = parse_data(data, "utf-8", mark_table=MarkTable())
+
+  assert isinstance(result.tiers[0], CompactIntervalTier)
+  assert "".join(get_text_parts(result)) == NON_ASCII_GRID_TEXT
+
+
+def get_marks_data(*marks: str) -> bytes:
+  grid = TextGrid(None, 0, len(marks))
+  tier = IntervalTier("A", 0, len(marks))
+  tier.intervals.extend(Interval(i, i + 1, mark) for i, mark in enumerate(marks))
+  grid.tiers.append(tier)
+  return "\n".join(get_lines(grid)).encode("utf-8")
+
+
+def test_equal_marks__are_same_object():
+  grid = parse_data(get_marks_data("a\"b", "c", "a\"b"), "utf-8")
+
+  a1, _, a2 = grid.tiers[0].intervals
+  assert a1.mark == "a\"b"
+  assert a1.mark is a2.mark
+
+
+def test_binary_equal_marks__are_same_object():
+  data = b"".join(get_binary_parts(parse_data(get_marks_data("a", "c", "a"), "utf-8")))
+
+  grid = parse_data(data, "utf-8")
+
+  a1, _, a2 = grid.tiers[0].intervals
+  assert a1.mark == "a"
+  assert a1.mark is a2.mark
+
+
+def test_mark_table__marks_are_shared_across_grids():
+  mark_table = MarkTable()
+  grid1 = parse_data(get_marks_data("a", "b"), "utf-8", mark_table=mark_table)
+  grid2 = parse_data(get_marks_data("b", "a"), "utf-8", mark_table=mark_table)
+
+  assert mark_table.marks == ["a", "b"]
+  assert grid1.tiers[0].intervals[0].mark is grid2.tiers[0].intervals[1].mark
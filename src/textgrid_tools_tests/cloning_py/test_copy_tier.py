@@ -0,0 +1,124 @@
+from ordered_set import OrderedSet
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.cloning import CopyOnWriteIntervalTier, copy_tier, get_shared_tier
+from textgrid_tools.grid.splitting import extract_grid
+from textgrid_tools.helper import (check_is_valid_grid, get_boundary_index, get_sorted_boundaries,
+                                   get_tier_readable, invalidate_grid, iter_intervals,
+                                   timepoint_is_boundary)
+from textgrid_tools.validation import BoundaryError
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 4)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2.5, "b"))
+  tier.intervals.append(Interval(2.5, 4, "c"))
+  return tier
+
+
+def get_content(tier: IntervalTier):
+  return [(interval.minTime, interval.maxTime, interval.mark) for interval in tier]
+
+
+def test_copy__is_shared_and_equal():
+  tier = get_tier()
+
+  result = copy_tier(tier, False)
+
+  assert isinstance(result, CopyOnWriteIntervalTier)
+  assert result.is_shared
+  assert len(result) == 3
+  assert (result.name, result.minTime, result.maxTime) == ("A", 0, 4)
+  assert get_content(result) == get_content(tier)
+
+
+def test_ignore_marks__marks_are_empty():
+  result = copy_tier(get_tier(), True)
+
+  assert [interval.mark for interval in result] == ["", "", ""]
+
+
+def test_change_of_copy__does_not_change_tier():
+  tier = get_tier()
+  result = copy_tier(tier, False)
+
+  result.intervals[0].mark = "x"
+  result.intervals.pop()
+
+  assert not result.is_shared
+  assert [interval.mark for interval in result] == ["x", "b"]
+  assert get_content(tier) == [(0, 1, "a"), (1, 2.5, "b"), (2.5, 4, "c")]
+
+
+def test_change_of_tier__does_not_change_copy():
+  tier = get_tier()
+  result = copy_tier(tier, False)
+
+  tier.intervals[0].mark = "x"
+
+  assert result.intervals[0].mark == "a"
+
+
+def test_copies_of_shared_tier__share_storage():
+  shared = get_shared_tier(get_tier())
+
+  copy1 = copy_tier(shared, False)
+  copy2 = copy_tier(shared, True)
+  copy1.intervals[1].mark = "x"
+
+  assert copy2.is_shared
+  assert [interval.mark for interval in copy1] == ["a", "x", "c"]
+
+
+def test_extract_grid__is_moved_to_zero_and_valid():
+  grid = TextGrid(None, 0, 4)
+  grid.tiers.append(get_tier())
+
+  result = extract_grid(grid, Interval(1, 4, ""))
+
+  assert result.maxTime == 3
+  assert get_content(result.tiers[0]) == [(0, 1.5, "b"), (1.5, 3, "c")]
+  assert check_is_valid_grid(result)
+
+
+def test_read_only_helpers__leave_copy_shared():
+  tier = get_tier()
+  result = copy_tier(tier, False)
+  grid = TextGrid(None, 0, 4)
+  grid.tiers.append(result)
+
+  invalidate_grid(grid)
+  assert check_is_valid_grid(grid)
+  assert get_boundary_index(result) is not None
+  assert get_sorted_boundaries(result) == [0, 1, 2.5, 4]
+  assert timepoint_is_boundary(2.5, result)
+  assert not timepoint_is_boundary(2, result)
+  assert BoundaryError.validate(OrderedSet([1, 2.5]), [result]) is None
+  assert get_tier_readable(result) == "Tier [0, 4]: \"A\" (# intervals: 3)"
+
+  assert [interval.mark for interval in iter_intervals(result, 1)] == ["b", "c"]
+  assert result.is_shared
+
+
+def test_change_through_indexing__is_kept():
+  tier = get_tier()
+  result = copy_tier(tier, False)
+
+  result[0].mark = "x"
+  result[-1].maxTime = 5
+
+  assert not result.is_shared
+  assert get_content(result) == [(0, 1, "x"), (1, 2.5, "b"), (2.5, 5, "c")]
+  assert get_content(tier) == [(0, 1, "a"), (1, 2.5, "b"), (2.5, 4, "c")]
+
+
+def test_change_through_iteration__is_kept():
+  tier = get_tier()
+  result = copy_tier(tier, True)
+
+  for interval in result:
+    interval.mark = "x"
+
+  assert [interval.mark for interval in result] == ["x", "x", "x"]
+  assert [interval.mark for interval in tier] == ["a", "b", "c"]
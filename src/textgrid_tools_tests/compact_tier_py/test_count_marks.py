@@ -0,0 +1,32 @@
+from textgrid import Interval, IntervalTier
+
+from textgrid_tools.compact_tier import MarkTable, count_marks, get_compact_tier_from_interval_tier
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 4)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2, "b"))
+  tier.intervals.append(Interval(2, 3, "a"))
+  tier.intervals.append(Interval(3, 4, ""))
+  return tier
+
+
+def test_compact_and_interval_tier__are_counted_equally():
+  mark_table = MarkTable()
+  # "c" is in the table but does not occur
+  mark_table.get_index("c")
+  compact_tier = get_compact_tier_from_interval_tier(get_tier(), mark_table)
+
+  assert count_marks([compact_tier]) == count_marks([get_tier()])
+  assert count_marks([compact_tier, get_tier()]) == {"a": 4, "b": 2, "": 2}
+
+
+def test_intern__returns_same_object():
+  mark_table = MarkTable()
+  mark = "".join(("a", "b"))
+
+  result = mark_table.intern("ab")
+
+  assert mark_table.intern(mark) is result
+  assert len(mark_table) == 1
@@ -0,0 +1,53 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.compact_tier import (MarkTable, get_compact_tier,
+                                         get_compact_tier_from_interval_tier)
+from textgrid_tools.helper import check_is_valid_grid, get_intervals_from_timespan
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 3)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2, "b"))
+  tier.intervals.append(Interval(2, 3, "a"))
+  return tier
+
+
+def test_intervals__are_equal_to_original():
+  tier = get_tier()
+
+  result = get_compact_tier_from_interval_tier(tier)
+
+  assert len(result) == 3
+  assert list(result.intervals) == tier.intervals
+  assert result.intervals[1] == tier.intervals[1]
+  assert result.intervals[-2:] == tier.intervals[-2:]
+  assert result.to_interval_tier().intervals == tier.intervals
+
+
+def test_marks__are_interned_across_tiers():
+  mark_table = MarkTable()
+
+  tier1 = get_compact_tier_from_interval_tier(get_tier(), mark_table)
+  tier2 = get_compact_tier("B", 0, 1, [(0, 1, "b")], mark_table)
+
+  assert mark_table.marks == ["a", "b"]
+  assert tier1.mark_indices.tolist() == [0, 1, 0]
+  assert tier2.mark_indices.tolist() == [1]
+
+
+def test_helper_functions__accept_compact_tier():
+  tier = get_compact_tier_from_interval_tier(get_tier())
+  grid = TextGrid(None, 0, 3)
+  grid.tiers.append(tier)
+
+  assert check_is_valid_grid(grid)
+  assert [i.mark for i in get_intervals_from_timespan(tier, 1, 3)] == ["b", "a"]
+
+
+def test_gap__is_invalid():
+  tier = get_compact_tier("A", 0, 3, [(0, 1, "a"), (1.5, 3, "b")])
+  grid = TextGrid(None, 0, 3)
+  grid.tiers.append(tier)
+
+  assert not check_is_valid_grid(grid)
@@ -0,0 +1,26 @@
+from collections import OrderedDict
+
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.grids.dictionary_exporting import create_dictionaries
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 3)
+  words = IntervalTier("words", 0, 3)
+  words.intervals.extend((Interval(0, 1, "a"), Interval(1, 2, "b"), Interval(2, 3, "a")))
+  phones = IntervalTier("phones", 0, 3)
+  phones.intervals.extend((Interval(0, 0.5, "x"), Interval(0.5, 1, "y"),
+                          Interval(1, 2, "z"), Interval(2, 3, "x")))
+  grid.tiers.extend((words, phones))
+  return grid
+
+
+def test_without_ignored_marks__counts_each_word_once():
+  error, result = create_dictionaries({"s": [get_grid()]}, "words", "phones", "all", set(), None)
+
+  assert error is None
+  assert result == OrderedDict({
+    "a": OrderedDict({("x",): 1, ("x", "y"): 1}),
+    "b": OrderedDict({("z",): 1}),
+  })
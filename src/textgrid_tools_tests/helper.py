@@ -1,6 +1,6 @@
 from typing import List
 
-from textgrid import Interval
+from textgrid import Interval, IntervalTier
 
 from textgrid_tools.comparison import check_interval_is_equal, check_intervals_are_equal
 
@@ -11,3 +11,13 @@ def assert_interval_is_equal(interval1: Interval, interval2: Interval):
 
 def assert_intervals_are_equal(intervals1: List[Interval], intervals2: List[Interval]) -> None:
   assert check_intervals_are_equal(intervals1, intervals2)
+
+
+def get_tier_with_boundaries(name: str, *times: float, mark: str = "") -> IntervalTier:
+  """
+  Returns a tier with consecutive intervals between the times.
+  """
+  tier = IntervalTier(name, times[0], times[-1])
+  for min_time, max_time in zip(times[:-1], times[1:]):
+    tier.intervals.append(Interval(min_time, max_time, mark))
+  return tier
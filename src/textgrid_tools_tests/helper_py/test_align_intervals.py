@@ -0,0 +1,55 @@
+from random import Random
+
+import pytest
+from textgrid import IntervalTier
+
+from textgrid_tools.helper import (align_intervals, align_intervals_on_tier,
+                                   get_intervals_from_timespan)
+from textgrid_tools_tests.helper import get_tier_with_boundaries
+
+
+def get_random_tier(name: str, seed: int) -> IntervalTier:
+  rng = Random(seed)
+  times = sorted(rng.sample(range(1, 1000), 100))
+  return get_tier_with_boundaries(name, 0, *times, 1000)
+
+
+def test_returns_same_intervals_as_get_intervals_from_timespan():
+  reference, *tiers = (get_random_tier(name, seed) for seed, name in enumerate("ABC"))
+  # every second interval
+  intervals = reference.intervals[::2]
+
+  result = list(align_intervals(intervals, tiers))
+
+  assert [interval for interval, _ in result] == intervals
+  for interval, aligned in result:
+    for tier, tier_intervals in zip(tiers, aligned):
+      expected = list(get_intervals_from_timespan(tier, interval.minTime, interval.maxTime))
+      assert tier_intervals == expected
+
+
+def test_words_and_phones__are_aligned():
+  words = get_tier_with_boundaries("words", 0, 1, 3)
+  phones = get_tier_with_boundaries("phones", 0, 0.5, 1, 2, 2.5, 3)
+
+  result = list(align_intervals(words.intervals, [phones]))
+
+  assert result[0][1] == [phones.intervals[:2]]
+  assert result[1][1] == [phones.intervals[2:]]
+
+
+def test_align_intervals_on_tier__returns_interval_with_same_boundaries():
+  tier1 = get_tier_with_boundaries("A", 0, 1, 3)
+  tier2 = get_tier_with_boundaries("B", 0, 1, 3)
+
+  result = list(align_intervals_on_tier(tier1.intervals, tier2))
+
+  assert result == list(zip(tier1.intervals, tier2.intervals))
+
+
+def test_align_intervals_on_tier_without_same_boundaries__raises_assertion():
+  tier1 = get_tier_with_boundaries("A", 0, 1, 3)
+  tier2 = get_tier_with_boundaries("B", 0, 2, 3)
+
+  with pytest.raises(AssertionError):
+    list(align_intervals_on_tier(tier1.intervals, tier2))
@@ -0,0 +1,37 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.helper import TIER_VALIDITY_ATTRIBUTE, check_is_valid_grid
+from textgrid_tools.intervals.common import replace_intervals
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 2)
+  tier = IntervalTier("A", 0, 2)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2, "b"))
+  grid.tiers.append(tier)
+  return grid
+
+
+def test_valid_grid__validity_is_stored_on_tiers():
+  grid = get_grid()
+
+  assert check_is_valid_grid(grid)
+  assert getattr(grid.tiers[0], TIER_VALIDITY_ATTRIBUTE) is True
+
+
+def test_stored_validity__is_used():
+  grid = get_grid()
+  setattr(grid.tiers[0], TIER_VALIDITY_ATTRIBUTE, False)
+
+  assert not check_is_valid_grid(grid)
+
+
+def test_replace_intervals__invalidates_validity():
+  grid = get_grid()
+  assert check_is_valid_grid(grid)
+  tier = grid.tiers[0]
+
+  replace_intervals(tier, [tier.intervals[1]], [Interval(1, 1.5, "b"), Interval(1.6, 2, "c")])
+
+  assert not check_is_valid_grid(grid)
@@ -0,0 +1,66 @@
+from logging import getLogger
+
+from textgrid import Interval, IntervalTier
+
+from textgrid_tools.helper import (get_boundary_index, get_interval_from_maxTime,
+                                   get_interval_from_minTime, get_intervals_from_timespan,
+                                   timepoint_is_boundary)
+from textgrid_tools.intervals.boundary_fixing import fix_timepoint, get_interval_from_time
+from textgrid_tools.intervals.common import replace_intervals
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 4)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2, "b"))
+  tier.intervals.append(Interval(2.5, 4, "c"))
+  return tier
+
+
+def test_lookups__return_same_intervals_as_scan():
+  tier = get_tier()
+  a, b, c = tier.intervals
+
+  assert get_interval_from_minTime(tier, 1) is b
+  assert get_interval_from_minTime(tier, 2) is None
+  assert get_interval_from_maxTime(tier, 2) is b
+  assert get_interval_from_maxTime(tier, 2.5) is None
+  assert get_interval_from_time(tier, 0.5) is a
+  assert get_interval_from_time(tier, 1) is b
+  assert get_interval_from_time(tier, 3.9) is c
+  assert list(get_intervals_from_timespan(tier, 0, 2)) == [a, b]
+  assert list(get_intervals_from_timespan(tier, 0.5, 4)) == [b, c]
+  assert list(get_intervals_from_timespan(tier, 1.5, 2.5)) == []
+  assert timepoint_is_boundary(4, tier)
+  assert not timepoint_is_boundary(2.2, tier)
+
+
+def test_replace_intervals__invalidates_index():
+  tier = get_tier()
+  assert get_boundary_index(tier) is not None
+
+  replace_intervals(tier, tier.intervals[:2], [Interval(0, 1.5, "a"), Interval(1.5, 2, "b")])
+
+  assert get_interval_from_minTime(tier, 1.5) is tier.intervals[1]
+  assert get_interval_from_minTime(tier, 1) is None
+
+
+def test_overlapping_intervals__are_not_indexed():
+  tier = IntervalTier("A", 0, 3)
+  tier.intervals.append(Interval(0, 2, "a"))
+  tier.intervals.append(Interval(1, 3, "b"))
+
+  assert get_boundary_index(tier) is None
+  assert get_interval_from_time(tier, 1.5) is tier.intervals[0]
+
+
+def test_fix_timepoint__updates_index():
+  tier = get_tier()
+  tier.intervals[2].minTime = 2
+  assert get_boundary_index(tier) is not None
+
+  fix_timepoint(1.1, tier, 0.5, getLogger(__name__))
+
+  index = get_boundary_index(tier)
+  assert index.starts == [0, 1.1, 2]
+  assert index.ends == [1.1, 2, 4]
@@ -0,0 +1,63 @@
+from logging import getLogger
+
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.helper import clear_tier_changes, get_changed_tiers, is_tier_changed
+from textgrid_tools.intervals.boundary_fixing import fix_timepoint
+from textgrid_tools.intervals.splitting import split_intervals
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 2)
+  tier = IntervalTier("A", 0, 2)
+  tier.intervals.append(Interval(0, 1, "a b"))
+  tier.intervals.append(Interval(1, 2, "c"))
+  grid.tiers.append(tier)
+  tier = IntervalTier("B", 0, 2)
+  tier.intervals.append(Interval(0, 1.5, "a"))
+  tier.intervals.append(Interval(1.5, 2, "c"))
+  grid.tiers.append(tier)
+  return grid
+
+
+def test_new_grid__has_no_changed_tiers():
+  grid = get_grid()
+
+  assert get_changed_tiers(grid) == []
+
+
+def test_split_intervals__records_only_changed_tiers():
+  grid = get_grid()
+
+  _, changed_anything = split_intervals(grid, {"A", "B"}, " ", False, None)
+
+  assert changed_anything
+  assert get_changed_tiers(grid) == [grid.tiers[0]]
+
+
+def test_split_intervals_without_changes__records_nothing():
+  grid = get_grid()
+
+  _, changed_anything = split_intervals(grid, {"B"}, " ", False, None)
+
+  assert not changed_anything
+  assert get_changed_tiers(grid) == []
+
+
+def test_fix_timepoint__records_change():
+  grid = get_grid()
+  tier = grid.tiers[1]
+
+  success, changed_anything = fix_timepoint(1, tier, 1, getLogger())
+
+  assert success and changed_anything
+  assert is_tier_changed(tier)
+
+
+def test_clear_tier_changes__resets_all_tiers():
+  grid = get_grid()
+  split_intervals(grid, {"A"}, " ", False, None)
+
+  clear_tier_changes(grid)
+
+  assert get_changed_tiers(grid) == []
@@ -0,0 +1,83 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.helper import get_all_tiers, get_count_of_tiers, get_tier_index, tier_exists
+from textgrid_tools.tier.moving import move_tier
+from textgrid_tools.tier.renaming import rename_tier
+from textgrid_tools.tiers.removing import remove_tiers
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 1)
+  for nr, name in enumerate(("A", "B", "A", "C")):
+    tier = IntervalTier(name, 0, 1)
+    # tiers with the same intervals are considered equal
+    boundary = (nr + 1) / 10
+    tier.intervals.append(Interval(0, boundary, ""))
+    tier.intervals.append(Interval(boundary, 1, ""))
+    grid.append(tier)
+  return grid
+
+
+def test_get_all_tiers__keeps_order_of_grid():
+  grid = get_grid()
+
+  result = list(get_all_tiers(grid, {"C", "A"}))
+
+  assert result == [grid.tiers[0], grid.tiers[2], grid.tiers[3]]
+
+
+def test_index_is_reused():
+  grid = get_grid()
+
+  index = get_tier_index(grid)
+
+  assert get_tier_index(grid) is index
+
+
+def test_appended_tier__is_found():
+  grid = get_grid()
+  assert not tier_exists(grid, "D")
+
+  grid.append(IntervalTier("D", 0, 1))
+
+  assert tier_exists(grid, "D")
+
+
+def test_replaced_tiers__are_found():
+  grid = get_grid()
+  assert get_count_of_tiers(grid, "A") == 2
+
+  grid.tiers = [IntervalTier("D", 0, 1)]
+
+  assert get_count_of_tiers(grid, "A") == 0
+  assert tier_exists(grid, "D")
+
+
+def test_renamed_tier__is_found():
+  grid = get_grid()
+  assert not tier_exists(grid, "D")
+
+  rename_tier(grid, "B", "D", None)
+
+  assert not tier_exists(grid, "B")
+  assert tier_exists(grid, "D")
+
+
+def test_moved_tier__is_found_at_new_position():
+  grid = get_grid()
+  tier_c = grid.tiers[3]
+  assert list(get_all_tiers(grid, {"A", "C"}))[-1] is tier_c
+
+  move_tier(grid, "C", 1, None)
+
+  assert list(get_all_tiers(grid, {"A", "C"}))[0] is tier_c
+
+
+def test_removed_tiers__are_not_found():
+  grid = get_grid()
+  assert tier_exists(grid, "A")
+
+  remove_tiers(grid, {"A"}, None)
+
+  assert not tier_exists(grid, "A")
+  assert get_count_of_tiers(grid, "B") == 1
@@ -0,0 +1,21 @@
+from textgrid import Interval
+
+from textgrid_tools.helper import ignore_intervals_by_mark
+
+
+def test_no_marks__yields_each_interval_once():
+  intervals = [Interval(0, 1, "a"), Interval(1, 2, "b")]
+
+  result = list(ignore_intervals_by_mark(intervals, set()))
+
+  assert result == intervals
+  assert result[0] is intervals[0]
+  assert result[1] is intervals[1]
+
+
+def test_marks__are_ignored():
+  intervals = [Interval(0, 1, "a"), Interval(1, 2, ""), Interval(2, 3, "b")]
+
+  result = list(ignore_intervals_by_mark(intervals, {""}))
+
+  assert [interval.mark for interval in result] == ["a", "b"]
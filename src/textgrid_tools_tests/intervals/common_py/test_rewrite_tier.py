@@ -0,0 +1,57 @@
+import pytest
+from textgrid.textgrid import Interval, IntervalTier
+
+from textgrid_tools.helper import get_boundary_index, get_interval_from_minTime
+from textgrid_tools.intervals.common import rewrite_tier
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 5)
+  tier.intervals.append(Interval(0, 1, "a"))
+  tier.intervals.append(Interval(1, 2, "b"))
+  tier.intervals.append(Interval(2, 3, "c"))
+  tier.intervals.append(Interval(3, 4, "d"))
+  tier.intervals.append(Interval(4, 5, "e"))
+  return tier
+
+
+def test_multiple_replacements__are_applied_in_one_pass():
+  tier = get_tier()
+  a, b, c, d, e = tier.intervals
+  ab = Interval(0, 2, "ab")
+  d1 = Interval(3, 3.5, "d1")
+  d2 = Interval(3.5, 4, "d2")
+
+  # the order of the replacements is irrelevant
+  rewrite_tier(tier, [([d], [d1, d2]), ([a, b], [ab])])
+
+  assert tier.intervals == [ab, c, d1, d2, e]
+  assert tier.intervals[1] is c
+  assert tier.intervals[4] is e
+
+
+def test_no_replacements__tier_is_unchanged():
+  tier = get_tier()
+  intervals = list(tier.intervals)
+
+  rewrite_tier(tier, [])
+
+  assert all(x is y for x, y in zip(tier.intervals, intervals))
+
+
+def test_invalidates_index():
+  tier = get_tier()
+  a, b, _, _, _ = tier.intervals
+  assert get_boundary_index(tier) is not None
+
+  rewrite_tier(tier, [([a, b], [Interval(0, 1.5, "a"), Interval(1.5, 2, "b")])])
+
+  assert get_interval_from_minTime(tier, 1.5) is tier.intervals[1]
+  assert get_interval_from_minTime(tier, 1) is None
+
+
+def test_intervals_not_in_tier__raises_assertion():
+  tier = get_tier()
+
+  with pytest.raises(AssertionError):
+    rewrite_tier(tier, [([Interval(0, 1, "a")], [Interval(0, 1, "x")])])
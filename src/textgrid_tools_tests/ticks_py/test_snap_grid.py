@@ -0,0 +1,80 @@
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.cloning import copy_tier
+from textgrid_tools.compact_tier import get_compact_tier_from_interval_tier
+from textgrid_tools.helper import check_is_valid_grid, is_tier_valid
+from textgrid_tools.ticks import get_boundary_ticks, snap_grid
+
+
+def get_tier() -> IntervalTier:
+  tier = IntervalTier("A", 0, 0.6)
+  # 0.1 + 0.2 != 0.3
+  tier.intervals.append(Interval(0, 0.1 + 0.2, "a"))
+  tier.intervals.append(Interval(0.3, 0.6, "b"))
+  return tier
+
+
+def get_grid() -> TextGrid:
+  grid = TextGrid(None, 0, 0.6)
+  grid.tiers.append(get_tier())
+  return grid
+
+
+def test_imprecise_boundaries__are_exact_afterwards():
+  grid = get_grid()
+  assert not check_is_valid_grid(grid)
+
+  snap_grid(grid, 100)
+
+  tier = grid.tiers[0]
+  assert tier.intervals[0].maxTime == tier.intervals[1].minTime == 0.3
+  assert check_is_valid_grid(grid)
+  assert is_tier_valid(tier)
+
+
+def test_times__are_rounded_to_ticks():
+  grid = get_grid()
+  grid.tiers[0].intervals[0].maxTime = 0.3004
+
+  snap_grid(grid, 1000)
+
+  assert grid.tiers[0].intervals[0].maxTime == 0.3
+
+
+def test_interval_shorter_than_a_tick__is_invalid():
+  grid = get_grid()
+  tier = grid.tiers[0]
+  tier.intervals[0].maxTime = 0.001
+  tier.intervals[1].minTime = 0.001
+
+  snap_grid(grid, 100)
+
+  assert not check_is_valid_grid(grid)
+
+
+def test_compact_tier__arrays_are_snapped():
+  grid = get_grid()
+  grid.tiers[0] = get_compact_tier_from_interval_tier(grid.tiers[0])
+
+  snap_grid(grid, 100)
+
+  assert grid.tiers[0].ends.tolist() == [0.3, 0.6]
+  assert check_is_valid_grid(grid)
+
+
+def test_snapped_copy_on_write_tier__stays_shared():
+  grid = get_grid()
+  snap_grid(grid, 100)
+  grid.tiers[0] = copy_tier(grid.tiers[0], False)
+
+  snap_grid(grid, 100)
+
+  assert grid.tiers[0].is_shared
+
+
+def test_get_boundary_ticks__returns_integers():
+  starts, ends = get_boundary_ticks(get_tier(), 16000)
+
+  assert starts.dtype.kind == ends.dtype.kind == "i"
+  assert starts.tolist() == [0, 4800]
+  assert ends.tolist() == [4800, 9600]
@@ -0,0 +1,34 @@
+from collections import OrderedDict
+
+from textgrid import Interval, IntervalTier, TextGrid
+
+from textgrid_tools.tiers.transcription import transcribe_text
+
+
+def get_grid(*marks: str) -> TextGrid:
+  grid = TextGrid(None, 0, len(marks))
+  tier = IntervalTier("A", 0, len(marks))
+  for nr, mark in enumerate(marks):
+    tier.intervals.append(Interval(nr, nr + 1, mark))
+  grid.tiers.append(tier)
+  return grid
+
+
+def test_nothing_transcribed__returns_no_change():
+  grid = get_grid("", "a")
+  dictionary = OrderedDict({"a": OrderedDict({("a",): 1})})
+
+  result = transcribe_text(grid, {"A"}, dictionary, None, False, None, None)
+
+  assert result == (None, False)
+  assert [interval.mark for interval in grid.tiers[0]] == ["", "a"]
+
+
+def test_transcribed__returns_change():
+  grid = get_grid("", "ab")
+  dictionary = OrderedDict({"ab": OrderedDict({("a", "b"): 1})})
+
+  result = transcribe_text(grid, {"A"}, dictionary, None, False, None, None)
+
+  assert result == (None, True)
+  assert [interval.mark for interval in grid.tiers[0]] == ["", "a", "b"]
@@ -0,0 +1,78 @@
+from ordered_set import OrderedSet
+
+from textgrid_tools.helper import timepoint_is_boundary
+from textgrid_tools.validation import BoundaryError
+from textgrid_tools_tests.helper import get_tier_with_boundaries
+
+
+def test_all_boundaries_exist__returns_none():
+  tiers = [
+    get_tier_with_boundaries("A", 0, 1, 2, 3),
+    get_tier_with_boundaries("B", 0, 0.5, 1, 2, 2.5, 3),
+  ]
+
+  result = BoundaryError.validate(OrderedSet((0, 1, 2, 3)), tiers)
+
+  assert result is None
+
+
+def test_missing_boundaries__are_listed_in_order_of_timepoints():
+  tiers = [get_tier_with_boundaries("A", 0, 1, 2.5, 3), get_tier_with_boundaries("B", 0, 2, 3)]
+
+  result = BoundaryError.validate(OrderedSet((3, 2, 1, 0)), tiers)
+
+  assert result is not None
+  assert list(result.non_existent_boundaries.keys()) == [2, 1]
+  assert list(result.non_existent_boundaries[2]) == ["A"]
+  assert list(result.non_existent_boundaries[1]) == ["B"]
+  assert result.closest_boundaries[(2, 0)] == 2.5
+  assert "- 2 does not exist on A (closest boundary: 2.5)" in result.default_message
+
+
+def test_epsilon__accepts_close_boundaries():
+  tiers = [get_tier_with_boundaries("A", 0, 1.0000001, 2)]
+
+  assert BoundaryError.validate(OrderedSet((0, 1, 2)), tiers) is not None
+  assert BoundaryError.validate(OrderedSet((0, 1, 2)), tiers, epsilon=1e-6) is None
+
+
+def test_tiers_with_same_name__closest_boundaries_are_kept_per_tier():
+  tiers = [get_tier_with_boundaries("A", 0, 1.5, 3), get_tier_with_boundaries("A", 0, 2.5, 3)]
+
+  result = BoundaryError.validate(OrderedSet((0, 2, 3)), tiers)
+
+  assert result.closest_boundaries == {(2, 0): 1.5, (2, 1): 2.5}
+  assert "- 2 does not exist on A (closest boundary: 1.5), A (closest boundary: 2.5)" in result.default_message
+
+
+def test_epsilon__boundary_can_only_belong_to_one_timepoint():
+  tiers = [get_tier_with_boundaries("A", 0, 1, 2)]
+
+  result = BoundaryError.validate(OrderedSet((0, 0.9, 1.1, 2)), tiers, epsilon=0.2)
+
+  assert result is not None
+  assert list(result.non_existent_boundaries.keys()) == [1.1]
+
+
+def test_same_result_as_timepoint_is_boundary():
+  tiers = [
+    get_tier_with_boundaries("A", 0, 0.3, 1.2, 2, 4),
+    get_tier_with_boundaries("B", 0, 1, 2, 3, 4),
+  ]
+  # tier with a gap
+  tiers[1].intervals.pop(1)
+  timepoints = OrderedSet((4, 0.3, 0, 2.5, 1, 1.2, 3, 2, 5))
+
+  result = BoundaryError.validate(timepoints, tiers)
+
+  expected = {
+    (timepoint, tier.name)
+    for timepoint in timepoints
+    for tier in tiers
+    if not timepoint_is_boundary(timepoint, tier)
+  }
+  assert {
+    (timepoint, tier_name)
+    for timepoint, tier_names in result.non_existent_boundaries.items()
+    for tier_name in tier_names
+  } == expected
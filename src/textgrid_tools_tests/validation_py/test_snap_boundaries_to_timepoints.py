@@ -0,0 +1,61 @@
+from ordered_set import OrderedSet
+from textgrid import IntervalTier, TextGrid
+
+from textgrid_tools.compact_tier import get_compact_tier_from_interval_tier
+from textgrid_tools.helper import check_is_valid_grid, is_tier_changed, timepoint_is_boundary
+from textgrid_tools.intervals.boundary_joining import join_intervals_on_boundaries
+from textgrid_tools.validation import snap_boundaries_to_timepoints
+from textgrid_tools_tests.helper import get_tier_with_boundaries
+
+
+def get_times(tier: IntervalTier):
+  return [(interval.minTime, interval.maxTime) for interval in tier]
+
+
+def test_close_boundaries__are_moved_onto_timepoints():
+  tier = get_tier_with_boundaries("A", 0, 0.5, 1.0000001, 2.0000001)
+
+  result = snap_boundaries_to_timepoints(OrderedSet((0, 1, 2)), [tier], 1e-6)
+
+  assert result
+  assert get_times(tier) == [(0, 0.5), (0.5, 1), (1, 2)]
+  assert tier.maxTime == 2
+  assert is_tier_changed(tier)
+
+
+def test_epsilon_zero__changes_nothing():
+  tier = get_tier_with_boundaries("A", 0, 1.0000001, 2)
+
+  result = snap_boundaries_to_timepoints(OrderedSet((0, 1, 2)), [tier], 0)
+
+  assert not result
+  assert get_times(tier) == [(0, 1.0000001), (1.0000001, 2)]
+  assert not is_tier_changed(tier)
+
+
+def test_compact_tier__is_moved():
+  tier = get_compact_tier_from_interval_tier(get_tier_with_boundaries("A", 0, 1.0000001, 2))
+
+  result = snap_boundaries_to_timepoints(OrderedSet((0, 1, 2)), [tier], 1e-6)
+
+  assert result
+  assert get_times(tier) == [(0, 1), (1, 2)]
+  assert timepoint_is_boundary(1, tier)
+
+
+def test_join_intervals_on_boundaries__with_epsilon_joins_close_boundaries():
+  grid = TextGrid(None, 0, 2)
+  grid.tiers.append(get_tier_with_boundaries("W", 0, 1, 2))
+  grid.tiers.append(get_tier_with_boundaries("P", 0, 0.5, 0.9999999, 2, mark="P"))
+
+  error, _ = join_intervals_on_boundaries(grid, "W", {"P"}, " ", False, None)
+  assert error is not None
+
+  error, changed_anything = join_intervals_on_boundaries(
+    grid, "W", {"P"}, " ", False, None, boundary_epsilon=1e-6)
+
+  assert error is None
+  assert changed_anything
+  assert get_times(grid.tiers[1]) == [(0, 1), (1, 2)]
+  assert [interval.mark for interval in grid.tiers[1]] == ["P P", "P"]
+  assert check_is_valid_grid(grid)